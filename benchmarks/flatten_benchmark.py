@@ -0,0 +1,83 @@
+"""
+Benchmark of metric dictionary flattening in batch scans.
+
+Compares the previous recursive flattener with ``qward.utils.flatten.flatten_dict``, which
+walks dictionaries iteratively and reuses cached column names for repeated shapes. Both are
+timed on the path batch scans take: the metric dictionaries of many distinct circuits,
+prefixed with the metric name as in ``qward.batch.metric_columns``, and a whole
+``scan_circuits`` run (without dedup) with each flattener.
+
+Usage:
+    python benchmarks/flatten_benchmark.py [num_circuits]
+"""
+
+import sys
+import timeit
+from typing import Any, Dict
+from unittest import mock
+
+from qiskit.circuit.random import random_circuit
+
+from qward.batch import DEFAULT_BATCH_METRICS, scan_circuits
+from qward.utils.flatten import flatten_dict
+
+
+def recursive_flatten_dict(
+    d: Dict[str, Any], parent_key: str = "", sep: str = "."
+) -> Dict[str, Any]:
+    """Recursive flattener used before the iterative implementation."""
+    items = {}
+    for k, v in d.items():
+        new_key = f"{parent_key}{sep}{k}" if parent_key else k
+        if isinstance(v, dict):
+            items.update(recursive_flatten_dict(v, new_key, sep=sep))
+        else:
+            items[new_key] = v
+    return items
+
+
+def main(num_circuits: int = 500) -> None:
+    """
+    Flatten the metrics of a batch of distinct circuits with both implementations.
+
+    Args:
+        num_circuits: Number of circuits in the batch
+    """
+    circuits = [random_circuit(5, 6, measure=True, seed=seed) for seed in range(num_circuits)]
+    results = [
+        (metric.name, metric.get_metrics())
+        for circuit in circuits
+        for metric in (metric_class(circuit) for metric_class in DEFAULT_BATCH_METRICS)
+    ]
+
+    assert [flatten_dict(d, name) for name, d in results] == [
+        recursive_flatten_dict(d, name) for name, d in results
+    ]
+
+    recursive = min(
+        timeit.repeat(
+            lambda: [recursive_flatten_dict(d, name) for name, d in results], number=1, repeat=5
+        )
+    )
+    iterative = min(
+        timeit.repeat(lambda: [flatten_dict(d, name) for name, d in results], number=1, repeat=5)
+    )
+    with mock.patch("qward.batch.flatten_dict", recursive_flatten_dict):
+        scan_recursive = min(
+            timeit.repeat(lambda: scan_circuits(circuits, dedup=False), number=1, repeat=3)
+        )
+    scan_iterative = min(
+        timeit.repeat(lambda: scan_circuits(circuits, dedup=False), number=1, repeat=3)
+    )
+
+    print(f"Flattening the metrics of {num_circuits} circuits ({len(results)} dictionaries)")
+    print(f"  recursive: {recursive * 1e3:8.1f} ms ({len(results) / recursive:10.0f} dicts/s)")
+    print(f"  iterative: {iterative * 1e3:8.1f} ms ({len(results) / iterative:10.0f} dicts/s)")
+    print(f"  speedup:   {recursive / iterative:8.2f}x")
+    print(f"scan_circuits of {num_circuits} circuits")
+    print(f"  recursive: {scan_recursive * 1e3:8.1f} ms")
+    print(f"  iterative: {scan_iterative * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
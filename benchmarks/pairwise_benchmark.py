@@ -0,0 +1,67 @@
+"""
+Benchmark of pairwise distribution distances across many runs.
+
+Compares the per-pair Python loop over counts dictionaries with
+``qward.metrics.pairwise_distances``, which aligns all counts into one sparse matrix and
+computes every pair with blocked NumPy/SciPy operations.
+
+Usage:
+    python benchmarks/pairwise_benchmark.py [num_runs]
+"""
+
+import sys
+import time
+from typing import Dict
+
+import numpy as np
+
+from qward.metrics import pairwise_distances
+
+
+def loop_tvd(a: Dict[str, int], b: Dict[str, int]) -> float:
+    """Total variation distance between two counts dictionaries, computed by hand."""
+    total_a = sum(a.values())
+    total_b = sum(b.values())
+    return 0.5 * sum(abs(a.get(k, 0) / total_a - b.get(k, 0) / total_b) for k in set(a) | set(b))
+
+
+def main(num_runs: int = 1000, num_qubits: int = 12, num_outcomes: int = 500) -> None:
+    """
+    Compute the TVD matrix of random counts with both implementations.
+
+    Args:
+        num_runs: Number of runs to compare
+        num_qubits: Width of the bitstrings
+        num_outcomes: Distinct outcomes observed per run
+    """
+    rng = np.random.default_rng(0)
+    runs = [
+        {
+            format(int(key), f"0{num_qubits}b"): int(count)
+            for key, count in zip(
+                rng.choice(2**num_qubits, num_outcomes, replace=False),
+                rng.integers(1, 100, num_outcomes),
+            )
+        }
+        for _ in range(num_runs)
+    ]
+
+    start = time.perf_counter()
+    matrix = pairwise_distances(runs, "tvd")
+    vectorized = time.perf_counter() - start
+
+    # Time the loop on a sample of pairs and extrapolate to all pairs
+    pairs = [tuple(rng.choice(num_runs, 2, replace=False)) for _ in range(200)]
+    start = time.perf_counter()
+    for i, j in pairs:
+        assert abs(loop_tvd(runs[i], runs[j]) - matrix[i, j]) < 1e-9
+    loop = (time.perf_counter() - start) / len(pairs) * num_runs * (num_runs - 1) / 2
+
+    print(f"TVD matrix of {num_runs} runs with {num_outcomes} outcomes each")
+    print(f"  loop (extrapolated): {loop:8.2f} s")
+    print(f"  pairwise_distances:  {vectorized:8.2f} s")
+    print(f"  speedup:             {loop / vectorized:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
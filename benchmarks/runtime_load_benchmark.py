@@ -0,0 +1,75 @@
+"""
+Offline load test of the QWARD runtime submission and polling pipeline.
+
+Submits many jobs through :class:`qward.runtime.LocalRuntimeService` (no credentials or
+network needed), polls their status until all reach a final state and reports submission,
+polling and result throughput.
+
+Usage:
+    python benchmarks/runtime_load_benchmark.py [num_jobs] [failure_rate]
+"""
+
+import sys
+import time
+
+from qward.examples.utils import create_example_circuit
+from qward.runtime import LocalRuntimeService, LocalSampler
+
+
+def main(num_jobs: int = 2000, failure_rate: float = 0.05) -> None:
+    """
+    Submit, poll and collect ``num_jobs`` local runtime jobs.
+
+    Args:
+        num_jobs: Number of jobs to submit
+        failure_rate: Probability that a job fails
+    """
+    circuit = create_example_circuit()
+    sampler = LocalSampler(
+        queue_latency=(0.0, 0.5),
+        execution_latency=(0.0, 0.2),
+        failure_rate=failure_rate,
+        default_shots=256,
+        seed=1234,
+    )
+
+    start = time.perf_counter()
+    services = []
+    for _ in range(num_jobs):
+        service = LocalRuntimeService(circuit, sampler=sampler)
+        service.run()
+        services.append(service)
+    submitted = time.perf_counter()
+
+    polls = 0
+    pending = services
+    while pending:
+        still_pending = []
+        for service in pending:
+            polls += 1
+            if service.check_status() not in ("DONE", "ERROR", "CANCELLED"):
+                still_pending.append(service)
+        pending = still_pending
+        if pending:
+            time.sleep(0.01)
+    finished = time.perf_counter()
+
+    failures = 0
+    for service in services:
+        if service.check_status() == "DONE":
+            service.get_results()
+        else:
+            failures += 1
+    collected = time.perf_counter()
+
+    print(f"Jobs: {num_jobs} ({failures} failed)")
+    print(f"  submission: {num_jobs / (submitted - start):10.0f} jobs/s")
+    print(f"  polling:    {polls / (finished - submitted):10.0f} polls/s ({polls} polls)")
+    print(f"  results:    {(num_jobs - failures) / (collected - finished):10.0f} results/s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.05,
+    )
@@ -14,6 +14,11 @@ from qward.metrics import (
     QiskitMetrics,
     ComplexityMetrics,
     SuccessRate,
+    DistributionDistance,
+    PredictedSuccessRate,
+    ShotDrift,
+    CriticalPath,
+    LayerProfile,
 )
 
 from qward.version import __version__
@@ -28,4 +33,9 @@ __all__ = [
     "QiskitMetrics",
     "ComplexityMetrics",
     "SuccessRate",
+    "DistributionDistance",
+    "PredictedSuccessRate",
+    "ShotDrift",
+    "CriticalPath",
+    "LayerProfile",
 ]
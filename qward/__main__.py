@@ -0,0 +1,9 @@
+"""
+Run the QWARD command-line interface with ``python -m qward``.
+"""
+
+import sys
+
+from qward.cli import main
+
+sys.exit(main())
@@ -0,0 +1,212 @@
+"""
+Batch scanning of many circuits for QWARD.
+
+Pre-runtime metrics of a batch are assembled into a single DataFrame with one row per
+circuit. Structurally identical circuits (see
+:func:`~qward.utils.fingerprint.circuit_fingerprint`) are analyzed once and their results
+are expanded back to every member of the group.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+import pandas as pd
+from qiskit import QuantumCircuit
+
+from qward.metrics.base_metric import Metric
+from qward.metrics.complexity_metrics import ComplexityMetrics
+from qward.metrics.qiskit_metrics import QiskitMetrics
+from qward.store import MetricsStore
+from qward.utils.fingerprint import circuit_fingerprint
+from qward.utils.flatten import flatten_dict
+from qward.utils.portable import portable_values
+
+DEFAULT_BATCH_METRICS = (QiskitMetrics, ComplexityMetrics)
+
+# Default number of rows kept to serve repeated circuits of a streamed scan
+DEFAULT_CACHE_SIZE = 1024
+
+
+def metric_columns(circuit: QuantumCircuit, metrics: Sequence[Type[Metric]]) -> Dict[str, Any]:
+    """
+    Compute metrics of a circuit as one flat row.
+
+    Args:
+        circuit: The circuit to analyze
+        metrics: Pre-runtime metric classes
+
+    Returns:
+        Dict[str, Any]: Metric values keyed by ``<metric name>.<column>``
+    """
+    row: Dict[str, Any] = {}
+    for metric_class in metrics:
+        row.update(_metric_values(metric_class(circuit)))
+    return row
+
+
+def _metric_values(metric: Metric) -> Dict[str, Any]:
+    """Compute the flat values of a metric, keyed by ``<metric name>.<column>``."""
+    return flatten_dict(metric.get_metrics(), metric.name)
+
+
+def scan_circuits(
+    circuits: Iterable[QuantumCircuit],
+    metrics: Sequence[Type[Metric]] = DEFAULT_BATCH_METRICS,
+    names: Optional[Sequence[str]] = None,
+    dedup: bool = True,
+    store: Optional[MetricsStore] = None,
+    backend: str = "",
+) -> pd.DataFrame:
+    """
+    Compute pre-runtime metrics for a batch of circuits.
+
+    With a store, metric values are read from it and only the entries that are missing or
+    stale (written by another qward version) are computed and written back, so rescanning a
+    corpus only pays for the circuits that changed. Values are then converted to plain data
+    (see :func:`~qward.utils.portable.portable_value`), whether computed or read back.
+
+    Args:
+        circuits: The circuits to analyze
+        metrics: Pre-runtime metric classes, instantiated with each circuit
+        names: Names of the circuits (defaults to the circuit names)
+        dedup: Compute metrics once per group of structurally identical circuits (always
+            the case with a store)
+        store: Metrics store to read from and write into
+        backend: Backend label of the entries in the store (e.g. the transpilation target)
+
+    Returns:
+        pd.DataFrame: One row per circuit with the columns ``circuit`` and ``fingerprint``
+        followed by the metric columns. ``DataFrame.attrs`` reports ``num_circuits``,
+        ``num_unique`` (distinct circuits analyzed), ``num_computed`` (circuits for which
+        some metric was computed rather than read from the store) and ``dedup_ratio``
+        (fraction of circuits whose metrics were reused from an identical circuit)
+    """
+    circuits = list(circuits)
+    names = list(names) if names is not None else [circuit.name for circuit in circuits]
+    if len(names) != len(circuits):
+        raise ValueError("The number of names does not match the number of circuits")
+
+    fingerprints = [circuit_fingerprint(circuit) for circuit in circuits]
+    if dedup or store is not None:
+        # Position of each distinct fingerprint's representative in the computed rows
+        groups: Dict[str, int] = {}
+        representatives: List[int] = []
+        members = []
+        for position, fingerprint in enumerate(fingerprints):
+            if fingerprint not in groups:
+                groups[fingerprint] = len(representatives)
+                representatives.append(position)
+            members.append(groups[fingerprint])
+    else:
+        representatives = list(range(len(circuits)))
+        members = representatives
+
+    if store is None:
+        rows = [metric_columns(circuits[position], metrics) for position in representatives]
+        computed = len(rows)
+    else:
+        rows, computed = _scan_with_store(
+            [circuits[position] for position in representatives],
+            [fingerprints[position] for position in representatives],
+            metrics,
+            store,
+            backend,
+        )
+        store.add_circuits(names, fingerprints, backend)
+
+    frame = pd.DataFrame(rows).iloc[members].reset_index(drop=True)
+    frame.insert(0, "circuit", names)
+    frame.insert(1, "fingerprint", fingerprints)
+    frame.attrs["num_circuits"] = len(circuits)
+    frame.attrs["num_unique"] = len(rows)
+    frame.attrs["num_computed"] = computed
+    frame.attrs["dedup_ratio"] = 1.0 - len(rows) / len(circuits) if circuits else 0.0
+    return frame
+
+
+def iter_scan_circuits(
+    circuits: Iterable[QuantumCircuit],
+    metrics: Sequence[Type[Metric]] = DEFAULT_BATCH_METRICS,
+    names: Optional[Iterable[str]] = None,
+    dedup: bool = True,
+    cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Compute pre-runtime metrics for a stream of circuits, yielding one row per circuit.
+
+    Circuits are consumed lazily and every row is yielded as soon as it is computed, so
+    results can be streamed to a UI or a file while the batch is still being analyzed.
+    With ``dedup``, the rows of distinct circuits are kept (up to ``cache_size`` of the most
+    recently used ones) to serve repeated circuits; without it, nothing is retained between
+    circuits.
+
+    Args:
+        circuits: The circuits to analyze (any iterable, e.g. a generator)
+        metrics: Pre-runtime metric classes, instantiated with each circuit
+        names: Names of the circuits (defaults to the circuit names)
+        dedup: Reuse the row of a structurally identical circuit seen earlier
+        cache_size: Maximum number of rows kept for dedup (None keeps all distinct rows)
+
+    Yields:
+        Tuple[str, Dict[str, Any]]: The circuit name and its row, with the same columns as
+        the DataFrame of :func:`scan_circuits`
+
+    Raises:
+        ValueError: If there are fewer names than circuits
+    """
+    names = iter(names) if names is not None else None
+    rows: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    for position, circuit in enumerate(circuits):
+        if names is None:
+            name = circuit.name
+        else:
+            name = next(names, None)
+            if name is None:
+                raise ValueError(f"No name was given for circuit {position}")
+        fingerprint = circuit_fingerprint(circuit)
+        values = rows.get(fingerprint) if dedup else None
+        if values is None:
+            values = metric_columns(circuit, metrics)
+            if dedup:
+                rows[fingerprint] = values
+                if cache_size is not None and len(rows) > cache_size:
+                    rows.popitem(last=False)
+        elif cache_size is not None:
+            rows.move_to_end(fingerprint)
+        yield name, {"circuit": name, "fingerprint": fingerprint, **values}
+
+
+def _scan_with_store(
+    circuits: Sequence[QuantumCircuit],
+    fingerprints: Sequence[str],
+    metrics: Sequence[Type[Metric]],
+    store: MetricsStore,
+    backend: str,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Compute the missing or stale metric entries of distinct circuits and read all rows back.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], int]: One row per circuit and the number of circuits for
+        which some metric was computed
+    """
+    rows: List[Dict[str, Any]] = [{} for _ in circuits]
+    computed = set()
+    for metric_class in metrics:
+        metric_id = None
+        stale = None
+        entries = []
+        for position, (circuit, fingerprint) in enumerate(zip(circuits, fingerprints)):
+            metric = metric_class(circuit)
+            if metric_id is None:
+                metric_id = metric.id.value
+                stale = store.missing(fingerprints, metric_id, backend)
+            if fingerprint in stale:
+                values = portable_values(_metric_values(metric))
+                entries.append((fingerprint, metric_id, values))
+                computed.add(position)
+            else:
+                values = store.get(fingerprint, metric_id, backend)
+            rows[position].update(values)
+        store.put_many(entries, backend)
+    return rows, len(computed)
@@ -0,0 +1,601 @@
+"""
+Command-line interface for QWARD.
+
+``qward scan`` computes pre-runtime metrics for a corpus of QPY and OpenQASM files in a
+pool of worker processes and streams one row per circuit to a Parquet, CSV or NDJSON file
+while the scan progresses::
+
+    qward scan corpus/ "extra/**/*.qasm" -o metrics.parquet --workers 8
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Type,
+)
+
+from qiskit import QuantumCircuit, qasm2, qasm3, qpy
+
+from qward.batch import metric_columns
+from qward.metrics.base_metric import Metric
+from qward.metrics.complexity_metrics import ComplexityMetrics
+from qward.metrics.qiskit_metrics import QiskitMetrics
+from qward.utils.fingerprint import circuit_fingerprint
+
+# Metrics that only need the circuit, selectable by name on the command line
+SCAN_METRICS: Dict[str, Type[Metric]] = {
+    "QiskitMetrics": QiskitMetrics,
+    "ComplexityMetrics": ComplexityMetrics,
+}
+
+CIRCUIT_EXTENSIONS = (".qpy", ".qasm")
+
+OUTPUT_FORMATS = ("parquet", "csv", "ndjson")
+
+# Rows of one file: (rows, error message if the file could not be scanned)
+FileResult = Tuple[List[Dict[str, Any]], Optional[str]]
+
+
+def find_circuit_files(paths: Iterable[str]) -> List[str]:
+    """
+    Expand directories and glob patterns into the circuit files they contain.
+
+    Args:
+        paths: Files, directories (searched recursively) or glob patterns
+
+    Returns:
+        List[str]: Sorted paths of the ``.qpy`` and ``.qasm`` files, without duplicates
+    """
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.update(
+                    os.path.join(root, name)
+                    for name in names
+                    if name.lower().endswith(CIRCUIT_EXTENSIONS)
+                )
+        else:
+            files.update(
+                match
+                for match in glob.glob(path, recursive=True)
+                if os.path.isfile(match) and match.lower().endswith(CIRCUIT_EXTENSIONS)
+            )
+    return sorted(files)
+
+
+def load_circuits(path: str) -> List[QuantumCircuit]:
+    """
+    Load the circuits stored in a QPY or OpenQASM 2/3 file.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        List[QuantumCircuit]: The circuits of the file (QPY files may hold several)
+
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    if path.lower().endswith(".qpy"):
+        with open(path, "rb") as file:
+            return list(qpy.load(file))
+    if path.lower().endswith(".qasm"):
+        with open(path, "r", encoding="utf-8") as file:
+            source = file.read()
+        if "OPENQASM 3" in source[:1024]:
+            return [qasm3.loads(source)]
+        return [qasm2.loads(source, custom_instructions=qasm2.LEGACY_CUSTOM_INSTRUCTIONS)]
+    raise ValueError(f"Unsupported circuit file {path!r}")
+
+
+def scan_file(path: str, metrics: Sequence[Type[Metric]]) -> FileResult:
+    """
+    Compute the metrics of every circuit in a file.
+
+    Only scalar metric values are kept, so that rows fit a tabular output. Errors are
+    reported instead of raised, so one malformed file does not abort a corpus scan.
+
+    Args:
+        path: Path of the circuit file
+        metrics: Pre-runtime metric classes
+
+    Returns:
+        FileResult: One row per circuit with the columns ``file``, ``index``, ``circuit`` and
+        ``fingerprint`` followed by the metric columns, and the error message if any
+    """
+    try:
+        rows = []
+        for index, circuit in enumerate(load_circuits(path)):
+            row: Dict[str, Any] = {
+                "file": path,
+                "index": index,
+                "circuit": circuit.name,
+                "fingerprint": circuit_fingerprint(circuit),
+            }
+            values = metric_columns(circuit, metrics)
+            row.update((column, value) for column, value in values.items() if _is_scalar(value))
+            rows.append(row)
+        return rows, None
+    except Exception as error:  # pylint: disable=broad-except
+        return [], f"{type(error).__name__}: {error}"
+
+
+def _is_scalar(value: Any) -> bool:
+    """Check if a value fits in a table cell."""
+    return value is None or isinstance(value, (bool, int, float, str))
+
+
+class RowWriter:
+    """
+    Base class of the streaming row writers.
+
+    The columns are taken from the first batch of rows; columns first seen in later batches
+    (e.g. counts of a gate absent from the first batch) are appended to them, so no value is
+    dropped. Rows missing a column leave its cell empty.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize a RowWriter object.
+
+        Args:
+            path: Path of the output file
+        """
+        self.path = path
+        self.columns: Optional[List[str]] = None
+        self._known: Set[str] = set()
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Append a batch of rows to the output.
+
+        Args:
+            rows: The rows to write
+        """
+        if not rows:
+            return
+        new = list(
+            dict.fromkeys(column for row in rows for column in row if column not in self._known)
+        )
+        self._known.update(new)
+        if self.columns is None:
+            self.columns = new
+            self._open()
+        elif new:
+            self.columns.extend(new)
+            self._add_columns(new)
+        self._write(rows)
+
+    def close(self) -> None:
+        """
+        Flush and close the output file.
+        """
+
+    def _open(self) -> None:
+        """Open the output once the columns are known."""
+
+    def _add_columns(self, columns: List[str]) -> None:
+        """Extend the output with columns first seen after the first batch."""
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """Write a batch of rows."""
+        raise NotImplementedError
+
+
+class CsvRowWriter(RowWriter):
+    """
+    Streaming CSV writer.
+
+    Columns added after the first batch are written at the end of the rows, and the header
+    is rewritten once when the file is closed.
+    """
+
+    def _open(self) -> None:
+        """Open the file and write the header."""
+        self._file: TextIO = open(self.path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, self.columns)
+        self._writer.writeheader()
+        self._header_columns = len(self.columns)
+
+    def _add_columns(self, columns: List[str]) -> None:
+        """Append the new columns to the rows written from now on."""
+        self._writer = csv.DictWriter(self._file, self.columns)
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """Write a batch of rows."""
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flush and close the output file (an empty file is created if no row was written).
+        """
+        if self.columns is None:
+            open(self.path, "w", encoding="utf-8").close()
+            return
+        self._file.close()
+        if len(self.columns) > self._header_columns:
+            self._rewrite_header()
+
+    def _rewrite_header(self) -> None:
+        """Rewrite the file with the full header, padding the rows written before."""
+        width = len(self.columns)
+        temporary = f"{self.path}.tmp"
+        with open(self.path, newline="", encoding="utf-8") as source:
+            with open(temporary, "w", newline="", encoding="utf-8") as target:
+                reader = csv.reader(source)
+                writer = csv.writer(target)
+                next(reader)
+                writer.writerow(self.columns)
+                writer.writerows(row + [""] * (width - len(row)) for row in reader)
+        os.replace(temporary, self.path)
+
+
+class NdjsonRowWriter(RowWriter):
+    """
+    Streaming newline-delimited JSON writer.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize a NdjsonRowWriter object.
+
+        Args:
+            path: Path of the output file
+        """
+        super().__init__(path)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """Write a batch of rows, one JSON object per line."""
+        self._file.writelines(json.dumps(row) + "\n" for row in rows)
+        self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flush and close the output file.
+        """
+        self._file.close()
+
+
+# Column types of the Parquet writer, from the narrowest to the widest
+_PARQUET_TYPES = ("null", "bool", "int64", "float64", "string")
+
+
+class ParquetRowWriter(RowWriter):
+    """
+    Streaming Parquet writer, one row group per batch. Requires ``pyarrow``.
+
+    The type of every column is inferred from its values and widened when a later batch
+    needs it (null, bool, int64, float64, string): integers that meet floats become floats,
+    and numbers that meet strings become strings. Batches are written to a temporary
+    partition; when a batch adds columns or widens a type, a new partition is started, and
+    the partitions are merged into the output under the final schema on :meth:`close`.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize a ParquetRowWriter object.
+
+        Args:
+            path: Path of the output file
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as error:
+            raise ImportError(
+                "Writing Parquet files requires pyarrow; install it with 'pip install pyarrow' "
+                "or choose the csv or ndjson format"
+            ) from error
+        super().__init__(path)
+        self._pyarrow = pyarrow
+        self._writer = None
+        self._types: Dict[str, int] = {}
+        self._partitions: List[str] = []
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """Write a batch of rows as a row group, starting a partition if the schema widens."""
+        types = dict(self._types)
+        for column in self.columns:
+            rank = types.get(column, 0)
+            for row in rows:
+                value = row.get(column)
+                if value is not None:
+                    rank = max(rank, _parquet_rank(value))
+            types[column] = rank
+        if self._writer is None or types != self._types:
+            self._types = types
+            self._start_partition()
+        schema = self._writer.schema
+        arrays = [
+            self._pyarrow.array(
+                [_parquet_value(row.get(column), types[column]) for row in rows],
+                type=schema.field(column).type,
+            )
+            for column in self.columns
+        ]
+        self._writer.write_table(self._pyarrow.Table.from_arrays(arrays, schema=schema))
+
+    def _schema(self) -> Any:
+        """Build the Arrow schema of the current column types."""
+        pyarrow = self._pyarrow
+        arrow_types = {
+            "null": pyarrow.null(),
+            "bool": pyarrow.bool_(),
+            "int64": pyarrow.int64(),
+            "float64": pyarrow.float64(),
+            "string": pyarrow.string(),
+        }
+        return pyarrow.schema(
+            [(column, arrow_types[_PARQUET_TYPES[self._types[column]]]) for column in self.columns]
+        )
+
+    def _start_partition(self) -> None:
+        """Close the current partition and open a new one with the current schema."""
+        if self._writer is not None:
+            self._writer.close()
+        path = f"{self.path}.part{len(self._partitions)}.tmp"
+        self._partitions.append(path)
+        self._writer = self._pyarrow.parquet.ParquetWriter(path, self._schema())
+
+    def close(self) -> None:
+        """
+        Flush and close the output file, merging the partitions under the final schema.
+        """
+        if self._writer is None:
+            return
+        self._writer.close()
+        if len(self._partitions) == 1:
+            os.replace(self._partitions[0], self.path)
+            return
+        schema = self._schema()
+        with self._pyarrow.parquet.ParquetWriter(self.path, schema) as writer:
+            for path in self._partitions:
+                for batch in self._pyarrow.parquet.ParquetFile(path).iter_batches():
+                    arrays = [
+                        (
+                            batch.column(column).cast(field.type)
+                            if column in batch.schema.names
+                            else self._pyarrow.nulls(batch.num_rows, field.type)
+                        )
+                        for column, field in zip(schema.names, schema)
+                    ]
+                    writer.write_table(self._pyarrow.Table.from_arrays(arrays, schema=schema))
+                os.remove(path)
+
+
+def _parquet_rank(value: Any) -> int:
+    """Get the narrowest Parquet column type (index in ``_PARQUET_TYPES``) of a value."""
+    if isinstance(value, bool):
+        return 1
+    if isinstance(value, int):
+        return 2 if -(2**63) <= value < 2**63 else 4
+    if isinstance(value, float):
+        return 3
+    return 4
+
+
+def _parquet_value(value: Any, rank: int) -> Any:
+    """Convert a value to a Parquet column type (index in ``_PARQUET_TYPES``)."""
+    if value is None:
+        return None
+    if rank == 4:
+        return value if isinstance(value, str) else str(value)
+    if rank == 3:
+        return float(value)
+    if rank == 2:
+        return int(value)
+    return value
+
+
+_WRITERS: Dict[str, Type[RowWriter]] = {
+    "parquet": ParquetRowWriter,
+    "csv": CsvRowWriter,
+    "ndjson": NdjsonRowWriter,
+}
+
+
+def infer_output_format(path: str) -> str:
+    """
+    Infer the output format from a file extension.
+
+    Args:
+        path: Path of the output file
+
+    Returns:
+        str: One of ``parquet``, ``csv`` or ``ndjson``
+
+    Raises:
+        ValueError: If the extension is not recognized
+    """
+    extension = os.path.splitext(path)[1].lower()
+    formats = {".parquet": "parquet", ".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+    if extension not in formats:
+        raise ValueError(f"Cannot infer the output format of {path!r}; pass --format")
+    return formats[extension]
+
+
+def scan_corpus(
+    paths: Iterable[str],
+    output: str,
+    metrics: Sequence[Type[Metric]] = (QiskitMetrics, ComplexityMetrics),
+    output_format: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+    batch_size: int = 1000,
+    log: Optional[TextIO] = None,
+    progress_every: float = 10.0,
+) -> Dict[str, Any]:
+    """
+    Scan a corpus of circuit files and stream the metric rows to a file.
+
+    Files are scanned by a pool of worker processes; rows are written in the order of the
+    files, in batches, as soon as they are available.
+
+    Args:
+        paths: Files, directories or glob patterns of the corpus
+        output: Path of the output file
+        metrics: Pre-runtime metric classes
+        output_format: ``parquet``, ``csv`` or ``ndjson`` (inferred from the extension if None)
+        workers: Number of worker processes (None uses all CPUs, 1 runs in-process)
+        chunksize: Number of files sent to a worker at a time
+        batch_size: Number of rows written at a time
+        log: Stream receiving progress and error messages (None is silent)
+        progress_every: Seconds between progress messages
+
+    Returns:
+        Dict[str, Any]: Summary with ``num_files``, ``num_circuits``, ``num_failed`` (files
+        that could not be scanned), ``num_columns``, ``seconds`` and ``circuits_per_second``
+    """
+    output_format = output_format or infer_output_format(output)
+    if output_format not in _WRITERS:
+        raise ValueError(f"Unsupported output format {output_format!r}")
+    files = find_circuit_files(paths)
+    writer = _WRITERS[output_format](output)
+
+    start = time.perf_counter()
+    last_report = start
+    num_circuits = 0
+    num_failed = 0
+    pending: List[Dict[str, Any]] = []
+    try:
+        for path, (rows, error) in zip(files, _map_files(files, metrics, workers, chunksize)):
+            if error is not None:
+                num_failed += 1
+                _log(log, f"Skipping {path}: {error}")
+            num_circuits += len(rows)
+            pending.extend(rows)
+            if len(pending) >= batch_size:
+                writer.write(pending)
+                pending = []
+            now = time.perf_counter()
+            if now - last_report >= progress_every:
+                last_report = now
+                _log(log, f"{num_circuits} circuits, {num_circuits / (now - start):.1f} circuits/s")
+        writer.write(pending)
+    finally:
+        writer.close()
+
+    seconds = time.perf_counter() - start
+    return {
+        "num_files": len(files),
+        "num_circuits": num_circuits,
+        "num_failed": num_failed,
+        "num_columns": len(writer.columns or ()),
+        "seconds": seconds,
+        "circuits_per_second": num_circuits / seconds if seconds > 0 else 0.0,
+    }
+
+
+def _map_files(
+    files: Sequence[str],
+    metrics: Sequence[Type[Metric]],
+    workers: Optional[int],
+    chunksize: int,
+) -> Iterator[FileResult]:
+    """Scan files in order, in-process or in a pool of worker processes."""
+    metrics = tuple(metrics)
+    if workers == 1 or len(files) <= 1:
+        for path in files:
+            yield scan_file(path, metrics)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            scan_file, files, [metrics] * len(files), chunksize=max(1, chunksize)
+        )
+
+
+def _log(log: Optional[TextIO], message: str) -> None:
+    """Write a message to the log stream, if any."""
+    if log is not None:
+        print(message, file=log, flush=True)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser of the ``qward`` command.
+
+    Returns:
+        argparse.ArgumentParser: The parser
+    """
+    parser = argparse.ArgumentParser(prog="qward", description="QWARD circuit analysis")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan = commands.add_parser(
+        "scan", help="Compute pre-runtime metrics for a corpus of QPY/OpenQASM files"
+    )
+    scan.add_argument("paths", nargs="+", help="Files, directories or glob patterns")
+    scan.add_argument("-o", "--output", required=True, help="Output .parquet, .csv or .ndjson")
+    scan.add_argument("--format", choices=OUTPUT_FORMATS, help="Output format")
+    scan.add_argument(
+        "-m",
+        "--metrics",
+        nargs="+",
+        choices=sorted(SCAN_METRICS),
+        default=list(SCAN_METRICS),
+        help="Metrics to compute",
+    )
+    scan.add_argument("-w", "--workers", type=int, help="Worker processes (default: all CPUs)")
+    scan.add_argument("--chunksize", type=int, default=16, help="Files per worker task")
+    scan.add_argument("--batch-size", type=int, default=1000, help="Rows per write")
+    scan.add_argument("-q", "--quiet", action="store_true", help="Only print the summary")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the ``qward`` command.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+
+    Returns:
+        int: The exit status
+    """
+    parser = build_parser()
+    arguments = parser.parse_args(argv)
+    try:
+        summary = scan_corpus(
+            arguments.paths,
+            arguments.output,
+            metrics=[SCAN_METRICS[name] for name in arguments.metrics],
+            output_format=arguments.format,
+            workers=arguments.workers,
+            chunksize=arguments.chunksize,
+            batch_size=arguments.batch_size,
+            log=None if arguments.quiet else sys.stderr,
+        )
+    except (ImportError, ValueError) as error:
+        parser.error(str(error))
+    _log(
+        sys.stderr,
+        f"Scanned {summary['num_circuits']} circuits from {summary['num_files']} files "
+        f"({summary['num_failed']} failed) in {summary['seconds']:.2f} s "
+        f"({summary['circuits_per_second']:.1f} circuits/s)",
+    )
+    return 1 if summary["num_failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
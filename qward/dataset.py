@@ -0,0 +1,274 @@
+"""
+Memory-bounded scanning of large circuit corpora for QWARD.
+
+:func:`scan_circuits_chunked` streams the rows of :func:`~qward.batch.iter_scan_circuits`
+into chunks sized to a memory budget and flushes every chunk to a Parquet partition, so
+peak memory does not grow with the corpus. The result is a :class:`ScanDataset`, a lazy
+handle that reads the partitions back only when asked. Requires ``pyarrow``.
+
+Rows are converted to plain data with :func:`~qward.utils.portable.portable_value` before
+they are buffered, so a round-trip changes the types of object columns exactly as the
+metrics store does: instruction lists become lists of operation names, layouts become
+mappings of qubit indices, tuples become lists and mapping keys become strings. Columns
+that Parquet cannot store natively (lists, mappings, mixed types) are written as JSON
+strings and decoded again when the partitions are read. Integer columns that also hold
+floats or missing values read back as floats.
+"""
+
+import glob
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Type
+
+import pandas as pd
+from qiskit import QuantumCircuit
+
+from qward.batch import DEFAULT_BATCH_METRICS, DEFAULT_CACHE_SIZE, iter_scan_circuits
+from qward.metrics.base_metric import Metric
+from qward.utils.portable import portable_values
+
+# Default memory budget of the buffered rows, in bytes
+DEFAULT_MEMORY_BUDGET = 256 * 1024**2
+
+# Number of rows of the first Arrow table, used to measure the encoded size of a row
+_SAMPLE_ROWS = 16
+
+# Maximum number of rows encoded into an Arrow table at a time
+_BATCH_ROWS = 256
+
+_PARTITION_PATTERN = "part-{:05d}.parquet"
+_JSON_COLUMNS_KEY = b"qward.json_columns"
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow, with a helpful message if it is not installed."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "Chunked scans write Parquet partitions and require pyarrow; install it with "
+            "'pip install pyarrow'"
+        ) from error
+    return pyarrow
+
+
+class ScanDataset:
+    """
+    Lazy handle of a chunked scan stored as Parquet partitions in a directory.
+
+    Only the Parquet footers are read to report the number of rows and the columns; rows are
+    loaded by :meth:`iter_partitions` (one partition at a time) or :meth:`to_pandas`.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Open the partitions of a directory.
+
+        Args:
+            directory: Directory written by :func:`scan_circuits_chunked`
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        self._pyarrow = _import_pyarrow()
+        self.directory = directory
+        self.partitions: List[str] = sorted(
+            glob.glob(os.path.join(directory, _PARTITION_PATTERN.replace("{:05d}", "*")))
+        )
+
+    def __len__(self) -> int:
+        """
+        Get the number of rows without reading them.
+
+        Returns:
+            int: The total number of rows of the partitions
+        """
+        return sum(
+            self._pyarrow.parquet.ParquetFile(path).metadata.num_rows for path in self.partitions
+        )
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Get the columns of the dataset, in order of first appearance.
+
+        Returns:
+            List[str]: The column names of all partitions
+        """
+        columns: Dict[str, None] = {}
+        for path in self.partitions:
+            columns.update(dict.fromkeys(self._pyarrow.parquet.read_schema(path).names))
+        return list(columns)
+
+    def iter_partitions(self, columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read the partitions one at a time.
+
+        Args:
+            columns: Columns to read (None reads all); columns missing from a partition are
+                skipped
+
+        Yields:
+            pd.DataFrame: The rows of every partition, with JSON columns decoded
+        """
+        for path in self.partitions:
+            schema = self._pyarrow.parquet.read_schema(path)
+            selected = None if columns is None else [c for c in columns if c in schema.names]
+            frame = self._pyarrow.parquet.read_table(path, columns=selected).to_pandas()
+            metadata = schema.metadata or {}
+            for column in json.loads(metadata.get(_JSON_COLUMNS_KEY, b"[]")):
+                if column in frame:
+                    frame[column] = frame[column].map(_decode_json)
+            yield frame
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Read the whole dataset.
+
+        Args:
+            columns: Columns to read (None reads all)
+
+        Returns:
+            pd.DataFrame: The rows of all partitions, in scan order
+        """
+        frames = list(self.iter_partitions(columns))
+        if not frames:
+            return pd.DataFrame(columns=list(columns) if columns is not None else None)
+        return pd.concat(frames, ignore_index=True)
+
+
+def scan_circuits_chunked(
+    circuits: Iterable[QuantumCircuit],
+    directory: str,
+    metrics: Sequence[Type[Metric]] = DEFAULT_BATCH_METRICS,
+    names: Optional[Iterable[str]] = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    dedup: bool = True,
+    cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+) -> ScanDataset:
+    """
+    Compute pre-runtime metrics for a corpus, flushing the rows to Parquet in chunks.
+
+    Circuits are consumed lazily. Every row is converted to plain data as soon as it is
+    computed, and rows are encoded into small Arrow tables, so the buffer holds Arrow data
+    whose exact size is known; once it reaches the memory budget the tables are written as
+    one partition. The number of rows of the next table is derived from the encoded size of
+    a row, so partitions stay close to the budget.
+
+    Args:
+        circuits: The circuits to analyze (any iterable, e.g. a generator)
+        directory: Directory receiving the partitions (created if needed)
+        metrics: Pre-runtime metric classes, instantiated with each circuit
+        names: Names of the circuits (defaults to the circuit names)
+        memory_budget: Approximate memory of the buffered rows, in bytes
+        dedup: Reuse the row of a structurally identical circuit seen recently
+        cache_size: Maximum number of rows kept for dedup (None keeps all distinct rows)
+
+    Returns:
+        ScanDataset: Lazy handle of the written partitions
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        TypeError: If a metric value has no plain-data representation
+        ValueError: If the memory budget is not positive, the directory already holds
+            partitions or there are fewer names than circuits
+    """
+    pyarrow = _import_pyarrow()
+    if memory_budget <= 0:
+        raise ValueError("The memory budget must be positive")
+    os.makedirs(directory, exist_ok=True)
+    if ScanDataset(directory).partitions:
+        raise ValueError(f"Directory {directory!r} already holds scan partitions")
+
+    batch_rows = _SAMPLE_ROWS
+    rows: List[Dict[str, Any]] = []
+    tables: List[Tuple[Any, Set[str]]] = []
+    buffered_bytes = 0
+    num_partitions = 0
+    for _, row in iter_scan_circuits(circuits, metrics, names, dedup, cache_size):
+        rows.append(portable_values(row))
+        if len(rows) < batch_rows:
+            continue
+        table, json_columns = _encode_rows(pyarrow, rows)
+        tables.append((table, json_columns))
+        buffered_bytes += table.nbytes
+        row_bytes = max(table.nbytes / len(rows), 1.0)
+        rows = []
+        remaining = memory_budget - buffered_bytes
+        batch_rows = max(1, min(_BATCH_ROWS, int(remaining // row_bytes)))
+        if remaining <= 0:
+            _write_partition(pyarrow, tables, directory, num_partitions)
+            num_partitions += 1
+            tables = []
+            buffered_bytes = 0
+            batch_rows = max(1, min(_BATCH_ROWS, int(memory_budget // row_bytes)))
+    if rows:
+        tables.append(_encode_rows(pyarrow, rows))
+    if tables:
+        _write_partition(pyarrow, tables, directory, num_partitions)
+    return ScanDataset(directory)
+
+
+def _encode_rows(pyarrow: Any, rows: List[Dict[str, Any]]) -> Tuple[Any, Set[str]]:
+    """Encode plain-data rows as an Arrow table, with the names of the JSON columns."""
+    arrays = {}
+    json_columns = set()
+    for column in dict.fromkeys(name for row in rows for name in row):
+        values = [row.get(column) for row in rows]
+        if not any(isinstance(value, (list, dict)) for value in values):
+            try:
+                arrays[column] = pyarrow.array(values)
+                continue
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                pass
+        # Lists, mappings and columns of mixed types are stored as JSON
+        arrays[column] = pyarrow.array(_encode_json(values), type=pyarrow.string())
+        json_columns.add(column)
+    return pyarrow.table(arrays), json_columns
+
+
+def _write_partition(
+    pyarrow: Any, tables: List[Tuple[Any, Set[str]]], directory: str, index: int
+) -> None:
+    """Write encoded tables as one Parquet partition under a common schema."""
+    # A column stored as JSON in one table, or with different types, is JSON in all tables
+    types: Dict[str, Set[Any]] = {}
+    json_columns: Set[str] = set()
+    for table, encoded in tables:
+        json_columns |= encoded
+        for field in table.schema:
+            if field.type != pyarrow.null():
+                types.setdefault(field.name, set()).add(field.type)
+    json_columns |= {
+        column
+        for column, column_types in types.items()
+        if len(column_types) > 1
+        and not all(
+            pyarrow.types.is_integer(t) or pyarrow.types.is_floating(t) for t in column_types
+        )
+    }
+    unified = []
+    for table, encoded in tables:
+        for column in (json_columns - encoded).intersection(table.column_names):
+            position = table.column_names.index(column)
+            values = _encode_json(table.column(column).to_pylist())
+            table = table.set_column(position, column, pyarrow.array(values, type=pyarrow.string()))
+        unified.append(table)
+    table = pyarrow.concat_tables(unified, promote_options="permissive")
+    metadata = dict(table.schema.metadata or {})
+    metadata[_JSON_COLUMNS_KEY] = json.dumps(sorted(json_columns)).encode()
+    pyarrow.parquet.write_table(
+        table.replace_schema_metadata(metadata),
+        os.path.join(directory, _PARTITION_PATTERN.format(index)),
+    )
+
+
+def _encode_json(values: List[Any]) -> List[Optional[str]]:
+    """Encode plain-data values as JSON strings (None stays missing)."""
+    return [None if value is None else json.dumps(value) for value in values]
+
+
+def _decode_json(value: Optional[str]) -> Any:
+    """Decode a value written by :func:`_encode_json` (missing values may read back as NaN)."""
+    return json.loads(value) if isinstance(value, str) else None
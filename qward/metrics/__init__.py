@@ -4,16 +4,62 @@ Metrics package for QWARD.
 
 from qward.metrics.types import MetricsId, MetricsType
 from qward.metrics.base_metric import Metric
+from qward.metrics.records import (
+    MetricRecord,
+    QiskitMetricsRecord,
+    ComplexityMetricsRecord,
+    SuccessRateRecord,
+    SuccessRateJobRecord,
+    SuccessRateAggregateRecord,
+    DistributionDistanceRecord,
+    DistributionDistanceJobRecord,
+    DistributionDistanceAggregateRecord,
+    PredictedSuccessRateRecord,
+    ShotDriftRecord,
+    CriticalPathRecord,
+    LayerProfileRecord,
+)
+from qward.metrics.streaming import CircuitStats, QasmInstructionReader, StreamingMetric
+from qward.metrics.scheduling import CircuitSchedule
 from qward.metrics.qiskit_metrics import QiskitMetrics
 from qward.metrics.complexity_metrics import ComplexityMetrics
 from qward.metrics.success_rate import SuccessRate
-
+from qward.metrics.distribution_distance import DistributionDistance, pairwise_distances
+from qward.metrics.predicted_success_rate import InstructionErrorRates, PredictedSuccessRate
+from qward.metrics.shot_drift import ShotDrift
+from qward.metrics.critical_path import CriticalPath, DurationTable
+from qward.metrics.layer_profile import LayerProfile
 
 __all__ = [
     "MetricsId",
     "MetricsType",
     "QiskitMetrics",
+    "CircuitSchedule",
     "ComplexityMetrics",
     "SuccessRate",
+    "DistributionDistance",
+    "pairwise_distances",
+    "PredictedSuccessRate",
+    "InstructionErrorRates",
+    "ShotDrift",
+    "CriticalPath",
+    "DurationTable",
+    "LayerProfile",
     "Metric",
+    "StreamingMetric",
+    "CircuitStats",
+    "QasmInstructionReader",
+    "MetricRecord",
+    "QiskitMetricsRecord",
+    "ComplexityMetricsRecord",
+    "SuccessRateRecord",
+    "SuccessRateJobRecord",
+    "SuccessRateAggregateRecord",
+    "DistributionDistanceRecord",
+    "DistributionDistanceJobRecord",
+    "DistributionDistanceAggregateRecord",
+    "PredictedSuccessRateRecord",
+    "ShotDriftRecord",
+    "CriticalPathRecord",
+    "LayerProfileRecord",
 ]
@@ -3,11 +3,12 @@ Base metric class for QWARD.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from qiskit import QuantumCircuit
 
 if TYPE_CHECKING:
+    from qward.metrics.records import MetricRecord
     from qward.metrics.types import MetricsType, MetricsId
 
 
@@ -109,3 +110,15 @@ class Metric(ABC):
             Dict[str, Any]: Dictionary of metric names and values
         """
         pass
+
+    def get_record(self) -> Optional["MetricRecord"]:
+        """
+        Get the metrics for this circuit as a typed record.
+
+        Metrics without a record type return None, in which case consumers fall back to
+        the dictionary returned by :meth:`get_metrics`.
+
+        Returns:
+            Optional[MetricRecord]: The typed metric result, or None
+        """
+        return None
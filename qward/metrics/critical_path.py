@@ -0,0 +1,323 @@
+"""
+Duration-weighted critical path metrics implementation for QWARD.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Delay
+from qiskit.providers import BackendV2
+from qiskit.transpiler import Target
+
+from qward.metrics.base_metric import Metric
+from qward.metrics.records import CriticalPathRecord
+from qward.metrics.streaming import condition_clbits
+from qward.metrics.types import MetricsType, MetricsId
+from qward.utils.fingerprint import target_fingerprint
+
+# Durations in seconds keyed by operation name or by (name, qubits)
+DurationMapping = Mapping[Union[str, Tuple[str, Tuple[int, ...]]], float]
+
+# Seconds per unit of a delay
+_TIME_UNITS = {"s": 1.0, "ms": 1e-3, "us": 1e-6, "ns": 1e-9, "ps": 1e-12}
+
+# Number of target duration tables kept by ``DurationTable.for_target``
+_TABLE_CACHE_SIZE = 16
+_TABLE_CACHE: "OrderedDict[str, DurationTable]" = OrderedDict()
+
+# Tables of recently seen target objects keyed by id; the target is kept with its table (which
+# references it anyway) so the id cannot be reused. Target objects cannot be weakly referenced.
+_TARGET_TABLES: "OrderedDict[int, Tuple[Target, DurationTable]]" = OrderedDict()
+
+
+class DurationTable:
+    """
+    Instruction durations (in seconds) read from a target or a mapping.
+
+    Durations are looked up lazily and cached per ``(name, qubits)``. Tables built with
+    :meth:`for_target` are shared by all metrics analyzing circuits against the same
+    (structurally identical) target; a target object is fingerprinted only the first time
+    it is seen, so targets must not be modified after they are first used (see
+    :meth:`for_target`).
+    """
+
+    def __init__(
+        self, source: Union[Target, BackendV2, DurationMapping], dt: Optional[float] = None
+    ):
+        """
+        Initialize a DurationTable object.
+
+        Args:
+            source: Target, backend, or mapping from operation names or ``(name, qubits)``
+                pairs to durations in seconds
+            dt: Duration of a ``dt`` sample in seconds (defaults to the target ``dt``)
+        """
+        if isinstance(source, BackendV2):
+            source = source.target
+        self._source = source
+        self.dt = dt if dt is not None or not isinstance(source, Target) else source.dt
+        self._cache: Dict[Tuple[str, Tuple[int, ...]], Optional[float]] = {}
+
+    @classmethod
+    def for_target(cls, target: Union[Target, BackendV2]) -> "DurationTable":
+        """
+        Get the shared duration table of a target.
+
+        The table is cached by target object and by fingerprint, and it reads its durations
+        lazily from the first target seen with that fingerprint. A target must therefore not
+        be modified (e.g. with ``update_instruction_properties``) after it is first passed
+        here, or the table would return stale durations; build a new ``DurationTable`` from
+        the target instead, or modify a copy of the target.
+
+        Args:
+            target: The target (or a backend with a target)
+
+        Returns:
+            DurationTable: The cached table of the target
+        """
+        if isinstance(target, BackendV2):
+            target = target.target
+        entry = _TARGET_TABLES.get(id(target))
+        if entry is not None and entry[0] is target:
+            _TARGET_TABLES.move_to_end(id(target))
+            return entry[1]
+
+        # Fingerprint only targets not seen before, so equal copies still share a table
+        key = target_fingerprint(target)
+        table = _TABLE_CACHE.get(key)
+        if table is None:
+            table = _TABLE_CACHE[key] = cls(target)
+            if len(_TABLE_CACHE) > _TABLE_CACHE_SIZE:
+                _TABLE_CACHE.popitem(last=False)
+        else:
+            _TABLE_CACHE.move_to_end(key)
+        _TARGET_TABLES[id(target)] = (target, table)
+        if len(_TARGET_TABLES) > _TABLE_CACHE_SIZE:
+            _TARGET_TABLES.popitem(last=False)
+        return table
+
+    def duration(self, name: str, qubits: Tuple[int, ...]) -> Optional[float]:
+        """
+        Get the duration of an instruction.
+
+        Args:
+            name: The operation name
+            qubits: The (physical) qubits the operation acts on
+
+        Returns:
+            Optional[float]: The duration in seconds, or None if unknown
+        """
+        key = (name, qubits)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if isinstance(self._source, Target):
+            duration = None
+            if name in self._source.operation_names:
+                properties = self._source[name]
+                instruction = properties.get(qubits, properties.get(None))
+                if instruction is not None:
+                    duration = instruction.duration
+        else:
+            duration = self._source.get(key, self._source.get(name))
+        self._cache[key] = None if duration is None else float(duration)
+        return self._cache[key]
+
+    def delay_duration(self, delay: Delay) -> float:
+        """
+        Get the duration of a delay instruction in seconds.
+
+        Args:
+            delay: The delay
+
+        Returns:
+            float: The duration (0 for delays in ``dt`` without a known ``dt``)
+        """
+        value = float(delay.params[0])
+        if delay.unit == "dt":
+            return value * self.dt if self.dt else 0.0
+        return value * _TIME_UNITS.get(delay.unit, 1.0)
+
+
+class CriticalPath(Metric):
+    """
+    Class for computing the duration-weighted critical path of a circuit.
+
+    ``circuit.depth()`` counts every gate as one time step; here every instruction lasts
+    its calibrated duration. The circuit is scheduled as soon as possible in one pass over
+    its (topologically ordered) instructions, keeping the time at which every qubit and
+    clbit becomes free in NumPy arrays. The critical path is the longest chain of
+    dependent instructions, and the slack of a qubit is the time between its last
+    instruction and the end of the circuit. Barriers synchronize their qubits; instructions
+    without a known duration take no time and are counted as uncalibrated. The circuit is
+    expected to be transpiled to the device, so its qubit indices are physical qubits.
+    """
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        *,
+        target: Optional[Union[Target, BackendV2]] = None,
+        durations: Optional[Union[DurationTable, DurationMapping]] = None,
+        dt: Optional[float] = None,
+    ):
+        """
+        Initialize a CriticalPath object.
+
+        Args:
+            circuit: The (transpiled) quantum circuit to analyze
+            target: Target (or backend) providing the instruction durations
+            durations: Duration table, or mapping from operation names or ``(name, qubits)``
+                pairs to durations in seconds (takes precedence over the target)
+            dt: Duration of a ``dt`` sample in seconds, for delays in ``dt`` (defaults to
+                the target ``dt``)
+        """
+        super().__init__(circuit)
+        if durations is not None and not isinstance(durations, DurationTable):
+            durations = DurationTable(durations, dt=dt)
+        elif durations is None and target is not None:
+            durations = DurationTable.for_target(target)
+        self._durations = durations
+
+    @property
+    def durations(self) -> Optional[DurationTable]:
+        """
+        Get the duration table.
+
+        Returns:
+            Optional[DurationTable]: The durations, if any
+        """
+        return self._durations
+
+    def _get_metric_type(self) -> MetricsType:
+        """
+        Get the type of this metric.
+
+        Returns:
+            MetricsType: The type of this metric
+        """
+        return MetricsType.PRE_RUNTIME
+
+    def _get_metric_id(self) -> MetricsId:
+        """
+        Get the ID of this metric.
+
+        Returns:
+            MetricsId: The ID of this metric
+        """
+        return MetricsId.CRITICAL_PATH
+
+    def is_ready(self) -> bool:
+        """
+        Check if the metric is ready to be calculated.
+
+        Returns:
+            bool: True if the metric is ready to be calculated, False otherwise
+        """
+        return self.circuit is not None and self._durations is not None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the metrics.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the metrics
+        """
+        return self.get_record().to_dict()
+
+    def get_qubit_times(self) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Schedule the circuit as soon as possible.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, float]: The time at which every qubit finishes its
+            last instruction, the busy time of every qubit (seconds) and the critical path
+            length
+
+        Raises:
+            ValueError: If no durations are available
+        """
+        return self._schedule()[:3]
+
+    def get_record(self) -> CriticalPathRecord:
+        """
+        Get the metrics as a typed record.
+
+        Returns:
+            CriticalPathRecord: The metrics record
+        """
+        qubit_finish, busy_time, length, num_critical, uncalibrated = self._schedule()
+        used = np.flatnonzero(busy_time > 0)
+        slack = length - qubit_finish[used]
+        dt = self._durations.dt
+        return CriticalPathRecord(
+            critical_path_length=length,
+            critical_path_length_dt=length / dt if dt else None,
+            num_critical_instructions=num_critical,
+            mean_qubit_slack=float(slack.mean()) if len(used) else 0.0,
+            max_qubit_slack=float(slack.max()) if len(used) else 0.0,
+            mean_busy_fraction=(
+                float(busy_time[used].mean() / length) if len(used) and length > 0 else 0.0
+            ),
+            num_uncalibrated=uncalibrated,
+            qubit_slack=dict(zip(map(str, used.tolist()), slack.tolist())),
+        )
+
+    def _schedule(self) -> Tuple[np.ndarray, np.ndarray, float, int, int]:
+        """Run the as-soon-as-possible pass over the instructions of the circuit."""
+        if self._durations is None:
+            raise ValueError("A target or a duration table is needed for the critical path")
+        circuit = self.circuit
+        durations = self._durations
+        num_qubits = circuit.num_qubits
+        qubit_index = {bit: i for i, bit in enumerate(circuit.qubits)}
+        clbit_index = {bit: num_qubits + i for i, bit in enumerate(circuit.clbits)}
+
+        # Qubits and clbits share the arrays: clbits come after the qubits
+        ready = np.zeros(num_qubits + circuit.num_clbits)
+        last = np.full(len(ready), -1, dtype=np.int64)
+        busy_time = np.zeros(num_qubits)
+        num_instructions = len(circuit.data)
+        end = np.zeros(num_instructions)
+        predecessor = np.full(num_instructions, -1, dtype=np.int64)
+        uncalibrated = 0
+
+        for position, instruction in enumerate(circuit.data):
+            operation = instruction.operation
+            qubits = [qubit_index[bit] for bit in instruction.qubits]
+            wires = qubits + [clbit_index[bit] for bit in instruction.clbits]
+            wires.extend(clbit_index[bit] for bit in condition_clbits(operation))
+            if not wires:
+                continue
+
+            if isinstance(operation, Delay):
+                duration = durations.delay_duration(operation)
+            elif getattr(operation, "_directive", False):
+                duration = 0.0
+            else:
+                duration = durations.duration(operation.name, tuple(qubits))
+                if duration is None:
+                    uncalibrated += 1
+                    duration = 0.0
+
+            waiting = ready[wires]
+            first = int(np.argmax(waiting))
+            start = waiting[first]
+            end[position] = start + duration
+            predecessor[position] = last[wires[first]]
+            ready[wires] = end[position]
+            last[wires] = position
+            if not isinstance(operation, Delay):
+                busy_time[qubits] += duration
+
+        length = float(end.max()) if num_instructions else 0.0
+        # Walk back the chain of instructions that determined the end of the circuit
+        num_critical = 0
+        position = int(np.argmax(end)) if num_instructions and length > 0 else -1
+        while position >= 0:
+            num_critical += 1
+            position = predecessor[position]
+        return ready[:num_qubits], busy_time, length, num_critical, uncalibrated
@@ -0,0 +1,369 @@
+"""
+Distribution distance metrics implementation for QWARD.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+from qiskit_aer import AerJob
+from qiskit.providers.job import JobV1 as QiskitJob
+
+from qward.metrics.base_metric import Metric
+from qward.metrics.records import (
+    DistributionDistanceAggregateRecord,
+    DistributionDistanceJobRecord,
+    DistributionDistanceRecord,
+)
+from qward.metrics.runtime_jobs import RuntimeJobsMixin
+from qward.metrics.types import MetricsType, MetricsId
+from qward.utils.counts import align_counts, counts_of, row_sums
+
+# Reference distribution: None (ideal simulation of the circuit), a counts or probabilities
+# mapping, a statevector, or a job whose counts are used
+Reference = Union[None, Mapping[str, float], Statevector, AerJob, QiskitJob]
+
+# Distances available for pairwise comparisons
+PAIRWISE_METRICS = ("tvd", "hellinger_distance", "hellinger_fidelity")
+
+# Probabilities below this threshold are treated as numerical noise of the simulation
+_PROBABILITY_ATOL = 1e-12
+
+
+class DistributionDistance(RuntimeJobsMixin, Metric):
+    """
+    Class for comparing the output distributions of jobs with a reference distribution.
+
+    For every job, the total variation distance, the Hellinger distance and fidelity, and the
+    Kullback-Leibler divergence D(reference || job) are computed. All distributions are
+    aligned as sparse arrays over the union of their observed outcomes, so the cost scales
+    with the number of observed outcomes rather than with the number of possible ones.
+    """
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        *,
+        job: Optional[Union[AerJob, QiskitJob]] = None,
+        jobs: Optional[List[Union[AerJob, QiskitJob]]] = None,
+        reference: Reference = None,
+        epsilon: float = 0.0,
+    ):
+        """
+        Initialize a DistributionDistance object.
+
+        Args:
+            circuit: The quantum circuit to analyze
+            job: A single job that executed the circuit
+            jobs: A list of jobs that executed the circuit (for multiple runs)
+            reference: The reference distribution; by default the ideal distribution of the
+                circuit, obtained from a statevector simulation
+            epsilon: Probability assigned to outcomes missing from a job when computing the
+                KL divergence (0 reports an infinite divergence instead)
+        """
+        super().__init__(circuit)
+        if epsilon < 0:
+            raise ValueError("epsilon must be non-negative")
+        self.reference = reference
+        self.epsilon = epsilon
+        self._init_runtime_jobs(job, jobs)
+
+    def _get_metric_type(self) -> MetricsType:
+        """
+        Get the type of this metric.
+
+        Returns:
+            MetricsType: The type of this metric
+        """
+        return MetricsType.POST_RUNTIME
+
+    def _get_metric_id(self) -> MetricsId:
+        """
+        Get the ID of this metric.
+
+        Returns:
+            MetricsId: The ID of this metric
+        """
+        return MetricsId.DISTRIBUTION_DISTANCE
+
+    def is_ready(self) -> bool:
+        """
+        Check if the metric is ready to be calculated.
+
+        Returns:
+            bool: True if the metric is ready to be calculated, False otherwise
+        """
+        return len(self._runtime_jobs) > 0 and (
+            self.reference is not None or self.circuit is not None
+        )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the metrics.
+
+        Returns:
+            Dict[str, Any]: Dictionary with the per-job distances under ``individual_jobs``
+            and their summary under ``aggregate``
+        """
+        return self.get_record().to_dict()
+
+    def get_record(self) -> DistributionDistanceRecord:
+        """
+        Get the metrics as a typed record, with one row per job and the aggregate.
+
+        Returns:
+            DistributionDistanceRecord: The metrics record
+        """
+        if not self._runtime_jobs:
+            raise ValueError("No jobs available to calculate metrics")
+
+        job_ids = self._job_ids()
+        job_counts = [counts_of(self.job_result(job)) for job in self._runtime_jobs.values()]
+        reference = self.get_reference_distribution()
+
+        _, matrix = align_counts([reference] + job_counts)
+        distances = distribution_distances(matrix[0], matrix[1:], self.epsilon)
+        num_outcomes = np.diff(matrix.indptr)
+
+        job_records = [
+            DistributionDistanceJobRecord(
+                job_id=job_id,
+                total_shots=int(sum(counts.values())),
+                num_outcomes=int(num_outcomes[i + 1]),
+                tvd=float(distances["tvd"][i]),
+                hellinger_distance=float(distances["hellinger_distance"][i]),
+                hellinger_fidelity=float(distances["hellinger_fidelity"][i]),
+                kl_divergence=float(distances["kl_divergence"][i]),
+            )
+            for i, (job_id, counts) in enumerate(zip(job_ids, job_counts))
+        ]
+        aggregate = DistributionDistanceAggregateRecord(
+            num_jobs=len(job_records),
+            reference_outcomes=int(num_outcomes[0]),
+            mean_tvd=float(np.mean(distances["tvd"])),
+            max_tvd=float(np.max(distances["tvd"])),
+            mean_hellinger_fidelity=float(np.mean(distances["hellinger_fidelity"])),
+            min_hellinger_fidelity=float(np.min(distances["hellinger_fidelity"])),
+            mean_kl_divergence=float(np.mean(distances["kl_divergence"])),
+        )
+        return DistributionDistanceRecord(individual_jobs=job_records, aggregate=aggregate)
+
+    def get_distance_matrix(self, metric: str = "tvd") -> pd.DataFrame:
+        """
+        Compare all jobs with each other instead of with the reference.
+
+        Args:
+            metric: One of ``tvd``, ``hellinger_distance`` or ``hellinger_fidelity``
+
+        Returns:
+            pd.DataFrame: Symmetric jobs x jobs matrix indexed by job id
+        """
+        job_ids = self._job_ids()
+        matrix = pairwise_distances([self.job_result(job) for job in self.runtime_jobs], metric)
+        return pd.DataFrame(matrix, index=job_ids, columns=job_ids)
+
+    def get_reference_distribution(self) -> Mapping[str, float]:
+        """
+        Get the reference distribution as a mapping from bitstrings to weights.
+
+        Returns:
+            Mapping[str, float]: The reference counts or probabilities (not necessarily
+            normalized)
+        """
+        reference = self.reference
+        if reference is None:
+            return ideal_distribution(self.circuit)
+        if isinstance(reference, Statevector):
+            if self.circuit is None:
+                return reference.probabilities_dict()
+            return ideal_distribution(self.circuit, reference)
+        return counts_of(reference)
+
+
+def ideal_distribution(
+    circuit: QuantumCircuit, state: Optional[Statevector] = None
+) -> Dict[str, float]:
+    """
+    Compute the ideal outcome distribution of a circuit's measurements.
+
+    The final measurements are removed and the circuit is simulated as a statevector; the
+    probabilities of the measured qubits are then mapped onto the classical bits they are
+    measured into, so the keys match the counts of a job running the circuit. Without
+    measurements, the distribution over all qubits is returned.
+
+    Args:
+        circuit: The quantum circuit
+        state: The pre-measurement state, if already known (simulated otherwise)
+
+    Returns:
+        Dict[str, float]: Mapping from bitstrings to probabilities
+
+    Raises:
+        ValueError: If the circuit cannot be simulated as a statevector (e.g. mid-circuit
+            measurements or resets)
+    """
+    measured: Dict[int, int] = {}
+    for instruction in circuit.data:
+        if instruction.operation.name == "measure":
+            qubit = circuit.find_bit(instruction.qubits[0]).index
+            clbit = circuit.find_bit(instruction.clbits[0]).index
+            measured[clbit] = qubit
+
+    if state is None:
+        try:
+            state = Statevector(circuit.remove_final_measurements(inplace=False))
+        except Exception as error:
+            raise ValueError(
+                f"Cannot compute the ideal distribution of the circuit: {error}"
+            ) from error
+    if not measured:
+        return {
+            key: float(value)
+            for key, value in state.probabilities_dict().items()
+            if value > _PROBABILITY_ATOL
+        }
+
+    clbits = sorted(measured)
+    probabilities = state.probabilities([measured[clbit] for clbit in clbits])
+    (indices,) = np.nonzero(probabilities > _PROBABILITY_ATOL)
+    return dict(
+        zip(
+            _bitstrings(indices, clbits, max(circuit.num_clbits, clbits[-1] + 1)),
+            probabilities[indices].tolist(),
+        )
+    )
+
+
+def _bitstrings(indices: np.ndarray, clbits: List[int], num_clbits: int) -> List[str]:
+    """Convert indices over the measured clbits into full-width bitstrings."""
+    bits = np.full((len(indices), num_clbits), ord("0"), dtype=np.uint8)
+    for position, clbit in enumerate(clbits):
+        # Bitstrings are little-endian: clbit 0 is the rightmost character
+        bits[:, num_clbits - 1 - clbit] += ((indices >> position) & 1).astype(np.uint8)
+    return [row.decode() for row in bits.view(f"S{num_clbits}").ravel()]
+
+
+def distribution_distances(
+    reference: sparse.spmatrix, distributions: sparse.csr_matrix, epsilon: float = 0.0
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the distances between normalized distributions and a reference distribution.
+
+    Only the stored entries of the sparse distributions are visited: with ``p`` the
+    reference and ``q`` a distribution, TVD is ``1 - sum(min(p, q))``, the Bhattacharyya
+    coefficient is ``sum(sqrt(p q))`` and the KL divergence splits into the negative entropy
+    of ``p`` and the cross term over the shared support.
+
+    Args:
+        reference: The reference distribution as a 1 x outcomes sparse matrix
+        distributions: The distributions as a CSR matrix with one row per distribution
+        epsilon: Probability assigned to outcomes missing from a distribution in the KL
+            divergence (0 reports an infinite divergence instead)
+
+    Returns:
+        Dict[str, np.ndarray]: Arrays ``tvd``, ``hellinger_distance``, ``hellinger_fidelity`` and
+        ``kl_divergence`` with one value per distribution
+    """
+    p = np.asarray(reference.todense()).ravel()
+    q = distributions.data
+    p_at_q = p[distributions.indices]
+    indptr = distributions.indptr
+
+    tvd = np.clip(1.0 - row_sums(np.minimum(p_at_q, q), indptr), 0.0, 1.0)
+    bhattacharyya = np.clip(row_sums(np.sqrt(p_at_q * q), indptr), 0.0, 1.0)
+
+    support = p > 0
+    negative_entropy = float(np.sum(p[support] * np.log(p[support])))
+    shared = p_at_q > 0
+    q_shared = np.maximum(q, epsilon) if epsilon > 0 else q
+    cross = row_sums(
+        np.where(shared, p_at_q * np.log(np.where(shared, q_shared, 1.0)), 0.0), indptr
+    )
+    missing = np.clip(np.sum(p) - row_sums(p_at_q, indptr), 0.0, None)
+    with np.errstate(divide="ignore"):
+        missing_term = (
+            missing * np.log(epsilon)
+            if epsilon > 0
+            else np.where(missing > _PROBABILITY_ATOL, -np.inf, 0.0)
+        )
+    kl_divergence = np.maximum(negative_entropy - cross - missing_term, 0.0)
+
+    return {
+        "tvd": tvd,
+        "hellinger_distance": np.sqrt(1.0 - bhattacharyya),
+        "hellinger_fidelity": bhattacharyya**2,
+        "kl_divergence": kl_divergence,
+    }
+
+
+def pairwise_distances(
+    sources: Sequence[Any],
+    metric: str = "tvd",
+    block_size: int = 32,
+    column_block: int = 256,
+) -> np.ndarray:
+    """
+    Compute the pairwise distance matrix between the output distributions of many runs.
+
+    All counts are aligned into one sparse matrix. The Hellinger quantities follow from the
+    Bhattacharyya coefficients, obtained for all pairs with a single sparse product of the
+    square-rooted matrix. The TVD is ``1 - sum(min(p, q))``; the overlaps are accumulated in
+    dense (block_size x block_size x column_block) tiles over the outcomes observed by at
+    least two runs, restricted to the runs that observed any outcome of the tile, which keeps
+    memory bounded and skips the outcomes that cannot contribute.
+
+    Args:
+        sources: Jobs, :class:`~qward.Result` objects, job results or counts mappings
+        metric: One of ``tvd``, ``hellinger_distance`` or ``hellinger_fidelity``
+        block_size: Number of runs per tile side
+        column_block: Number of outcomes per tile
+
+    Returns:
+        np.ndarray: Symmetric N x N matrix of the chosen metric
+
+    Raises:
+        ValueError: If the metric is unknown
+    """
+    if metric not in PAIRWISE_METRICS:
+        raise ValueError(f"Unknown metric {metric!r}, expected one of {PAIRWISE_METRICS}")
+    _, matrix = align_counts([counts_of(source) for source in sources])
+
+    if metric == "tvd":
+        result = np.clip(1.0 - _pairwise_overlap(matrix, block_size, column_block), 0.0, 1.0)
+        np.fill_diagonal(result, 0.0)
+        return result
+
+    root = matrix.sqrt()
+    bhattacharyya = np.clip((root @ root.T).toarray(), 0.0, 1.0)
+    np.fill_diagonal(bhattacharyya, 1.0)
+    if metric == "hellinger_fidelity":
+        return bhattacharyya**2
+    return np.sqrt(1.0 - bhattacharyya)
+
+
+def _pairwise_overlap(matrix: sparse.csr_matrix, block_size: int, column_block: int) -> np.ndarray:
+    """Compute sum(min(p, q)) for all pairs of rows of a sparse distribution matrix."""
+    num_rows = matrix.shape[0]
+    overlap = np.zeros((num_rows, num_rows))
+    columns = matrix.tocsc()
+    # Outcomes observed by a single run never contribute to an overlap
+    columns = columns[:, np.flatnonzero(np.diff(columns.indptr) > 1)]
+
+    for start in range(0, columns.shape[1], column_block):
+        tile = columns[:, start : start + column_block].toarray()
+        active = np.flatnonzero(tile.any(axis=1))
+        tile = tile[active]
+        for i in range(0, len(active), block_size):
+            left = tile[i : i + block_size]
+            rows = active[i : i + block_size]
+            for j in range(i, len(active), block_size):
+                right = tile[j : j + block_size]
+                block = np.minimum(left[:, None, :], right[None, :, :]).sum(axis=2)
+                cols = active[j : j + block_size]
+                overlap[np.ix_(rows, cols)] += block
+                if j != i:
+                    overlap[np.ix_(cols, rows)] += block.T
+    return overlap
@@ -0,0 +1,180 @@
+"""
+Per-layer circuit profile metrics implementation for QWARD.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from qward.metrics.base_metric import Metric
+from qward.metrics.records import LayerProfileRecord
+from qward.metrics.streaming import condition_clbits
+from qward.metrics.types import MetricsType, MetricsId
+
+
+class LayerProfile(Metric):
+    """
+    Class for profiling the parallelism of a circuit layer by layer.
+
+    Every instruction is placed in its as-soon-as-possible layer in a single pass over the
+    (topologically ordered) instructions, keeping the next free layer of every qubit and
+    clbit in a frontier array. The layers are those of ``circuit.depth()``: directives such
+    as barriers take no layer but synchronize their qubits, and measurements and classically
+    conditioned instructions also occupy their clbits. Per-layer instruction, two-qubit and
+    active-qubit counts are then reduced with :func:`numpy.bincount`, so the whole profile
+    is linear in the number of instructions.
+    """
+
+    def __init__(self, circuit: QuantumCircuit):
+        """
+        Initialize a LayerProfile object.
+
+        Args:
+            circuit: The quantum circuit to analyze
+        """
+        super().__init__(circuit)
+        self._layers: Optional[np.ndarray] = None
+        self._num_qubits: Optional[np.ndarray] = None
+
+    def _get_metric_type(self) -> MetricsType:
+        """
+        Get the type of this metric.
+
+        Returns:
+            MetricsType: The type of this metric
+        """
+        return MetricsType.PRE_RUNTIME
+
+    def _get_metric_id(self) -> MetricsId:
+        """
+        Get the ID of this metric.
+
+        Returns:
+            MetricsId: The ID of this metric
+        """
+        return MetricsId.LAYER_PROFILE
+
+    def is_ready(self) -> bool:
+        """
+        Check if the metric is ready to be calculated.
+
+        Returns:
+            bool: True if the metric is ready to be calculated, False otherwise
+        """
+        return self.circuit is not None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the metrics.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the metrics
+        """
+        return self.get_record().to_dict()
+
+    def get_layers(self) -> np.ndarray:
+        """
+        Assign every instruction to its as-soon-as-possible layer.
+
+        Returns:
+            np.ndarray: The layer of every instruction of ``circuit.data`` (-1 for directives)
+        """
+        if self._layers is None:
+            self._sweep()
+        return self._layers
+
+    def get_profile(self) -> Dict[str, np.ndarray]:
+        """
+        Get the per-layer counts.
+
+        Returns:
+            Dict[str, np.ndarray]: One array entry per layer for ``gate_counts`` (number of
+            instructions), ``two_qubit_counts`` (instructions on two qubits) and
+            ``active_qubits`` (qubits used by an instruction of the layer)
+        """
+        layers = self.get_layers()
+        placed = layers >= 0
+        layers = layers[placed]
+        num_qubits = self._num_qubits[placed]
+        num_layers = int(layers.max()) + 1 if len(layers) else 0
+        return {
+            "gate_counts": np.bincount(layers, minlength=num_layers),
+            "two_qubit_counts": np.bincount(layers[num_qubits == 2], minlength=num_layers),
+            "active_qubits": np.bincount(layers, weights=num_qubits, minlength=num_layers).astype(
+                np.int64
+            ),
+        }
+
+    def get_record(self) -> LayerProfileRecord:
+        """
+        Get the metrics as a typed record.
+
+        Returns:
+            LayerProfileRecord: The metrics record
+        """
+        profile = self.get_profile()
+        gates = profile["gate_counts"]
+        two_qubit = profile["two_qubit_counts"]
+        active = profile["active_qubits"]
+        num_layers = len(gates)
+        width = self.circuit.num_qubits
+        if num_layers == 0:
+            return LayerProfileRecord(
+                num_layers=0,
+                mean_gates_per_layer=0.0,
+                max_gates_per_layer=0,
+                mean_active_fraction=0.0,
+                min_active_qubits=0,
+                num_serial_layers=0,
+                num_two_qubit_layers=0,
+                max_two_qubit_per_layer=0,
+                peak_two_qubit_layer=None,
+            )
+        return LayerProfileRecord(
+            num_layers=num_layers,
+            mean_gates_per_layer=float(gates.mean()),
+            max_gates_per_layer=int(gates.max()),
+            mean_active_fraction=float(active.mean() / width) if width else 0.0,
+            min_active_qubits=int(active.min()),
+            num_serial_layers=int(np.count_nonzero(gates == 1)),
+            num_two_qubit_layers=int(np.count_nonzero(two_qubit)),
+            max_two_qubit_per_layer=int(two_qubit.max()),
+            peak_two_qubit_layer=int(np.argmax(two_qubit)) if two_qubit.any() else None,
+        )
+
+    def _sweep(self) -> None:
+        """Place the instructions in layers with one pass over a per-wire frontier."""
+        circuit = self.circuit
+        num_qubits = circuit.num_qubits
+        wire_index = {bit: i for i, bit in enumerate(circuit.qubits)}
+        wire_index.update({bit: num_qubits + i for i, bit in enumerate(circuit.clbits)})
+
+        # Next free layer of every qubit and clbit (clbits come after the qubits); a plain
+        # list is much faster than a NumPy array for the per-instruction scalar accesses
+        frontier = [0] * (num_qubits + circuit.num_clbits)
+        num_instructions = len(circuit.data)
+        layers = np.full(num_instructions, -1, dtype=np.int64)
+        operand_counts = np.zeros(num_instructions, dtype=np.int64)
+
+        for position, instruction in enumerate(circuit.data):
+            operation = instruction.operation
+            directive = getattr(operation, "_directive", False)
+            wires = [wire_index[bit] for bit in instruction.qubits]
+            operand_counts[position] = len(wires)
+            wires.extend(wire_index[bit] for bit in instruction.clbits)
+            wires.extend(wire_index[bit] for bit in condition_clbits(operation))
+            if not wires:
+                continue
+            layer = max([frontier[wire] for wire in wires])
+            if directive:
+                # Directives take no layer but synchronize their wires
+                operand_counts[position] = 0
+            else:
+                layers[position] = layer
+                layer += 1
+            for wire in wires:
+                frontier[wire] = layer
+
+        self._layers = layers
+        self._num_qubits = operand_counts
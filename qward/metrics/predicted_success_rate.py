@@ -0,0 +1,241 @@
+"""
+Predicted success rate metrics implementation for QWARD.
+"""
+
+import warnings
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.providers import BackendV2
+from qiskit.quantum_info import average_gate_fidelity
+from qiskit.transpiler import Target
+from qiskit_aer.noise import NoiseModel, QuantumError
+
+from qward.metrics.base_metric import Metric
+from qward.metrics.records import PredictedSuccessRateRecord
+from qward.metrics.streaming import iter_circuit_instructions
+from qward.metrics.types import MetricsType, MetricsId
+
+# Source of calibration data: an Aer noise model, a target, or a backend with a target
+ErrorSource = Union[NoiseModel, Target, BackendV2]
+
+# Operations that never contribute errors (directives are skipped when counting instructions;
+# idle errors during delays are not gate errors)
+_NOISELESS = frozenset({"delay"})
+
+
+class InstructionErrorRates:
+    """
+    Per-instruction error rates read from a noise model or a target.
+
+    Rates are looked up lazily and cached per ``(name, qubits)``, so the table can be shared
+    between the metrics of many circuits analyzed against the same device. For a target, the
+    reported instruction error (``measure`` is the readout error) is used; for a noise model,
+    the average gate infidelity of the quantum error and the average assignment error of the
+    readout error, both read from :meth:`NoiseModel.to_dict`.
+    """
+
+    def __init__(self, source: ErrorSource):
+        """
+        Initialize an InstructionErrorRates object.
+
+        Args:
+            source: The noise model, target or backend providing the calibration data
+        """
+        if isinstance(source, BackendV2):
+            source = source.target
+        if not isinstance(source, (NoiseModel, Target)):
+            raise ValueError("Error rates need a NoiseModel, a Target or a BackendV2")
+        self._source = source
+        self._cache: Dict[Tuple[str, Tuple[int, ...]], Optional[float]] = {}
+        # Error dictionaries of the noise model keyed by (name, qubits), with None qubits for
+        # errors on all qubits; readout errors are keyed by "measure"
+        self._noise_errors: Optional[Dict[Tuple[str, Optional[Tuple[int, ...]]], dict]] = None
+
+    def error(self, name: str, qubits: Tuple[int, ...]) -> Optional[float]:
+        """
+        Get the error rate of an instruction.
+
+        Args:
+            name: The operation name
+            qubits: The (physical) qubits the operation acts on
+
+        Returns:
+            Optional[float]: The error probability, or None if no calibration data is known
+        """
+        key = (name, qubits)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if name in _NOISELESS:
+            error = 0.0
+        elif isinstance(self._source, Target):
+            error = self._target_error(name, qubits)
+        else:
+            error = self._noise_model_error(name, qubits)
+        self._cache[key] = error
+        return error
+
+    def _target_error(self, name: str, qubits: Tuple[int, ...]) -> Optional[float]:
+        """Look up the error of an instruction in the target."""
+        if name not in self._source.operation_names:
+            return None
+        properties = self._source[name]
+        instruction = properties.get(qubits, properties.get(None))
+        if instruction is None or instruction.error is None:
+            return None
+        return float(instruction.error)
+
+    def _noise_model_error(self, name: str, qubits: Tuple[int, ...]) -> Optional[float]:
+        """Compute the error of an instruction from the noise model."""
+        errors = self._noise_model_errors()
+        error = errors.get((name, qubits), errors.get((name, None)))
+        if error is None:
+            # Basis gates without an attached error are simulated as ideal
+            return 0.0 if name in self._source.basis_gates else None
+        if error["type"] == "roerror":
+            probabilities = np.asarray(error["probabilities"])
+            return float(1.0 - np.mean(np.diag(probabilities)))
+        return float(1.0 - average_gate_fidelity(QuantumError.from_dict(error)))
+
+    def _noise_model_errors(self) -> Dict[Tuple[str, Optional[Tuple[int, ...]]], dict]:
+        """Index the errors of the noise model by instruction name and qubits."""
+        if self._noise_errors is None:
+            with warnings.catch_warnings():
+                # Aer reads the deprecated Instruction.condition while serializing errors
+                warnings.simplefilter("ignore", DeprecationWarning)
+                entries = self._source.to_dict()["errors"]
+            errors = {}
+            for entry in entries:
+                names = entry.get("operations", ["measure"])
+                for qubits in entry.get("gate_qubits", [None]):
+                    key_qubits = None if qubits is None else tuple(qubits)
+                    errors.update({(name, key_qubits): entry for name in names})
+            self._noise_errors = errors
+        return self._noise_errors
+
+
+class PredictedSuccessRate(Metric):
+    """
+    Class for estimating the success probability of a circuit before running it.
+
+    The expected fidelity is the product of ``1 - error`` over all instructions, with gate
+    errors and readout errors taken from a noise model or a target. Instructions are counted
+    by ``(name, qubits)`` in a single pass over the circuit and each distinct instruction is
+    looked up once, so large batches of circuits can be triaged cheaply. The circuit is
+    expected to be transpiled to the device, so its qubit indices are physical qubits.
+    """
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        *,
+        noise_model: Optional[NoiseModel] = None,
+        target: Optional[Union[Target, BackendV2]] = None,
+        error_rates: Optional[InstructionErrorRates] = None,
+    ):
+        """
+        Initialize a PredictedSuccessRate object.
+
+        Args:
+            circuit: The (transpiled) quantum circuit to analyze
+            noise_model: Aer noise model providing the error rates
+            target: Target (or backend) providing the error rates
+            error_rates: Error rate table shared between metrics (takes precedence)
+        """
+        super().__init__(circuit)
+        if error_rates is None and (noise_model is not None or target is not None):
+            error_rates = InstructionErrorRates(noise_model if noise_model is not None else target)
+        self._error_rates = error_rates
+
+    @property
+    def error_rates(self) -> Optional[InstructionErrorRates]:
+        """
+        Get the error rate table.
+
+        Returns:
+            Optional[InstructionErrorRates]: The error rates, if any
+        """
+        return self._error_rates
+
+    def _get_metric_type(self) -> MetricsType:
+        """
+        Get the type of this metric.
+
+        Returns:
+            MetricsType: The type of this metric
+        """
+        return MetricsType.PRE_RUNTIME
+
+    def _get_metric_id(self) -> MetricsId:
+        """
+        Get the ID of this metric.
+
+        Returns:
+            MetricsId: The ID of this metric
+        """
+        return MetricsId.PREDICTED_SUCCESS_RATE
+
+    def is_ready(self) -> bool:
+        """
+        Check if the metric is ready to be calculated.
+
+        Returns:
+            bool: True if the metric is ready to be calculated, False otherwise
+        """
+        return self.circuit is not None and self._error_rates is not None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the metrics.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the metrics
+        """
+        return self.get_record().to_dict()
+
+    def get_record(self) -> PredictedSuccessRateRecord:
+        """
+        Get the metrics as a typed record.
+
+        Returns:
+            PredictedSuccessRateRecord: The metrics record
+        """
+        if self._error_rates is None:
+            raise ValueError("A noise model or a target is needed to predict the success rate")
+
+        occurrences = Counter(
+            (name, tuple(qubits))
+            for name, qubits, _, directive in iter_circuit_instructions(self.circuit)
+            if not directive
+        )
+
+        log_gate_fidelity = 0.0
+        log_readout_fidelity = 0.0
+        expected_errors = 0.0
+        uncalibrated = 0
+        for (name, qubits), count in occurrences.items():
+            error = self._error_rates.error(name, qubits)
+            if error is None:
+                uncalibrated += count
+                continue
+            expected_errors += count * error
+            log_fidelity = count * np.log1p(-error) if error < 1.0 else -np.inf
+            if name == "measure":
+                log_readout_fidelity += log_fidelity
+            else:
+                log_gate_fidelity += log_fidelity
+
+        gate_fidelity = float(np.exp(log_gate_fidelity))
+        readout_fidelity = float(np.exp(log_readout_fidelity))
+        return PredictedSuccessRateRecord(
+            predicted_success_rate=gate_fidelity * readout_fidelity,
+            gate_fidelity=gate_fidelity,
+            readout_fidelity=readout_fidelity,
+            expected_errors=float(expected_errors),
+            num_instructions=sum(occurrences.values()),
+            num_uncalibrated=uncalibrated,
+        )
@@ -2,21 +2,68 @@
 Qiskit metrics implementation for QWARD.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-from qward.metrics.base_metric import Metric
+from qiskit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction
+
+from qward.metrics.records import QiskitMetricsRecord
+from qward.metrics.scheduling import CircuitSchedule
+from qward.metrics.streaming import CircuitStats, StreamingMetric
 from qward.metrics.types import MetricsType, MetricsId
-from qward.utils.flatten import flatten_dict
 
 
-class QiskitMetrics(Metric):
+class QiskitMetrics(StreamingMetric):
     """
     Class for extracting metrics from QuantumCircuit objects.
 
     This class provides methods for analyzing quantum circuits and extracting
     various metrics that are directly available from the QuantumCircuit class.
+
+    When created from streamed :class:`~qward.metrics.streaming.CircuitStats` (see
+    ``from_instructions`` and ``from_file``), only the structural counts are reported:
+    metrics that need the circuit object itself (parameters, ancillas, calibrations,
+    layout, instruction lists and scheduling) are omitted.
+
+    With ``incremental=True`` the metrics are maintained with running state and updated with
+    the instructions appended to the circuit since the previous calculation.
     """
 
+    def __init__(
+        self,
+        circuit: Optional[QuantumCircuit] = None,
+        *,
+        stats: Optional[CircuitStats] = None,
+        incremental: bool = False,
+    ):
+        """
+        Initialize a QiskitMetrics object.
+
+        Args:
+            circuit: The quantum circuit to analyze
+            stats: Precomputed (or streamed) statistics of the circuit
+            incremental: Track the circuit incrementally (see ``update``)
+        """
+        super().__init__(circuit, stats=stats, incremental=incremental)
+        self._instructions: Dict[str, List[CircuitInstruction]] = {}
+
+    def _reset_incremental_state(self) -> None:
+        """Drop the running instruction lists before the statistics are rebuilt."""
+        self._instructions = {}
+
+    def _on_instructions_appended(self, start: int, stop: int) -> None:
+        """
+        Append the newly consumed circuit instructions to the running instruction lists.
+
+        Args:
+            start: Index of the first newly consumed circuit instruction
+            stop: Index past the last newly consumed circuit instruction
+        """
+        data = self.circuit.data
+        for position in range(start, stop):
+            instruction = data[position]
+            self._instructions.setdefault(instruction.operation.name, []).append(instruction)
+
     def _get_metric_type(self) -> MetricsType:
         """
         Get the type of this metric.
@@ -35,39 +82,27 @@ class QiskitMetrics(Metric):
         """
         return MetricsId.QISKIT
 
-    def is_ready(self) -> bool:
+    def get_metrics(self) -> Dict[str, Any]:
         """
-        Check if the metric is ready to be calculated.
+        Get the metrics, flattening nested dictionaries for DataFrame compatibility.
 
         Returns:
-            bool: True if the metric is ready to be calculated, False otherwise
+            Dict[str, Any]: Dictionary containing the metrics (flattened)
         """
-        return self.circuit is not None
+        return self.get_record().to_dict()
 
-    def get_metrics(self) -> Dict[str, Any]:
+    def get_record(self) -> QiskitMetricsRecord:
         """
-        Get the metrics, flattening nested dictionaries for DataFrame compatibility.
+        Get the metrics as a typed record.
 
         Returns:
-            Dict[str, Any]: Dictionary containing the metrics (flattened)
+            QiskitMetricsRecord: The metrics record
         """
-        metrics = {
-            "basic_metrics": self.get_basic_metrics(),
-            "instruction_metrics": self.get_instruction_metrics(),
-            "scheduling_metrics": self.get_scheduling_metrics(),
-        }
-        # Flatten nested dicts for count_ops and instructions
-        to_flatten = {}
-        if "count_ops" in metrics["basic_metrics"]:
-            count_ops = metrics["basic_metrics"].pop("count_ops")
-            to_flatten.update({"basic_metrics.count_ops": count_ops})
-        if "instructions" in metrics["instruction_metrics"]:
-            instructions = metrics["instruction_metrics"].pop("instructions")
-            to_flatten.update({"instruction_metrics.instructions": instructions})
-        # Flatten and merge
-        flat_metrics = flatten_dict(metrics)
-        flat_metrics.update(flatten_dict(to_flatten))
-        return flat_metrics
+        return QiskitMetricsRecord(
+            **self.get_basic_metrics(),
+            **self.get_instruction_metrics(),
+            **self.get_scheduling_metrics(),
+        )
 
     def get_basic_metrics(self) -> Dict[str, Any]:
         """
@@ -76,20 +111,28 @@ class QiskitMetrics(Metric):
         Returns:
             Dict[str, Any]: Dictionary containing basic metrics
         """
+        source = self._source
+        metrics = {
+            "depth": source.depth(),
+            "width": source.width(),
+            "size": source.size(),
+            "count_ops": source.count_ops(),
+            "num_qubits": source.num_qubits,
+            "num_clbits": source.num_clbits,
+        }
+
         circuit = self.circuit
+        if circuit is not None:
+            metrics.update(
+                {
+                    "num_ancillas": circuit.num_ancillas,
+                    "num_parameters": circuit.num_parameters,
+                    "has_calibrations": bool(circuit.calibrations),
+                    "has_layout": bool(circuit.layout),
+                }
+            )
 
-        return {
-            "depth": circuit.depth(),
-            "width": circuit.width(),
-            "size": circuit.size(),
-            "count_ops": circuit.count_ops(),
-            "num_qubits": circuit.num_qubits,
-            "num_clbits": circuit.num_clbits,
-            "num_ancillas": circuit.num_ancillas,
-            "num_parameters": circuit.num_parameters,
-            "has_calibrations": bool(circuit.calibrations),
-            "has_layout": bool(circuit.layout),
-        }
+        return metrics
 
     def get_instruction_metrics(self) -> Dict[str, Any]:
         """
@@ -98,42 +141,62 @@ class QiskitMetrics(Metric):
         Returns:
             Dict[str, Any]: Dictionary containing instruction metrics
         """
+        source = self._source
+        metrics = {
+            "num_connected_components": source.num_connected_components(),
+            "num_nonlocal_gates": source.num_nonlocal_gates(),
+            "num_tensor_factors": source.num_tensor_factors(),
+            "num_unitary_factors": source.num_unitary_factors(),
+        }
+
         circuit = self.circuit
+        if self.incremental:
+            instructions = {name: self._instructions[name] for name in source.count_ops()}
+            metrics = {"instructions": instructions, **metrics}
+        elif circuit is not None:
+            instructions = {}
+            for name in circuit.count_ops().keys():
+                instructions[name] = circuit.get_instructions(name)
+            metrics = {"instructions": instructions, **metrics}
 
-        instructions = {}
-        for name in circuit.count_ops().keys():
-            instructions[name] = circuit.get_instructions(name)
+        return metrics
 
-        return {
-            "instructions": instructions,
-            "num_connected_components": circuit.num_connected_components(),
-            "num_nonlocal_gates": circuit.num_nonlocal_gates(),
-            "num_tensor_factors": circuit.num_tensor_factors(),
-            "num_unitary_factors": circuit.num_unitary_factors(),
-        }
+    def get_schedule(self) -> Optional[CircuitSchedule]:
+        """
+        Get the schedule of the circuit as NumPy arrays.
+
+        Returns:
+            Optional[CircuitSchedule]: The start times, durations and qubits of the
+            instructions, or None if the circuit is not scheduled
+        """
+        return CircuitSchedule.from_circuit(self.circuit)
 
     def get_scheduling_metrics(self) -> Dict[str, Any]:
         """
         Get metrics about the scheduling of the circuit.
         If the circuit is not scheduled, returns a dictionary with is_scheduled=False.
 
+        The per-qubit idle times and busy fractions are reported for the qubits with at least
+        one non-delay instruction; the raw per-instruction arrays are available from
+        ``get_schedule``.
+
         Returns:
             Dict[str, Any]: Dictionary containing scheduling metrics
         """
-        circuit = self.circuit
-        metrics = {"is_scheduled": False}
-
-        # Check if circuit is scheduled by checking if op_start_times is not None
-        if hasattr(circuit, "op_start_times") and circuit.op_start_times is not None:
-            metrics.update(
-                {
-                    "is_scheduled": True,
-                    "layout": circuit.layout,
-                    "op_start_times": circuit.op_start_times,
-                    "qubit_duration": circuit.qubit_duration,
-                    "qubit_start_time": circuit.qubit_start_time,
-                    "qubit_stop_time": circuit.qubit_stop_time,
-                }
-            )
+        schedule = self.get_schedule()
+        if schedule is None:
+            return {"is_scheduled": False}
 
-        return metrics
+        active = schedule.active_qubits
+        idle_time = schedule.qubit_idle_time[active]
+        busy_fraction = schedule.qubit_busy_fraction[active]
+        return {
+            "is_scheduled": True,
+            "layout": self.circuit.layout,
+            "time_unit": schedule.unit,
+            "schedule_length": schedule.length,
+            "mean_busy_fraction": float(busy_fraction.mean()) if len(active) else 0.0,
+            "max_idle_time": float(idle_time.max()) if len(active) else 0.0,
+            "qubit_idle_time": dict(zip(map(str, active.tolist()), idle_time.tolist())),
+            "qubit_busy_fraction": dict(zip(map(str, active.tolist()), busy_fraction.tolist())),
+        }
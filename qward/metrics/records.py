@@ -0,0 +1,527 @@
+"""
+Typed metric result records for QWARD.
+
+Each metric produces a compact, ``__slots__``-based record with a fixed field order per
+:class:`~qward.metrics.types.MetricsId`. Records convert cheaply to tuples, NumPy arrays and
+DataFrames for columnar assembly; the nested dictionaries returned by ``get_metrics()`` are
+derived from them as a compatibility view.
+"""
+
+from numbers import Number
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# (field name, column path) pairs describing the schema of each record type
+Schema = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+def _schema(*columns: Tuple[str, str]) -> Schema:
+    """Build a schema from (field name, dotted column name) pairs."""
+    return tuple((name, tuple(column.split("."))) for name, column in columns)
+
+
+class MetricRecord:
+    """
+    Base class for typed metric results.
+
+    Subclasses declare their ``SCHEMA`` as ``(field, column path)`` pairs and matching
+    ``__slots__``. Fields whose value is ``None`` are not available for the analyzed circuit
+    and are omitted from the dictionary view.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    #: Field names and their column paths, in field order
+    SCHEMA: ClassVar[Schema] = ()
+    #: Mapping-valued fields that are expanded into one column per key in tabular output
+    EXPANDED: ClassVar[FrozenSet[str]] = frozenset()
+    #: Whether the dictionary view nests along the column paths (otherwise dotted keys)
+    NESTED: ClassVar[bool] = True
+
+    def __init__(self, **values: Any):
+        """
+        Initialize a MetricRecord object.
+
+        Args:
+            **values: Field values; missing fields default to None
+
+        Raises:
+            TypeError: If a value is given for an unknown field
+        """
+        for name in self.__slots__:
+            setattr(self, name, values.pop(name, None))
+        if values:
+            raise TypeError(
+                f"Unknown fields for {self.__class__.__name__}: {', '.join(sorted(values))}"
+            )
+
+    @classmethod
+    def fields(cls) -> Tuple[str, ...]:
+        """
+        Get the field names in their fixed order.
+
+        Returns:
+            Tuple[str, ...]: The field names
+        """
+        return tuple(name for name, _ in cls.SCHEMA)
+
+    @classmethod
+    def columns(cls) -> Tuple[str, ...]:
+        """
+        Get the dotted column names of the fields in their fixed order.
+
+        Returns:
+            Tuple[str, ...]: The column names
+        """
+        return tuple(".".join(path) for _, path in cls.SCHEMA)
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert the record to a tuple in field order.
+
+        Returns:
+            Tuple[Any, ...]: The field values
+        """
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Convert the numeric fields of the record to a float array in field order.
+
+        Non-numeric and unavailable fields are skipped.
+
+        Returns:
+            np.ndarray: The numeric field values
+        """
+        values = [
+            value
+            for value in self.to_tuple()
+            if isinstance(value, Number) and not isinstance(value, complex)
+        ]
+        return np.array(values, dtype=float)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to its dictionary view (as returned by ``get_metrics()``).
+
+        Returns:
+            Dict[str, Any]: The dictionary view
+        """
+        result: Dict[str, Any] = {}
+        expanded: List[Tuple[str, Dict[str, Any]]] = []
+        for (name, path), value in zip(self.SCHEMA, self.to_tuple()):
+            if value is None:
+                continue
+            value = _to_view(value)
+            if not self.NESTED:
+                column = ".".join(path)
+                if name in self.EXPANDED:
+                    expanded.append((column, value))
+                else:
+                    result[column] = value
+                continue
+            node = result
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+            node[path[-1]] = value
+        for column, mapping in expanded:
+            for key, value in mapping.items():
+                result[f"{column}.{key}"] = value
+        return result
+
+    def to_frames(self) -> Dict[str, pd.DataFrame]:
+        """
+        Convert the record to DataFrames keyed by table suffix.
+
+        Returns:
+            Dict[str, pd.DataFrame]: A single-row DataFrame under the empty suffix
+        """
+        return {"": self.to_frame([self])}
+
+    @classmethod
+    def to_frame(cls, records: Sequence["MetricRecord"]) -> pd.DataFrame:
+        """
+        Assemble records of this type into a DataFrame, one row per record.
+
+        Scalar fields are assembled column-wise from the record tuples; fields listed in
+        ``EXPANDED`` contribute one column per key.
+
+        Args:
+            records: The records
+
+        Returns:
+            pd.DataFrame: The assembled DataFrame
+        """
+        columns = cls.columns()
+        rows = [record.to_tuple() for record in records]
+        data: Dict[str, Any] = {}
+        for position, (column, values) in enumerate(
+            zip(columns, zip(*rows) if rows else [()] * len(columns))
+        ):
+            name = cls.SCHEMA[position][0]
+            if name in cls.EXPANDED:
+                data.update(_expand_column(column, values))
+            elif any(value is not None for value in values) or not rows:
+                data[column] = list(values)
+        return pd.DataFrame(data, index=range(len(rows)))
+
+
+def _to_view(value: Any) -> Any:
+    """Convert nested records to their dictionary view."""
+    if isinstance(value, MetricRecord):
+        return value.to_dict()
+    if isinstance(value, list) and value and isinstance(value[0], MetricRecord):
+        return [item.to_dict() for item in value]
+    return value
+
+
+def _expand_column(column: str, mappings: Iterable[Optional[Dict[str, Any]]]) -> Dict[str, list]:
+    """Expand a column of mappings into one column per key (missing keys become None)."""
+    mappings = list(mappings)
+    keys: Dict[str, None] = {}
+    for mapping in mappings:
+        if mapping:
+            keys.update(dict.fromkeys(mapping))
+    return {
+        f"{column}.{key}": [mapping.get(key) if mapping else None for mapping in mappings]
+        for key in keys
+    }
+
+
+_QISKIT_SCHEMA = _schema(
+    ("depth", "basic_metrics.depth"),
+    ("width", "basic_metrics.width"),
+    ("size", "basic_metrics.size"),
+    ("num_qubits", "basic_metrics.num_qubits"),
+    ("num_clbits", "basic_metrics.num_clbits"),
+    ("num_ancillas", "basic_metrics.num_ancillas"),
+    ("num_parameters", "basic_metrics.num_parameters"),
+    ("has_calibrations", "basic_metrics.has_calibrations"),
+    ("has_layout", "basic_metrics.has_layout"),
+    ("num_connected_components", "instruction_metrics.num_connected_components"),
+    ("num_nonlocal_gates", "instruction_metrics.num_nonlocal_gates"),
+    ("num_tensor_factors", "instruction_metrics.num_tensor_factors"),
+    ("num_unitary_factors", "instruction_metrics.num_unitary_factors"),
+    ("is_scheduled", "scheduling_metrics.is_scheduled"),
+    ("layout", "scheduling_metrics.layout"),
+    ("time_unit", "scheduling_metrics.time_unit"),
+    ("schedule_length", "scheduling_metrics.schedule_length"),
+    ("mean_busy_fraction", "scheduling_metrics.mean_busy_fraction"),
+    ("max_idle_time", "scheduling_metrics.max_idle_time"),
+    ("count_ops", "basic_metrics.count_ops"),
+    ("instructions", "instruction_metrics.instructions"),
+    ("qubit_idle_time", "scheduling_metrics.qubit_idle_time"),
+    ("qubit_busy_fraction", "scheduling_metrics.qubit_busy_fraction"),
+)
+
+
+class QiskitMetricsRecord(MetricRecord):
+    """Typed result of :class:`~qward.metrics.QiskitMetrics` (``MetricsId.QISKIT``)."""
+
+    __slots__ = tuple(name for name, _ in _QISKIT_SCHEMA)
+    SCHEMA = _QISKIT_SCHEMA
+    EXPANDED = frozenset({"count_ops", "instructions", "qubit_idle_time", "qubit_busy_fraction"})
+    NESTED = False
+
+
+_COMPLEXITY_SCHEMA = _schema(
+    ("gate_count", "gate_based_metrics.gate_count"),
+    ("circuit_depth", "gate_based_metrics.circuit_depth"),
+    ("t_count", "gate_based_metrics.t_count"),
+    ("cnot_count", "gate_based_metrics.cnot_count"),
+    ("two_qubit_count", "gate_based_metrics.two_qubit_count"),
+    ("multi_qubit_ratio", "gate_based_metrics.multi_qubit_ratio"),
+    ("entangling_gate_density", "entanglement_metrics.entangling_gate_density"),
+    ("entangling_width", "entanglement_metrics.entangling_width"),
+    ("circuit_volume", "standardized_metrics.circuit_volume"),
+    ("gate_density", "standardized_metrics.gate_density"),
+    ("clifford_ratio", "standardized_metrics.clifford_ratio"),
+    ("non_clifford_ratio", "standardized_metrics.non_clifford_ratio"),
+    ("parallelism_factor", "advanced_metrics.parallelism_factor"),
+    ("parallelism_efficiency", "advanced_metrics.parallelism_efficiency"),
+    ("circuit_efficiency", "advanced_metrics.circuit_efficiency"),
+    ("quantum_resource_utilization", "advanced_metrics.quantum_resource_utilization"),
+    ("square_ratio", "derived_metrics.square_ratio"),
+    ("weighted_complexity", "derived_metrics.weighted_complexity"),
+    ("normalized_weighted_complexity", "derived_metrics.normalized_weighted_complexity"),
+    ("standard_quantum_volume", "quantum_volume.standard_quantum_volume"),
+    ("enhanced_quantum_volume", "quantum_volume.enhanced_quantum_volume"),
+    ("effective_depth", "quantum_volume.effective_depth"),
+    ("qv_square_ratio", "quantum_volume.factors.square_ratio"),
+    ("qv_circuit_density", "quantum_volume.factors.circuit_density"),
+    ("qv_multi_qubit_ratio", "quantum_volume.factors.multi_qubit_ratio"),
+    ("qv_connectivity_factor", "quantum_volume.factors.connectivity_factor"),
+    ("qv_enhancement_factor", "quantum_volume.factors.enhancement_factor"),
+    ("qv_depth", "quantum_volume.circuit_metrics.depth"),
+    ("qv_width", "quantum_volume.circuit_metrics.width"),
+    ("qv_size", "quantum_volume.circuit_metrics.size"),
+    ("qv_num_qubits", "quantum_volume.circuit_metrics.num_qubits"),
+    ("operation_counts", "quantum_volume.circuit_metrics.operation_counts"),
+)
+
+
+class ComplexityMetricsRecord(MetricRecord):
+    """Typed result of :class:`~qward.metrics.ComplexityMetrics` (``MetricsId.COMPLEXITY``)."""
+
+    __slots__ = tuple(name for name, _ in _COMPLEXITY_SCHEMA)
+    SCHEMA = _COMPLEXITY_SCHEMA
+    EXPANDED = frozenset({"operation_counts"})
+
+    @classmethod
+    def from_dict(cls, metrics: Dict[str, Any]) -> "ComplexityMetricsRecord":
+        """
+        Build a record from the nested metrics dictionary.
+
+        Args:
+            metrics: The nested metrics, as returned by ``ComplexityMetrics.get_metrics()``
+
+        Returns:
+            ComplexityMetricsRecord: The record
+        """
+        values = {}
+        for name, path in cls.SCHEMA:
+            node: Any = metrics
+            for key in path:
+                node = node[key]
+            values[name] = node
+        return cls(**values)
+
+
+_SUCCESS_RATE_JOB_SCHEMA = _schema(
+    ("job_id", "job_id"),
+    ("success_rate", "success_rate"),
+    ("error_rate", "error_rate"),
+    ("fidelity", "fidelity"),
+    ("total_shots", "total_shots"),
+    ("successful_shots", "successful_shots"),
+    ("wilson_low", "wilson_low"),
+    ("wilson_high", "wilson_high"),
+    ("clopper_pearson_low", "clopper_pearson_low"),
+    ("clopper_pearson_high", "clopper_pearson_high"),
+    ("bootstrap_low", "bootstrap_low"),
+    ("bootstrap_high", "bootstrap_high"),
+    ("mitigated_success_rate", "mitigated_success_rate"),
+    ("bit_error_rates", "bit_error_rates"),
+    ("average_counts", "average_counts"),
+)
+
+
+class SuccessRateJobRecord(MetricRecord):
+    """Typed per-job result of :class:`~qward.metrics.SuccessRate`."""
+
+    __slots__ = tuple(name for name, _ in _SUCCESS_RATE_JOB_SCHEMA)
+    SCHEMA = _SUCCESS_RATE_JOB_SCHEMA
+    EXPANDED = frozenset({"bit_error_rates"})
+    NESTED = False
+
+
+_SUCCESS_RATE_AGGREGATE_SCHEMA = _schema(
+    ("mean_success_rate", "mean_success_rate"),
+    ("std_success_rate", "std_success_rate"),
+    ("min_success_rate", "min_success_rate"),
+    ("max_success_rate", "max_success_rate"),
+    ("total_trials", "total_trials"),
+    ("fidelity", "fidelity"),
+    ("error_rate", "error_rate"),
+    ("pooled_success_rate", "pooled_success_rate"),
+    ("wilson_low", "wilson_low"),
+    ("wilson_high", "wilson_high"),
+    ("clopper_pearson_low", "clopper_pearson_low"),
+    ("clopper_pearson_high", "clopper_pearson_high"),
+    ("bootstrap_low", "bootstrap_low"),
+    ("bootstrap_high", "bootstrap_high"),
+    ("mean_mitigated_success_rate", "mean_mitigated_success_rate"),
+    ("bit_error_rates", "bit_error_rates"),
+)
+
+
+class SuccessRateAggregateRecord(MetricRecord):
+    """
+    Typed aggregate result of :class:`~qward.metrics.SuccessRate` across jobs.
+
+    The Wilson and Clopper-Pearson intervals refer to the pooled success rate (all shots of
+    all jobs), the bootstrap interval to the mean success rate across jobs. The bit error
+    rates are pooled over all shots.
+    """
+
+    __slots__ = tuple(name for name, _ in _SUCCESS_RATE_AGGREGATE_SCHEMA)
+    SCHEMA = _SUCCESS_RATE_AGGREGATE_SCHEMA
+    EXPANDED = frozenset({"bit_error_rates"})
+    NESTED = False
+
+
+class SuccessRateRecord(MetricRecord):
+    """Typed result of :class:`~qward.metrics.SuccessRate` (``MetricsId.SUCCESS_RATE``)."""
+
+    __slots__ = ("individual_jobs", "aggregate")
+    SCHEMA = _schema(("individual_jobs", "individual_jobs"), ("aggregate", "aggregate"))
+
+    def to_frames(self) -> Dict[str, pd.DataFrame]:
+        """
+        Convert the record to DataFrames keyed by table suffix.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The per-job rows under ``individual_jobs`` and the
+            aggregate row under ``aggregate``
+        """
+        return {
+            "individual_jobs": SuccessRateJobRecord.to_frame(self.individual_jobs),
+            "aggregate": SuccessRateAggregateRecord.to_frame([self.aggregate]),
+        }
+
+
+_DISTRIBUTION_DISTANCE_JOB_SCHEMA = _schema(
+    ("job_id", "job_id"),
+    ("total_shots", "total_shots"),
+    ("num_outcomes", "num_outcomes"),
+    ("tvd", "tvd"),
+    ("hellinger_distance", "hellinger_distance"),
+    ("hellinger_fidelity", "hellinger_fidelity"),
+    ("kl_divergence", "kl_divergence"),
+)
+
+
+class DistributionDistanceJobRecord(MetricRecord):
+    """Typed per-job result of :class:`~qward.metrics.DistributionDistance`."""
+
+    __slots__ = tuple(name for name, _ in _DISTRIBUTION_DISTANCE_JOB_SCHEMA)
+    SCHEMA = _DISTRIBUTION_DISTANCE_JOB_SCHEMA
+    NESTED = False
+
+
+_DISTRIBUTION_DISTANCE_AGGREGATE_SCHEMA = _schema(
+    ("num_jobs", "num_jobs"),
+    ("reference_outcomes", "reference_outcomes"),
+    ("mean_tvd", "mean_tvd"),
+    ("max_tvd", "max_tvd"),
+    ("mean_hellinger_fidelity", "mean_hellinger_fidelity"),
+    ("min_hellinger_fidelity", "min_hellinger_fidelity"),
+    ("mean_kl_divergence", "mean_kl_divergence"),
+)
+
+
+class DistributionDistanceAggregateRecord(MetricRecord):
+    """Typed aggregate result of :class:`~qward.metrics.DistributionDistance` across jobs."""
+
+    __slots__ = tuple(name for name, _ in _DISTRIBUTION_DISTANCE_AGGREGATE_SCHEMA)
+    SCHEMA = _DISTRIBUTION_DISTANCE_AGGREGATE_SCHEMA
+    NESTED = False
+
+
+class DistributionDistanceRecord(MetricRecord):
+    """
+    Typed result of :class:`~qward.metrics.DistributionDistance`
+    (``MetricsId.DISTRIBUTION_DISTANCE``).
+    """
+
+    __slots__ = ("individual_jobs", "aggregate")
+    SCHEMA = _schema(("individual_jobs", "individual_jobs"), ("aggregate", "aggregate"))
+
+    def to_frames(self) -> Dict[str, pd.DataFrame]:
+        """
+        Convert the record to DataFrames keyed by table suffix.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The per-job rows under ``individual_jobs`` and the
+            aggregate row under ``aggregate``
+        """
+        return {
+            "individual_jobs": DistributionDistanceJobRecord.to_frame(self.individual_jobs),
+            "aggregate": DistributionDistanceAggregateRecord.to_frame([self.aggregate]),
+        }
+
+
+_PREDICTED_SUCCESS_RATE_SCHEMA = _schema(
+    ("predicted_success_rate", "predicted_success_rate"),
+    ("gate_fidelity", "gate_fidelity"),
+    ("readout_fidelity", "readout_fidelity"),
+    ("expected_errors", "expected_errors"),
+    ("num_instructions", "num_instructions"),
+    ("num_uncalibrated", "num_uncalibrated"),
+)
+
+
+class PredictedSuccessRateRecord(MetricRecord):
+    """
+    Typed result of :class:`~qward.metrics.PredictedSuccessRate`
+    (``MetricsId.PREDICTED_SUCCESS_RATE``).
+    """
+
+    __slots__ = tuple(name for name, _ in _PREDICTED_SUCCESS_RATE_SCHEMA)
+    SCHEMA = _PREDICTED_SUCCESS_RATE_SCHEMA
+    NESTED = False
+
+
+_SHOT_DRIFT_SCHEMA = _schema(
+    ("num_shots", "num_shots"),
+    ("window", "window"),
+    ("num_windows", "num_windows"),
+    ("success_rate", "success_rate"),
+    ("min_window_rate", "min_window_rate"),
+    ("max_window_rate", "max_window_rate"),
+    ("std_window_rate", "std_window_rate"),
+    ("max_deviation", "max_deviation"),
+    ("slope", "slope"),
+    ("slope_p_value", "slope_p_value"),
+    ("chi2", "chi2"),
+    ("chi2_p_value", "chi2_p_value"),
+    ("drift_detected", "drift_detected"),
+)
+
+
+class ShotDriftRecord(MetricRecord):
+    """
+    Typed result of :class:`~qward.metrics.ShotDrift` (``MetricsId.SHOT_DRIFT``).
+    """
+
+    __slots__ = tuple(name for name, _ in _SHOT_DRIFT_SCHEMA)
+    SCHEMA = _SHOT_DRIFT_SCHEMA
+    NESTED = False
+
+
+_CRITICAL_PATH_SCHEMA = _schema(
+    ("critical_path_length", "critical_path_length"),
+    ("critical_path_length_dt", "critical_path_length_dt"),
+    ("num_critical_instructions", "num_critical_instructions"),
+    ("mean_qubit_slack", "mean_qubit_slack"),
+    ("max_qubit_slack", "max_qubit_slack"),
+    ("mean_busy_fraction", "mean_busy_fraction"),
+    ("num_uncalibrated", "num_uncalibrated"),
+    ("qubit_slack", "qubit_slack"),
+)
+
+
+class CriticalPathRecord(MetricRecord):
+    """
+    Typed result of :class:`~qward.metrics.CriticalPath` (``MetricsId.CRITICAL_PATH``).
+    """
+
+    __slots__ = tuple(name for name, _ in _CRITICAL_PATH_SCHEMA)
+    SCHEMA = _CRITICAL_PATH_SCHEMA
+    EXPANDED = frozenset({"qubit_slack"})
+    NESTED = False
+
+
+_LAYER_PROFILE_SCHEMA = _schema(
+    ("num_layers", "num_layers"),
+    ("mean_gates_per_layer", "mean_gates_per_layer"),
+    ("max_gates_per_layer", "max_gates_per_layer"),
+    ("mean_active_fraction", "mean_active_fraction"),
+    ("min_active_qubits", "min_active_qubits"),
+    ("num_serial_layers", "num_serial_layers"),
+    ("num_two_qubit_layers", "num_two_qubit_layers"),
+    ("max_two_qubit_per_layer", "max_two_qubit_per_layer"),
+    ("peak_two_qubit_layer", "peak_two_qubit_layer"),
+)
+
+
+class LayerProfileRecord(MetricRecord):
+    """
+    Typed result of :class:`~qward.metrics.LayerProfile` (``MetricsId.LAYER_PROFILE``).
+    """
+
+    __slots__ = tuple(name for name, _ in _LAYER_PROFILE_SCHEMA)
+    SCHEMA = _LAYER_PROFILE_SCHEMA
+    NESTED = False
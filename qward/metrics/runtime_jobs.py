@@ -0,0 +1,154 @@
+"""
+Job collection shared by the post-runtime metrics of QWARD.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from qiskit_aer import AerJob
+from qiskit.providers.job import JobV1 as QiskitJob
+
+RuntimeJob = Union[AerJob, QiskitJob]
+
+
+class RuntimeJobsMixin:
+    """
+    Mixin keeping the jobs of a post-runtime metric.
+
+    Jobs are keyed by their ``job_id()`` (or by identity if they have none) in insertion
+    order, so duplicates are dropped and adding N jobs takes linear time. The result of every
+    job is fetched at most once, by :meth:`job_result`.
+    """
+
+    _runtime_jobs: "OrderedDict[Any, RuntimeJob]"
+    _job_results: Dict[Any, Any]
+
+    def _init_runtime_jobs(
+        self, job: Optional[RuntimeJob] = None, jobs: Optional[Iterable[RuntimeJob]] = None
+    ) -> None:
+        """
+        Initialize the jobs from the ``job`` and ``jobs`` constructor arguments.
+
+        Args:
+            job: A single job (used if ``jobs`` is empty)
+            jobs: The jobs
+        """
+        self._runtime_jobs = OrderedDict()
+        self._job_results = {}
+        self.add_jobs(jobs if jobs else ([job] if job else []))
+
+    @property
+    def runtime_jobs(self) -> List[RuntimeJob]:
+        """
+        Get the jobs used for the metrics, in insertion order.
+
+        Returns:
+            List[RuntimeJob]: The jobs
+        """
+        return list(self._runtime_jobs.values())
+
+    @runtime_jobs.setter
+    def runtime_jobs(self, jobs: Iterable[RuntimeJob]) -> None:
+        """
+        Replace the jobs used for the metrics.
+
+        Args:
+            jobs: The new jobs (duplicates are dropped)
+        """
+        self._runtime_jobs = OrderedDict()
+        self._job_results = {}
+        self.add_jobs(jobs)
+
+    def job_result(self, job: RuntimeJob) -> Any:
+        """
+        Get the result of a job, fetching it only once for the jobs of the metric.
+
+        Args:
+            job: The job (results and counts given in place of jobs are returned as they are)
+
+        Returns:
+            Any: The result of ``job.result()``
+        """
+        if not hasattr(job, "result"):
+            return job
+        key = job_key(job)
+        if key not in self._runtime_jobs:
+            return job.result()
+        try:
+            return self._job_results[key]
+        except KeyError:
+            result = self._job_results[key] = job.result()
+            return result
+
+    def add_job(self, job: Union[RuntimeJob, List[RuntimeJob]]) -> None:
+        """
+        Add one or more jobs.
+
+        Args:
+            job: A single job or a list of jobs to add
+        """
+        if isinstance(job, list):
+            self.add_jobs(job)
+        else:
+            self.add_jobs([job])
+
+    def add_jobs(self, jobs: Iterable[RuntimeJob]) -> None:
+        """
+        Add jobs, skipping jobs that were already added.
+
+        Any iterable is accepted, including generators, which are consumed lazily.
+
+        Args:
+            jobs: The jobs to add
+        """
+        runtime_jobs = self._runtime_jobs
+        for job in jobs:
+            key = job_key(job)
+            if key not in runtime_jobs:
+                runtime_jobs[key] = job
+                self._job_added(job)
+
+    def _job_added(self, job: RuntimeJob) -> None:
+        """
+        Hook called for every newly added job.
+
+        Args:
+            job: The added job
+        """
+
+    def _job_ids(self) -> List[str]:
+        """
+        Get the labels of the jobs, in insertion order.
+
+        Returns:
+            List[str]: The job ids, or the positions of jobs without an id
+        """
+        return [job_label(job, i) for i, job in enumerate(self._runtime_jobs.values())]
+
+
+def job_key(job: RuntimeJob) -> Any:
+    """
+    Get the key identifying a job.
+
+    Args:
+        job: The job
+
+    Returns:
+        Any: The job id, or the object identity if the job has no id
+    """
+    job_id = getattr(job, "job_id", None)
+    return job_id() if callable(job_id) else id(job)
+
+
+def job_label(job: RuntimeJob, index: int) -> str:
+    """
+    Get the label of a job in the metric records.
+
+    Args:
+        job: The job
+        index: Position of the job, used if it has no id
+
+    Returns:
+        str: The job id, or the position of the job
+    """
+    return job.job_id() if hasattr(job, "job_id") else str(index)
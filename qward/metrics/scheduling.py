@@ -0,0 +1,181 @@
+"""
+Array representation of the schedule of a scheduled circuit.
+
+A scheduled circuit (transpiled with a ``scheduling_method``) carries one start time per
+instruction. :class:`CircuitSchedule` keeps those start times, the instruction durations
+and the qubits of every instruction as flat NumPy arrays, and derives the per-qubit busy
+and idle times with vectorized reductions instead of the per-qubit scans of
+``QuantumCircuit.qubit_start_time``/``qubit_stop_time``.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Delay
+
+
+class CircuitSchedule:
+    """
+    Start times, durations and qubits of the instructions of a scheduled circuit.
+
+    Instruction ``i`` starts at ``start_times[i]``, lasts ``durations[i]`` and acts on the
+    qubits ``qubit_indices[qubit_indptr[i]:qubit_indptr[i + 1]]``. Times are in the unit of
+    the circuit (usually ``dt``). Delays are idle time; every other instruction keeps its
+    qubits busy.
+    """
+
+    __slots__ = (
+        "unit",
+        "start_times",
+        "durations",
+        "is_delay",
+        "qubit_indptr",
+        "qubit_indices",
+        "num_qubits",
+        "qubit_start",
+        "qubit_stop",
+        "qubit_busy_time",
+    )
+
+    def __init__(
+        self,
+        start_times: np.ndarray,
+        durations: np.ndarray,
+        is_delay: np.ndarray,
+        qubit_indptr: np.ndarray,
+        qubit_indices: np.ndarray,
+        num_qubits: int,
+        unit: str = "dt",
+    ):
+        """
+        Initialize a CircuitSchedule object and compute the per-qubit summaries.
+
+        Args:
+            start_times: Start time of every instruction
+            durations: Duration of every instruction
+            is_delay: Whether every instruction is a delay
+            qubit_indptr: Row pointers of the instruction qubits (length instructions + 1)
+            qubit_indices: Qubit indices of the instructions, concatenated
+            num_qubits: Number of qubits of the circuit
+            unit: Time unit of the schedule
+        """
+        self.unit = unit
+        self.start_times = np.asarray(start_times)
+        self.durations = np.asarray(durations)
+        self.is_delay = np.asarray(is_delay, dtype=bool)
+        self.qubit_indptr = np.asarray(qubit_indptr, dtype=np.int64)
+        self.qubit_indices = np.asarray(qubit_indices, dtype=np.int64)
+        self.num_qubits = num_qubits
+
+        # One entry per (instruction, qubit) pair, restricted to the non-delay instructions
+        rows = np.repeat(np.arange(len(self.start_times)), np.diff(self.qubit_indptr))
+        busy = ~self.is_delay[rows]
+        qubits = self.qubit_indices[busy]
+        starts = self.start_times[rows[busy]]
+        stops = starts + self.durations[rows[busy]]
+
+        self.qubit_start = np.full(num_qubits, np.inf)
+        np.minimum.at(self.qubit_start, qubits, starts)
+        self.qubit_stop = np.full(num_qubits, -np.inf)
+        np.maximum.at(self.qubit_stop, qubits, stops)
+        self.qubit_busy_time = np.bincount(
+            qubits, weights=self.durations[rows[busy]], minlength=num_qubits
+        )
+
+    @classmethod
+    def from_circuit(cls, circuit: QuantumCircuit) -> Optional["CircuitSchedule"]:
+        """
+        Extract the schedule of a circuit.
+
+        Args:
+            circuit: The circuit
+
+        Returns:
+            Optional[CircuitSchedule]: The schedule, or None if the circuit is not scheduled
+        """
+        start_times = getattr(circuit, "op_start_times", None) if circuit is not None else None
+        if start_times is None:
+            return None
+
+        qubit_index: Dict = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+        num_instructions = len(circuit.data)
+        durations = np.zeros(num_instructions)
+        is_delay = np.zeros(num_instructions, dtype=bool)
+        qubit_indptr = np.zeros(num_instructions + 1, dtype=np.int64)
+        qubit_indices = []
+        add_qubits = qubit_indices.extend
+        for position, instruction in enumerate(circuit.data):
+            operation = instruction.operation
+            if isinstance(operation, Delay):
+                is_delay[position] = True
+                durations[position] = operation.params[0]
+            else:
+                # Read the duration set by the scheduling passes without going through the
+                # deprecated (and much slower) ``Instruction.duration`` property
+                durations[position] = getattr(operation, "_duration", None) or 0
+            add_qubits(map(qubit_index.__getitem__, instruction.qubits))
+            qubit_indptr[position + 1] = len(qubit_indices)
+        return cls(
+            np.asarray(start_times, dtype=float),
+            durations,
+            is_delay,
+            qubit_indptr,
+            np.array(qubit_indices, dtype=np.int64),
+            circuit.num_qubits,
+            unit=getattr(circuit, "_unit", "dt"),
+        )
+
+    @property
+    def length(self) -> float:
+        """
+        Get the total length of the schedule.
+
+        Returns:
+            float: The end time of the last instruction (0 for an empty schedule)
+        """
+        if len(self.start_times) == 0:
+            return 0.0
+        return float(np.max(self.start_times + self.durations))
+
+    @property
+    def active_qubits(self) -> np.ndarray:
+        """
+        Get the qubits with at least one non-delay instruction.
+
+        Returns:
+            np.ndarray: The qubit indices
+        """
+        return np.flatnonzero(np.isfinite(self.qubit_start))
+
+    @property
+    def qubit_duration(self) -> np.ndarray:
+        """
+        Get the time between the first start and the last stop of the non-delay
+        instructions of every qubit (as ``QuantumCircuit.qubit_duration``).
+
+        Returns:
+            np.ndarray: One duration per qubit (0 for qubits without instructions)
+        """
+        return np.where(np.isfinite(self.qubit_start), self.qubit_stop - self.qubit_start, 0.0)
+
+    @property
+    def qubit_idle_time(self) -> np.ndarray:
+        """
+        Get the idle time of every qubit over the whole schedule.
+
+        Returns:
+            np.ndarray: Schedule length minus busy time, per qubit
+        """
+        return self.length - self.qubit_busy_time
+
+    @property
+    def qubit_busy_fraction(self) -> np.ndarray:
+        """
+        Get the fraction of the schedule during which every qubit is busy.
+
+        Returns:
+            np.ndarray: Busy time over schedule length, per qubit (0 for an empty schedule)
+        """
+        length = self.length
+        return self.qubit_busy_time / length if length > 0 else np.zeros(self.num_qubits)
@@ -0,0 +1,224 @@
+"""
+Shot-level drift metrics implementation for QWARD.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit_aer import AerJob
+from qiskit.providers.job import JobV1 as QiskitJob
+from scipy import stats
+
+from qward.metrics.base_metric import Metric
+from qward.metrics.records import ShotDriftRecord
+from qward.metrics.types import MetricsType, MetricsId
+from qward.utils.counts import normalize_key
+from qward.utils.shot_memory import open_packed_memory, pack_memory, packed_bits
+
+# Number of shots read from the packed memory at a time
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class ShotDrift(Metric):
+    """
+    Class for detecting drift of the success rate within a single long job.
+
+    The per-shot outcomes are read as a packed-bit array (see :mod:`qward.utils.shot_memory`),
+    typically memory-mapped from a file, in fixed-size chunks; only one chunk of bits and
+    two counters per window are held in memory. The success rate of consecutive windows of
+    shots is tested for homogeneity (chi-square) and for a linear trend.
+    """
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        *,
+        job: Optional[Union[AerJob, QiskitJob]] = None,
+        memory: Optional[Union[np.ndarray, str]] = None,
+        num_bits: Optional[int] = None,
+        expected_outcome: Optional[str] = None,
+        clbits: Optional[Sequence[int]] = None,
+        window: int = 1000,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        significance: float = 0.01,
+    ):
+        """
+        Initialize a ShotDrift object.
+
+        Args:
+            circuit: The quantum circuit to analyze
+            job: A job run with ``memory=True``; its memory is packed when the metric is
+                calculated
+            memory: Packed per-shot memory, or the path of a file written by
+                :func:`~qward.utils.shot_memory.pack_memory` (takes precedence over the job)
+            num_bits: Number of classical bits per shot (defaults to the circuit clbits)
+            expected_outcome: The correct (marginal) outcome (defaults to all zeros)
+            clbits: Classical bits compared with the expected outcome (bit ``i`` of the
+                outcome is ``clbits[i]``; defaults to all bits)
+            window: Number of consecutive shots per window
+            chunk_size: Number of shots processed at a time
+            significance: Significance level below which a drift test flags a drift
+
+        Raises:
+            ValueError: If the window or the chunk size is not positive
+        """
+        super().__init__(circuit)
+        if window <= 0 or chunk_size <= 0:
+            raise ValueError("The window and the chunk size must be positive")
+        self._job = job
+        self._memory = memory
+        self._num_bits = num_bits
+        self.expected_outcome = (
+            normalize_key(expected_outcome) if expected_outcome is not None else None
+        )
+        self.clbits = list(clbits) if clbits is not None else None
+        self.window = window
+        self.chunk_size = chunk_size
+        self.significance = significance
+
+    @property
+    def num_bits(self) -> int:
+        """
+        Get the number of classical bits per shot.
+
+        Returns:
+            int: The number of bits
+        """
+        if self._num_bits is not None:
+            return self._num_bits
+        return self.circuit.num_clbits if self.circuit is not None else 0
+
+    def _get_metric_type(self) -> MetricsType:
+        """
+        Get the type of this metric.
+
+        Returns:
+            MetricsType: The type of this metric
+        """
+        return MetricsType.POST_RUNTIME
+
+    def _get_metric_id(self) -> MetricsId:
+        """
+        Get the ID of this metric.
+
+        Returns:
+            MetricsId: The ID of this metric
+        """
+        return MetricsId.SHOT_DRIFT
+
+    def is_ready(self) -> bool:
+        """
+        Check if the metric is ready to be calculated.
+
+        Returns:
+            bool: True if the metric is ready to be calculated, False otherwise
+        """
+        return self._memory is not None or self._job is not None
+
+    def get_memory(self) -> np.ndarray:
+        """
+        Get the packed per-shot memory.
+
+        Returns:
+            np.ndarray: Array of shape (shots, bytes per shot), memory-mapped for files
+
+        Raises:
+            ValueError: If neither memory nor a job is available
+        """
+        if isinstance(self._memory, str):
+            self._memory = open_packed_memory(self._memory, self.num_bits)
+        elif self._memory is None:
+            if self._job is None:
+                raise ValueError("We need per-shot memory or a job to calculate shot drift")
+            self._memory = pack_memory(self._job.result().get_memory(), self.num_bits)
+        return self._memory
+
+    def get_window_counts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Count the successful shots of every window, one chunk at a time.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The successful shots and the shots of every window
+            (the last window may be partial)
+
+        Raises:
+            ValueError: If the expected outcome does not match the compared bits
+        """
+        memory = self.get_memory()
+        num_shots = len(memory)
+        clbits = self.clbits if self.clbits is not None else list(range(self.num_bits))
+        expected = self.expected_outcome or "0" * len(clbits)
+        if len(expected) != len(clbits):
+            raise ValueError(f"Expected outcome {expected!r} does not have {len(clbits)} bits")
+        expected_bits = np.array([int(bit) for bit in reversed(expected)], dtype=np.uint8)
+
+        num_windows = -(-num_shots // self.window)
+        successes = np.zeros(num_windows, dtype=np.int64)
+        for start in range(0, num_shots, self.chunk_size):
+            stop = min(start + self.chunk_size, num_shots)
+            rows = np.asarray(memory[start:stop])
+            hits = np.all(packed_bits(rows, clbits) == expected_bits, axis=1)
+            windows = np.arange(start, stop) // self.window
+            first = windows[0]
+            successes[first : windows[-1] + 1] += np.bincount(windows - first, weights=hits).astype(
+                np.int64
+            )
+        shots = np.full(num_windows, self.window, dtype=np.int64)
+        if num_windows:
+            shots[-1] = num_shots - self.window * (num_windows - 1)
+        return successes, shots
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the metrics.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the metrics
+        """
+        return self.get_record().to_dict()
+
+    def get_record(self) -> ShotDriftRecord:
+        """
+        Get the metrics as a typed record.
+
+        Returns:
+            ShotDriftRecord: The metrics record
+        """
+        successes, shots = self.get_window_counts()
+        num_shots = int(shots.sum())
+        success_rate = successes.sum() / num_shots if num_shots else 0.0
+        rates = successes / np.maximum(shots, 1)
+
+        # Homogeneity of the window success rates
+        variance = shots * success_rate * (1.0 - success_rate)
+        chi2 = 0.0
+        chi2_p_value = 1.0
+        if len(shots) > 1 and 0.0 < success_rate < 1.0:
+            chi2 = float(np.sum((successes - shots * success_rate) ** 2 / variance))
+            chi2_p_value = float(stats.chi2.sf(chi2, len(shots) - 1))
+
+        # Linear trend of the full windows
+        full = shots == self.window
+        slope = 0.0
+        slope_p_value = 1.0
+        if np.count_nonzero(full) > 2 and np.ptp(rates[full]) > 0:
+            trend = stats.linregress(np.flatnonzero(full), rates[full])
+            slope = float(trend.slope)
+            slope_p_value = float(trend.pvalue)
+
+        return ShotDriftRecord(
+            num_shots=num_shots,
+            window=self.window,
+            num_windows=len(shots),
+            success_rate=float(success_rate),
+            min_window_rate=float(rates.min()) if len(rates) else 0.0,
+            max_window_rate=float(rates.max()) if len(rates) else 0.0,
+            std_window_rate=float(rates.std()) if len(rates) else 0.0,
+            max_deviation=float(np.abs(rates - success_rate).max()) if len(rates) else 0.0,
+            slope=slope,
+            slope_p_value=slope_p_value,
+            chi2=chi2,
+            chi2_p_value=chi2_p_value,
+            drift_detected=bool(min(chi2_p_value, slope_p_value) < self.significance),
+        )
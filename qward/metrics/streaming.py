@@ -0,0 +1,841 @@
+"""
+Streaming circuit statistics for QWARD.
+
+This module provides a running accumulator of the structural circuit quantities used by
+:class:`QiskitMetrics` and :class:`ComplexityMetrics` (depth, size, width, operation counts,
+non-local gates and connected components). Instructions are consumed one at a time as
+``(name, qubits, clbits)`` tuples, so circuits that are too large to be built as a
+``QuantumCircuit`` can still be analyzed with memory proportional to the number of bits.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from qiskit import QuantumCircuit, qpy
+from qiskit.circuit import Clbit
+
+from qward.metrics.base_metric import Metric
+
+# An instruction as consumed by the streaming interface: (op name, qubit indices, clbit indices)
+InstructionTuple = Tuple[str, Sequence[int], Sequence[int]]
+
+# Operation names treated as directives (excluded from depth and size, as in Qiskit)
+DIRECTIVES = frozenset({"barrier"})
+
+
+class CircuitStats:
+    """
+    Running structural statistics of a quantum circuit.
+
+    The accumulator keeps a depth frontier and a union-find forest per bit, plus a table of
+    operation counts, so its memory footprint is O(num_qubits + num_clbits) regardless of the
+    number of instructions consumed. Its query methods mirror the ``QuantumCircuit`` methods
+    of the same name, which lets metrics use either object interchangeably.
+    """
+
+    __slots__ = (
+        "_qubit_depth",
+        "_clbit_depth",
+        "_qubit_parent",
+        "_clbit_parent",
+        "_unitary_parent",
+        "_components",
+        "_unitary_components",
+        "_op_counts",
+        "_size",
+        "_depth",
+        "_num_nonlocal_gates",
+    )
+
+    def __init__(self, num_qubits: int = 0, num_clbits: int = 0):
+        """
+        Initialize a CircuitStats object.
+
+        Args:
+            num_qubits: Number of qubits known up front
+            num_clbits: Number of classical bits known up front
+        """
+        self._qubit_depth: List[int] = []
+        self._clbit_depth: List[int] = []
+        # Union-find forests. Qubits are encoded as non-negative node ids and clbits as
+        # negative ids (~index) so that both can share one forest without re-indexing
+        # when more bits are added.
+        self._qubit_parent: List[int] = []
+        self._clbit_parent: List[int] = []
+        self._unitary_parent: List[int] = []
+        self._components = 0
+        self._unitary_components = 0
+        self._op_counts: Dict[str, int] = {}
+        self._size = 0
+        self._depth = 0
+        self._num_nonlocal_gates = 0
+        self.add_qubits(num_qubits)
+        self.add_clbits(num_clbits)
+
+    @classmethod
+    def from_instructions(
+        cls,
+        instructions: Iterable[InstructionTuple],
+        num_qubits: int = 0,
+        num_clbits: int = 0,
+    ) -> "CircuitStats":
+        """
+        Build statistics from an iterable of ``(name, qubits, clbits)`` tuples.
+
+        Args:
+            instructions: Iterable of instructions, consumed lazily
+            num_qubits: Number of qubits declared by the circuit (may include idle qubits)
+            num_clbits: Number of classical bits declared by the circuit
+
+        Returns:
+            CircuitStats: The accumulated statistics
+        """
+        stats = cls(num_qubits, num_clbits)
+        stats.extend(instructions)
+        return stats
+
+    @classmethod
+    def from_circuit(cls, circuit: QuantumCircuit) -> "CircuitStats":
+        """
+        Build statistics from an existing quantum circuit.
+
+        Args:
+            circuit: The quantum circuit
+
+        Returns:
+            CircuitStats: The accumulated statistics
+        """
+        stats = cls(circuit.num_qubits, circuit.num_clbits)
+        stats.extend(iter_circuit_instructions(circuit))
+        return stats
+
+    @classmethod
+    def from_qasm(cls, path: str) -> "CircuitStats":
+        """
+        Build statistics from an OpenQASM 2 or OpenQASM 3 file, reading it incrementally.
+
+        Args:
+            path: Path to the OpenQASM file
+
+        Returns:
+            CircuitStats: The accumulated statistics
+        """
+        reader = QasmInstructionReader(path)
+        stats = cls()
+        stats.extend(reader)
+        stats.add_qubits(reader.num_qubits - stats.num_qubits)
+        stats.add_clbits(reader.num_clbits - stats.num_clbits)
+        return stats
+
+    @classmethod
+    def from_qpy(cls, path: str, index: int = 0) -> "CircuitStats":
+        """
+        Build statistics from a circuit stored in a QPY file.
+
+        QPY stores each circuit as a single binary payload, so the selected circuit is
+        decoded once and its instructions are then streamed into the accumulator.
+
+        Args:
+            path: Path to the QPY file
+            index: Index of the circuit within the file
+
+        Returns:
+            CircuitStats: The accumulated statistics
+        """
+        with open(path, "rb") as f:
+            circuits = qpy.load(f)
+        return cls.from_circuit(circuits[index])
+
+    @classmethod
+    def from_file(cls, path: str) -> "CircuitStats":
+        """
+        Build statistics from a QPY (``.qpy``) or OpenQASM file.
+
+        Args:
+            path: Path to the circuit file
+
+        Returns:
+            CircuitStats: The accumulated statistics
+        """
+        if path.lower().endswith(".qpy"):
+            return cls.from_qpy(path)
+        return cls.from_qasm(path)
+
+    @property
+    def num_qubits(self) -> int:
+        """
+        Get the number of qubits.
+
+        Returns:
+            int: The number of qubits
+        """
+        return len(self._qubit_depth)
+
+    @property
+    def num_clbits(self) -> int:
+        """
+        Get the number of classical bits.
+
+        Returns:
+            int: The number of classical bits
+        """
+        return len(self._clbit_depth)
+
+    def add_qubits(self, count: int) -> None:
+        """
+        Declare additional (initially idle) qubits.
+
+        Args:
+            count: Number of qubits to add
+        """
+        for _ in range(max(count, 0)):
+            node = len(self._qubit_depth)
+            self._qubit_depth.append(0)
+            self._qubit_parent.append(node)
+            self._unitary_parent.append(node)
+            self._components += 1
+            self._unitary_components += 1
+
+    def add_clbits(self, count: int) -> None:
+        """
+        Declare additional (initially idle) classical bits.
+
+        Args:
+            count: Number of classical bits to add
+        """
+        for _ in range(max(count, 0)):
+            node = ~len(self._clbit_depth)
+            self._clbit_depth.append(0)
+            self._clbit_parent.append(node)
+            self._components += 1
+
+    def append(
+        self,
+        name: str,
+        qubits: Sequence[int],
+        clbits: Sequence[int] = (),
+        directive: Optional[bool] = None,
+    ) -> None:
+        """
+        Consume a single instruction.
+
+        Args:
+            name: The operation name
+            qubits: Indices of the qubits the operation acts on
+            clbits: Indices of the classical bits the operation acts on (including
+                any bits its condition reads)
+            directive: Whether the operation is a directive. Defaults to checking the
+                name against the known directives (e.g. ``barrier``).
+        """
+        if directive is None:
+            directive = name in DIRECTIVES
+        qubit_depth = self._qubit_depth
+        clbit_depth = self._clbit_depth
+        if qubits:
+            self.add_qubits(max(qubits) + 1 - len(qubit_depth))
+        if clbits:
+            self.add_clbits(max(clbits) + 1 - len(clbit_depth))
+
+        self._op_counts[name] = self._op_counts.get(name, 0) + 1
+
+        new_depth = 0
+        for q in qubits:
+            if qubit_depth[q] > new_depth:
+                new_depth = qubit_depth[q]
+        for c in clbits:
+            if clbit_depth[c] > new_depth:
+                new_depth = clbit_depth[c]
+        if not directive:
+            new_depth += 1
+            self._size += 1
+        for q in qubits:
+            qubit_depth[q] = new_depth
+        for c in clbits:
+            clbit_depth[c] = new_depth
+        if new_depth > self._depth:
+            self._depth = new_depth
+
+        if directive:
+            return
+        if len(qubits) > 1:
+            self._num_nonlocal_gates += 1
+            first = qubits[0]
+            for q in qubits[1:]:
+                self._union_unitary(first, q)
+        if len(qubits) + len(clbits) > 1:
+            first = qubits[0] if qubits else ~clbits[0]
+            for q in qubits:
+                self._union(first, q)
+            for c in clbits:
+                self._union(first, ~c)
+
+    def extend(self, instructions: Iterable[InstructionTuple]) -> None:
+        """
+        Consume an iterable of ``(name, qubits, clbits)`` instructions.
+
+        Args:
+            instructions: Iterable of instructions, consumed lazily. An optional fourth
+                element per instruction overrides the directive detection.
+        """
+        append = self.append
+        for instruction in instructions:
+            append(*instruction)
+
+    def depth(self) -> int:
+        """
+        Get the circuit depth (length of the critical path, ignoring directives).
+
+        Returns:
+            int: The circuit depth
+        """
+        return self._depth
+
+    def size(self) -> int:
+        """
+        Get the number of instructions, ignoring directives.
+
+        Returns:
+            int: The circuit size
+        """
+        return self._size
+
+    def width(self) -> int:
+        """
+        Get the number of qubits plus classical bits.
+
+        Returns:
+            int: The circuit width
+        """
+        return self.num_qubits + self.num_clbits
+
+    def count_ops(self) -> "OrderedDict[str, int]":
+        """
+        Count each operation kind, sorted by amount as in ``QuantumCircuit.count_ops``.
+
+        Returns:
+            OrderedDict[str, int]: Operation counts
+        """
+        return OrderedDict(sorted(self._op_counts.items(), key=lambda item: -item[1]))
+
+    def num_nonlocal_gates(self) -> int:
+        """
+        Get the number of non-local gates (acting on two or more qubits).
+
+        Returns:
+            int: The number of non-local gates
+        """
+        return self._num_nonlocal_gates
+
+    def num_connected_components(self, unitary_only: bool = False) -> int:
+        """
+        Get the number of connected components of the interaction graph.
+
+        Args:
+            unitary_only: Only consider the qubits (quantum part) of the circuit
+
+        Returns:
+            int: The number of connected components
+        """
+        return self._unitary_components if unitary_only else self._components
+
+    def num_unitary_factors(self) -> int:
+        """
+        Get the number of tensor factors in the quantum part of the circuit.
+
+        Returns:
+            int: The number of unitary factors
+        """
+        return self._unitary_components
+
+    def num_tensor_factors(self) -> int:
+        """
+        Get the number of tensor factors in the quantum part of the circuit.
+
+        Returns:
+            int: The number of tensor factors
+        """
+        return self._unitary_components
+
+    def _find(self, node: int) -> int:
+        """Find the root of a node in the full (qubit and clbit) forest, halving paths."""
+        while True:
+            parents = self._qubit_parent if node >= 0 else self._clbit_parent
+            index = node if node >= 0 else ~node
+            parent = parents[index]
+            if parent == node:
+                return node
+            grand_parents = self._qubit_parent if parent >= 0 else self._clbit_parent
+            grand_parent = grand_parents[parent if parent >= 0 else ~parent]
+            parents[index] = grand_parent
+            node = grand_parent
+
+    def _union(self, a: int, b: int) -> None:
+        """Join the components of two nodes in the full forest."""
+        root_a = self._find(a)
+        root_b = self._find(b)
+        if root_a != root_b:
+            if root_b >= 0:
+                self._qubit_parent[root_b] = root_a
+            else:
+                self._clbit_parent[~root_b] = root_a
+            self._components -= 1
+
+    def _union_unitary(self, a: int, b: int) -> None:
+        """Join the components of two qubits in the qubit-only forest."""
+        parents = self._unitary_parent
+        roots = []
+        for node in (a, b):
+            while parents[node] != node:
+                parents[node] = parents[parents[node]]
+                node = parents[node]
+            roots.append(node)
+        if roots[0] != roots[1]:
+            parents[roots[1]] = roots[0]
+            self._unitary_components -= 1
+
+
+class StreamingMetric(Metric):
+    """
+    Base class for metrics that can be computed either from a circuit or from streamed
+    :class:`CircuitStats`.
+
+    When statistics are provided, the structural quantities are read from them instead of
+    from the circuit, so the circuit itself never needs to be materialized.
+
+    In incremental mode the metric keeps running statistics of its circuit and only consumes
+    the instructions appended since the previous calculation, so re-calculating the metrics
+    after every layer of a growing circuit costs time proportional to the new layer only.
+    """
+
+    def __init__(
+        self,
+        circuit: Optional[QuantumCircuit] = None,
+        *,
+        stats: Optional[CircuitStats] = None,
+        incremental: bool = False,
+    ):
+        """
+        Initialize a StreamingMetric object.
+
+        Args:
+            circuit: The quantum circuit to analyze
+            stats: Precomputed (or streamed) statistics of the circuit
+            incremental: Track the circuit with running statistics that are updated with the
+                newly appended instructions only (see :meth:`update`)
+        """
+        super().__init__(circuit)
+        if incremental and (circuit is None or stats is not None):
+            raise ValueError("Incremental mode requires a circuit and no precomputed stats")
+        self._stats = stats
+        # Number of circuit instructions folded into the statistics (None when not tracking)
+        self._consumed: Optional[int] = 0 if incremental else None
+
+    @classmethod
+    def from_instructions(
+        cls,
+        instructions: Iterable[InstructionTuple],
+        num_qubits: int = 0,
+        num_clbits: int = 0,
+    ) -> "StreamingMetric":
+        """
+        Create the metric from an iterable of ``(name, qubits, clbits)`` tuples.
+
+        Args:
+            instructions: Iterable of instructions, consumed lazily
+            num_qubits: Number of qubits declared by the circuit
+            num_clbits: Number of classical bits declared by the circuit
+
+        Returns:
+            StreamingMetric: The metric backed by streamed statistics
+        """
+        return cls(stats=CircuitStats.from_instructions(instructions, num_qubits, num_clbits))
+
+    @classmethod
+    def from_file(cls, path: str) -> "StreamingMetric":
+        """
+        Create the metric from a QPY or OpenQASM file.
+
+        Args:
+            path: Path to the circuit file
+
+        Returns:
+            StreamingMetric: The metric backed by streamed statistics
+        """
+        return cls(stats=CircuitStats.from_file(path))
+
+    @property
+    def stats(self) -> Optional[CircuitStats]:
+        """
+        Get the streamed statistics backing this metric, if any.
+
+        Returns:
+            Optional[CircuitStats]: The statistics
+        """
+        return self._stats
+
+    @property
+    def incremental(self) -> bool:
+        """
+        Check whether the metric tracks its circuit incrementally.
+
+        Returns:
+            bool: True if the metric is in incremental mode, False otherwise
+        """
+        return self._consumed is not None
+
+    def update(self, instructions: Optional[Iterable[InstructionTuple]] = None) -> None:
+        """
+        Update the running statistics with newly appended instructions.
+
+        Without arguments, the instructions appended to the circuit since the previous update
+        are consumed, switching the metric to incremental mode if needed (the first update
+        folds in the whole circuit). Metrics in incremental mode also update themselves
+        whenever their metrics are calculated.
+
+        With ``instructions``, the given ``(name, qubits, clbits)`` tuples are appended to the
+        streamed statistics of a metric that is not backed by a circuit.
+
+        Args:
+            instructions: Instructions to append to streamed statistics
+
+        Raises:
+            ValueError: If instructions are given for a circuit-backed metric, or no
+                instructions are given for a metric without a circuit
+        """
+        if instructions is not None:
+            if self._circuit is not None:
+                raise ValueError(
+                    "Circuit-backed metrics are updated from their circuit; "
+                    "call update() without instructions"
+                )
+            if self._stats is None:
+                self._stats = CircuitStats()
+            self._stats.extend(instructions)
+            return
+        if self._circuit is None:
+            raise ValueError("No circuit to update from; pass the appended instructions")
+        if self._consumed is None:
+            self._stats = None
+            self._consumed = 0
+        self._sync()
+
+    def _sync(self) -> None:
+        """Fold the instructions appended to the tracked circuit into the statistics."""
+        circuit = self._circuit
+        num_instructions = len(circuit.data)
+        if self._stats is None or num_instructions < self._consumed:
+            # First update, or instructions were removed: start over from the whole circuit
+            self._stats = CircuitStats()
+            self._consumed = 0
+            self._reset_incremental_state()
+        stats = self._stats
+        if num_instructions > self._consumed:
+            stats.extend(iter_circuit_instructions(circuit, self._consumed))
+            self._on_instructions_appended(self._consumed, num_instructions)
+            self._consumed = num_instructions
+        stats.add_qubits(circuit.num_qubits - stats.num_qubits)
+        stats.add_clbits(circuit.num_clbits - stats.num_clbits)
+
+    def _reset_incremental_state(self) -> None:
+        """Hook for subclasses keeping additional running state; called before a rebuild."""
+        pass
+
+    def _on_instructions_appended(self, start: int, stop: int) -> None:
+        """
+        Hook for subclasses keeping additional running state.
+
+        Args:
+            start: Index of the first newly consumed circuit instruction
+            stop: Index past the last newly consumed circuit instruction
+        """
+        pass
+
+    @property
+    def _source(self):
+        """Object providing the structural queries (the statistics or the circuit)."""
+        if self._consumed is not None:
+            self._sync()
+        return self._stats if self._stats is not None else self._circuit
+
+    def is_ready(self) -> bool:
+        """
+        Check if the metric is ready to be calculated.
+
+        Returns:
+            bool: True if the metric is ready to be calculated, False otherwise
+        """
+        return self.circuit is not None or self._stats is not None
+
+
+def condition_clbits(operation: Any) -> List[Clbit]:
+    """
+    Get the classical bits read by the condition of an operation.
+
+    The private ``_condition`` attribute is read to avoid the deprecation warning of
+    ``Instruction.condition``.
+
+    Args:
+        operation: The operation
+
+    Returns:
+        List[Clbit]: The conditioned bit or the bits of the conditioned register (empty if
+        the operation has no ``(bit or register, value)`` condition)
+    """
+    condition = getattr(operation, "_condition", None)
+    if condition is None or hasattr(condition, "type"):
+        return []
+    target = condition[0]
+    return list(target) if hasattr(target, "__iter__") else [target]
+
+
+def iter_circuit_instructions(
+    circuit: QuantumCircuit, start: int = 0
+) -> Iterator[Tuple[str, List[int], List[int], bool]]:
+    """
+    Iterate over the instructions of a circuit as index-based tuples.
+
+    Bits read by a classical condition are reported together with the clbits of the
+    instruction, matching how Qiskit accounts for them in depth and connectivity.
+
+    Args:
+        circuit: The quantum circuit
+        start: Index of the first instruction to yield
+
+    Yields:
+        Tuple[str, List[int], List[int], bool]: The operation name, qubit indices,
+        clbit indices and whether the operation is a directive
+    """
+    qubit_index = {bit: i for i, bit in enumerate(circuit.qubits)}
+    clbit_index = {bit: i for i, bit in enumerate(circuit.clbits)}
+    data = circuit.data
+    for position in range(start, len(data)):
+        instruction = data[position]
+        operation = instruction.operation
+        clbits = [clbit_index[bit] for bit in instruction.clbits]
+        clbits.extend(clbit_index[bit] for bit in condition_clbits(operation))
+        yield (
+            operation.name,
+            [qubit_index[bit] for bit in instruction.qubits],
+            clbits,
+            bool(getattr(operation, "_directive", False)),
+        )
+
+
+_REGISTER_DECLARATION = re.compile(
+    r"^(?:(?P<old>qreg|creg)\s+(?P<old_name>\w+)\s*\[\s*(?P<old_size>\d+)\s*\]"
+    r"|(?P<new>qubit|bit)\s*(?:\[\s*(?P<new_size>\d+)\s*\])?\s+(?P<new_name>\w+))$"
+)
+_ARGUMENT = re.compile(r"^(?P<name>\$?\w+)\s*(?:\[\s*(?P<index>[^\]]+)\s*\])?$")
+_UNSUPPORTED_KEYWORDS = ("for", "while", "switch", "def", "box", "if", "else", "end")
+_SKIPPED_KEYWORDS = (
+    "OPENQASM",
+    "include",
+    "input",
+    "output",
+    "const",
+    "let",
+    "defcalgrammar",
+    "cal",
+    "defcal",
+    "opaque",
+    "pragma",
+    "#pragma",
+)
+
+
+class QasmInstructionReader:
+    """
+    Incremental reader of OpenQASM 2 / OpenQASM 3 programs.
+
+    The reader yields ``(name, qubits, clbits)`` tuples for the flat gate-level subset of the
+    language (register declarations, gate calls, ``measure``, ``reset`` and ``barrier``
+    statements, with register broadcasting). Gate definitions are skipped and their calls are
+    reported as opaque operations. Classical control flow is not supported. The file is read
+    in fixed-size chunks, so memory use does not depend on the program length.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 1 << 16):
+        """
+        Initialize a QasmInstructionReader object.
+
+        Args:
+            path: Path to the OpenQASM file
+            chunk_size: Number of characters read from the file at a time
+        """
+        self._path = path
+        self._chunk_size = chunk_size
+        self._qregs: Dict[str, Tuple[int, int]] = {}
+        self._cregs: Dict[str, Tuple[int, int]] = {}
+        self.num_qubits = 0
+        self.num_clbits = 0
+
+    def __iter__(self) -> Iterator[InstructionTuple]:
+        for statement in self._statements():
+            yield from self._parse(statement)
+
+    def _statements(self) -> Iterator[str]:
+        """Split the program into top-level statements, dropping comments and gate bodies."""
+        buffer: List[str] = []
+        depth = 0
+        in_line_comment = False
+        in_block_comment = False
+        previous = ""
+        with open(self._path, "r", encoding="utf-8") as f:
+            while True:
+                chunk = f.read(self._chunk_size)
+                if not chunk:
+                    break
+                for char in chunk:
+                    if in_line_comment:
+                        if char == "\n":
+                            in_line_comment = False
+                        previous = char
+                        continue
+                    if in_block_comment:
+                        if previous == "*" and char == "/":
+                            in_block_comment = False
+                            char = ""
+                        previous = char
+                        continue
+                    if previous == "/" and char in "/*":
+                        buffer.pop()
+                        in_line_comment = char == "/"
+                        in_block_comment = char == "*"
+                        previous = ""
+                        continue
+                    previous = char
+                    if char == "{":
+                        depth += 1
+                        buffer.append(char)
+                    elif char == "}":
+                        depth -= 1
+                        buffer.append(char)
+                        if depth == 0:
+                            # End of a gate definition (or other block)
+                            yield "".join(buffer).strip()
+                            buffer = []
+                    elif char == ";" and depth == 0:
+                        yield "".join(buffer).strip()
+                        buffer = []
+                    else:
+                        buffer.append(char)
+        remainder = "".join(buffer).strip()
+        if remainder:
+            raise ValueError(f"Unterminated OpenQASM statement: {remainder[:80]!r}")
+
+    def _parse(self, statement: str) -> Iterator[InstructionTuple]:
+        """Turn a single statement into zero or more instruction tuples."""
+        statement = " ".join(statement.split())
+        if not statement:
+            return
+        keyword = re.split(r"[\s(\[{]", statement, maxsplit=1)[0]
+        if keyword in _SKIPPED_KEYWORDS or keyword == "gate":
+            # Gate definitions are skipped: calls to them are reported under their name
+            return
+        if keyword == "if" and "{" not in statement:
+            # OpenQASM 2 condition: ``if (creg == value) op args``
+            closing = statement.index(")")
+            condition_target = statement[statement.index("(") + 1 : closing].split("==")[0]
+            condition_bits = self._expand(condition_target.strip(), self._cregs)
+            for name, qubits, clbits in self._parse(statement[closing + 1 :]):
+                yield name, qubits, list(clbits) + condition_bits
+            return
+        if keyword in _UNSUPPORTED_KEYWORDS:
+            raise ValueError(f"Unsupported OpenQASM construct in streaming reader: {keyword}")
+
+        if "=" in statement and "measure" in statement:
+            # OpenQASM 3 measurement: ``c[0] = measure q[0]`` (possibly a declaration)
+            target, source = (part.strip() for part in statement.split("=", 1))
+            declaration = _REGISTER_DECLARATION.match(target)
+            if declaration:
+                self._declare(declaration)
+                target = declaration.group("new_name") or declaration.group("old_name")
+            yield from self._broadcast("measure", [source[len("measure") :].strip()], [target])
+            return
+        declaration = _REGISTER_DECLARATION.match(statement)
+        if declaration:
+            self._declare(declaration)
+            return
+        if keyword == "measure":
+            source, _, target = statement[len("measure") :].partition("->")
+            yield from self._broadcast(
+                "measure", [source.strip()], [target.strip()] if target else []
+            )
+            return
+
+        if "@" in statement:
+            # Gate modifiers (ctrl @, inv @, pow(k) @) are folded away onto the base gate
+            statement = statement.rsplit("@", 1)[1].strip()
+            keyword = re.split(r"[\s(\[]", statement, maxsplit=1)[0]
+        rest = statement[len(keyword) :].lstrip()
+        for opening, closing in (("(", ")"), ("[", "]")):
+            # Strip a parameter list or a duration designator (``delay[100ns]``)
+            if rest.startswith(opening):
+                depth = 0
+                for position, char in enumerate(rest):
+                    depth += (char == opening) - (char == closing)
+                    if depth == 0:
+                        rest = rest[position + 1 :].lstrip()
+                        break
+        args = [arg.strip() for arg in rest.split(",")] if rest else []
+        if keyword == "barrier" and not args:
+            yield "barrier", list(range(self.num_qubits)), []
+            return
+        yield from self._broadcast(keyword, args, [])
+
+    def _declare(self, declaration: "re.Match") -> None:
+        """Record a register declaration."""
+        if declaration.group("old"):
+            kind = "qubit" if declaration.group("old") == "qreg" else "bit"
+            name = declaration.group("old_name")
+            size = int(declaration.group("old_size"))
+        else:
+            kind = declaration.group("new")
+            name = declaration.group("new_name")
+            size = int(declaration.group("new_size") or 1)
+        if kind == "qubit":
+            self._qregs[name] = (self.num_qubits, size)
+            self.num_qubits += size
+        else:
+            self._cregs[name] = (self.num_clbits, size)
+            self.num_clbits += size
+
+    def _expand(self, argument: str, registers: Dict[str, Tuple[int, int]]) -> List[int]:
+        """Resolve an argument (``reg``, ``reg[i]``, ``reg[a:b]`` or ``$i``) to bit indices."""
+        match = _ARGUMENT.match(argument)
+        if match is None:
+            raise ValueError(f"Cannot parse OpenQASM argument: {argument!r}")
+        name = match.group("name")
+        if name.startswith("$"):
+            # Physical qubit
+            index = int(name[1:])
+            self.num_qubits = max(self.num_qubits, index + 1)
+            return [index]
+        if name not in registers:
+            raise ValueError(f"Undeclared OpenQASM register: {name!r}")
+        offset, size = registers[name]
+        index = match.group("index")
+        if index is None:
+            return list(range(offset, offset + size))
+        if ":" in index:
+            # OpenQASM 3 ranges are inclusive: [start:stop] or [start:step:stop]
+            parts = [int(part) for part in index.split(":")]
+            start, step, stop = (parts[0], 1, parts[1]) if len(parts) == 2 else parts
+            return [offset + i for i in range(start, stop + (1 if step > 0 else -1), step)]
+        return [offset + int(index)]
+
+    def _broadcast(
+        self, name: str, qubit_args: List[str], clbit_args: List[str]
+    ) -> Iterator[InstructionTuple]:
+        """Expand register arguments into one instruction per broadcast position."""
+        expanded = [self._expand(arg, self._qregs) for arg in qubit_args]
+        expanded += [self._expand(arg, self._cregs) for arg in clbit_args]
+        num_qubit_args = len(qubit_args)
+        if name == "barrier":
+            yield name, [q for group in expanded for q in group], []
+            return
+        width = max((len(group) for group in expanded), default=1)
+        for i in range(width):
+            bits = [group[i] if len(group) > 1 else group[0] for group in expanded]
+            yield name, bits[:num_qubit_args], bits[num_qubit_args:]
@@ -2,8 +2,7 @@
 Success rate metrics implementation for QWARD.
 """
 
-import math
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from qiskit import QuantumCircuit
@@ -11,10 +10,32 @@ from qiskit_aer import AerJob
 from qiskit.providers.job import JobV1 as QiskitJob
 
 from qward.metrics.base_metric import Metric
+from qward.metrics.records import (
+    SuccessRateAggregateRecord,
+    SuccessRateJobRecord,
+    SuccessRateRecord,
+)
+from qward.metrics.runtime_jobs import RuntimeJobsMixin, job_label
 from qward.metrics.types import MetricsType, MetricsId
-
-
-class SuccessRate(Metric):
+from qward.utils.counts import (
+    bit_flip_rates,
+    decode_outcomes,
+    encode_counts,
+    marginal_distribution,
+    marginalize_outcomes,
+    merge_outcomes,
+    normalize_key,
+)
+from qward.utils.mitigation import TensoredReadoutMitigator
+from qward.utils.statistics import (
+    bootstrap_success_rates,
+    clopper_pearson_interval,
+    percentile_interval,
+    wilson_interval,
+)
+
+
+class SuccessRate(RuntimeJobsMixin, Metric):
     """
     Class for calculating success rate metrics for quantum circuits.
 
@@ -30,6 +51,12 @@ class SuccessRate(Metric):
         jobs: Optional[List[Union[AerJob, QiskitJob]]] = None,
         result: Optional[Dict] = None,
         success_criteria: Optional[Callable[[str], bool]] = None,
+        clbits: Optional[Sequence[int]] = None,
+        expected_outcome: Optional[str] = None,
+        mitigator: Optional[TensoredReadoutMitigator] = None,
+        confidence_level: float = 0.95,
+        bootstrap_samples: int = 0,
+        seed: Optional[int] = None,
     ):
         """
         Initialize a SuccessRate object.
@@ -40,25 +67,43 @@ class SuccessRate(Metric):
             jobs: A list of jobs that executed the circuit (for multiple runs)
             result: The result of the job execution
             success_criteria: Function that determines if a measurement result is successful
+            clbits: Classical bits onto which the counts are marginalized before applying the
+                success criteria (bit ``i`` of the marginal bitstring is ``clbits[i]``)
+            expected_outcome: The correct (marginal) outcome; it defines the default success
+                criteria and enables the per-bit error rates
+            mitigator: Readout error mitigator; when given, the success rate is also computed
+                from the mitigated quasi-probabilities
+            confidence_level: Confidence level of the reported intervals
+            bootstrap_samples: Number of bootstrap resamples for the bootstrap intervals
+                (0 disables them)
+            seed: Seed for the bootstrap resampling
         """
         super().__init__(circuit)
+        self.confidence_level = confidence_level
+        self.bootstrap_samples = bootstrap_samples
+        self.seed = seed
         self._job = job
-        self._jobs = jobs or []
-        if job and not self._jobs:
-            self._jobs = [job]
         self._result = result
+        self.clbits = list(clbits) if clbits is not None else None
+        self.expected_outcome = (
+            normalize_key(expected_outcome) if expected_outcome is not None else None
+        )
+        self.mitigator = mitigator
         self.success_criteria = success_criteria or self._default_success_criteria()
         self.runtime_job = self._job
-        self.runtime_jobs = self._jobs
+        self._init_runtime_jobs(job, jobs)
 
     def _default_success_criteria(self) -> Callable[[str], bool]:
         """
         Define the default success criteria for the circuit.
-        By default, considers all zeros as success.
+        By default, considers the expected outcome (or all zeros) as success.
 
         Returns:
             Callable[[str], bool]: Function that takes a measurement result and returns True if successful
         """
+        if self.expected_outcome is not None:
+            expected_outcome = self.expected_outcome
+            return lambda result: result == expected_outcome
         return lambda result: result == "0"
 
     def _get_metric_type(self) -> MetricsType:
@@ -87,7 +132,7 @@ class SuccessRate(Metric):
             bool: True if the metric is ready to be calculated, False otherwise
         """
         return self.circuit is not None and (
-            self._result is not None or self.runtime_job is not None or len(self.runtime_jobs) > 0
+            self._result is not None or self.runtime_job is not None or len(self._runtime_jobs) > 0
         )
 
     def get_metrics(self) -> Dict[str, Any]:
@@ -98,14 +143,33 @@ class SuccessRate(Metric):
             Dict[str, Any]: Dictionary containing the metrics
         """
         # If we have multiple jobs, use the multiple job metrics
-        if len(self.runtime_jobs) > 1:
+        if len(self._runtime_jobs) > 1:
             return self.get_multiple_jobs_metrics()
         # Otherwise, use the single job metrics
-        elif len(self.runtime_jobs) == 1:
-            return self.get_single_job_metrics(self.runtime_jobs[0])
+        elif len(self._runtime_jobs) == 1:
+            return self.get_single_job_metrics(next(iter(self._runtime_jobs.values())))
         else:
             raise ValueError("No jobs available to calculate metrics")
 
+    def get_record(self) -> SuccessRateRecord:
+        """
+        Get the metrics as a typed record, with one row per job and the aggregate.
+
+        Returns:
+            SuccessRateRecord: The metrics record
+        """
+        if not self._runtime_jobs:
+            raise ValueError("No jobs available to calculate metrics")
+
+        job_records = [
+            self._get_job_record(job, i) for i, job in enumerate(self._runtime_jobs.values())
+        ]
+        bootstrap = self._set_intervals(job_records)
+        return SuccessRateRecord(
+            individual_jobs=job_records,
+            aggregate=self._get_aggregate_record(job_records, bootstrap),
+        )
+
     def get_single_job_metrics(self, job: Optional[QiskitJob] = None) -> Dict[str, Any]:
         """
         Calculate success rate metrics from a single job result.
@@ -119,24 +183,60 @@ class SuccessRate(Metric):
         if self.runtime_job is None and job is None:
             raise ValueError("We need a runtime job to calculate success rate")
 
-        job_to_use = job or self.runtime_job
-        result = job_to_use.result()
+        job_record = self._get_job_record(job or self.runtime_job)
+        self._set_intervals([job_record])
+        return job_record.to_dict()
+
+    def get_multiple_jobs_metrics(self) -> Dict[str, Any]:
+        """
+        Calculate success rate metrics from multiple job results.
+
+        Returns:
+            dict: Success rate metrics for multiple jobs, including individual job metrics
+                  and aggregate metrics across all jobs
+        """
+        if not self._runtime_jobs:
+            raise ValueError("We need multiple runtime jobs to calculate multiple job metrics")
+
+        return self.get_record().to_dict()
+
+    def _get_job_record(
+        self, job: Union[AerJob, QiskitJob], index: int = 0
+    ) -> SuccessRateJobRecord:
+        """
+        Calculate the success rate record of a single job.
+
+        Args:
+            job: The job to analyze
+            index: Position of the job, used as its id if the job has none
+
+        Returns:
+            SuccessRateJobRecord: The job record
+        """
+        result = self.job_result(job)
 
         # Get counts from the result
         counts = result.get_counts()
+        mitigated_success_rate = None
+        if counts and self.mitigator is not None:
+            mitigated_success_rate = self._get_mitigated_success_rate(counts)
+        bit_error_rates = None
+        if counts and (self.clbits is not None or self.expected_outcome is not None):
+            counts, bit_error_rates = self._marginalize_counts(counts)
+
+        # Extract job_id from the job object if available
+        job_id = job_label(job, index)
 
         if not counts:
-            # Use job_id from job object if available
-            job_id = job_to_use.job_id() if hasattr(job_to_use, "job_id") else "0"
-            return {
-                "job_id": job_id,
-                "success_rate": 0.0,
-                "error_rate": 1.0,
-                "fidelity": 0.0,
-                "total_shots": 0,
-                "successful_shots": 0,
-                "average_counts": counts,
-            }
+            return SuccessRateJobRecord(
+                job_id=job_id,
+                success_rate=0.0,
+                error_rate=1.0,
+                fidelity=0.0,
+                total_shots=0,
+                successful_shots=0,
+                average_counts=counts,
+            )
 
         # Calculate success rate using the custom success criteria
         total_shots = sum(counts.values())
@@ -155,131 +255,197 @@ class SuccessRate(Metric):
         # Calculate error rate as 1 - success_rate
         error_rate = 1.0 - success_rate
 
-        # Extract job_id from the job object if available
-        job_id = job_to_use.job_id() if hasattr(job_to_use, "job_id") else "0"
+        return SuccessRateJobRecord(
+            job_id=job_id,
+            success_rate=float(success_rate),
+            error_rate=float(error_rate),
+            fidelity=float(fidelity),
+            total_shots=total_shots,
+            successful_shots=successful_shots,
+            mitigated_success_rate=mitigated_success_rate,
+            bit_error_rates=bit_error_rates,
+            average_counts=counts,
+        )
 
-        metrics = {
-            "job_id": job_id,
-            "success_rate": float(success_rate),
-            "error_rate": float(error_rate),
-            "fidelity": float(fidelity),
-            "total_shots": total_shots,
-            "successful_shots": successful_shots,
-            "average_counts": counts,
-        }
+    def _get_mitigated_success_rate(self, counts: Dict[str, int]) -> float:
+        """
+        Calculate the success rate from readout-mitigated quasi-probabilities.
 
-        return metrics
+        The raw counts are mitigated over all classical bits, then marginalized onto the
+        selected clbits (if any) before the success criteria are applied.
 
-    def get_multiple_jobs_metrics(self) -> Dict[str, Any]:
-        """
-        Calculate success rate metrics from multiple job results.
+        Args:
+            counts: The raw counts of a job
 
         Returns:
-            dict: Success rate metrics for multiple jobs, including individual job metrics
-                  and aggregate metrics across all jobs
+            float: The mitigated success rate, clipped to [0, 1]
         """
-        if not self.runtime_jobs:
-            raise ValueError("We need multiple runtime jobs to calculate multiple job metrics")
+        quasi = self.mitigator.quasi_probabilities(counts)
+        if self.clbits is not None:
+            quasi = marginal_distribution(quasi, self.clbits)
+        success = sum(value for state, value in quasi.items() if self.success_criteria(state))
+        return float(np.clip(success, 0.0, 1.0))
+
+    def _marginalize_counts(
+        self, counts: Dict[str, int]
+    ) -> Tuple[Dict[str, int], Optional[Dict[str, float]]]:
+        """
+        Marginalize counts onto the selected clbits and compute the per-bit error rates.
 
-        # Calculate metrics for each job
-        success_rates: List[float] = []
-        fidelities: List[float] = []
-        total_shots_list: List[int] = []
-        successful_shots_list: List[int] = []
-        job_metrics: List[Dict[str, Any]] = []
+        Outcomes are encoded as integers once, so marginalization and the bit-flip
+        frequencies of every position are computed with vectorized bit operations.
 
-        for i, job in enumerate(self.runtime_jobs):
-            # Temporarily set the current job to calculate single job metrics
-            original_job = self.runtime_job
-            self.runtime_job = job
+        Args:
+            counts: The raw counts of a job
 
-            # Reuse single job metrics calculation
-            single_job_metrics = self.get_single_job_metrics()
-
-            # Restore the original job
-            self.runtime_job = original_job
-
-            # Extract metrics we need for aggregation
-            success_rates.append(single_job_metrics["success_rate"])
-            fidelities.append(single_job_metrics["fidelity"])
-            total_shots_list.append(single_job_metrics["total_shots"])
-            successful_shots_list.append(single_job_metrics["successful_shots"])
-
-            # Add to job metrics list with actual job_id from the job object
-            job_metrics.append(
-                {
-                    "job_id": job.job_id() if hasattr(job, "job_id") else str(i),
-                    "success_rate": single_job_metrics["success_rate"],
-                    "error_rate": single_job_metrics["error_rate"],
-                    "fidelity": single_job_metrics["fidelity"],
-                    "total_shots": single_job_metrics["total_shots"],
-                    "successful_shots": single_job_metrics["successful_shots"],
-                }
+        Returns:
+            Tuple[Dict[str, int], Optional[Dict[str, float]]]: The marginal counts and the
+            flip frequency of each classical bit with respect to the expected outcome
+            (None without an expected outcome)
+
+        Raises:
+            ValueError: If the expected outcome does not match the marginal width
+        """
+        outcomes, values = encode_counts(counts)
+        if self.clbits is not None:
+            outcomes = marginalize_outcomes(outcomes, self.clbits)
+            labels = self.clbits
+        else:
+            labels = list(range(max(len(normalize_key(key)) for key in counts)))
+        outcomes, values = merge_outcomes(outcomes, values)
+        values = np.rint(values).astype(np.int64)
+
+        bit_error_rates = None
+        if self.expected_outcome is not None:
+            if len(self.expected_outcome) != len(labels):
+                raise ValueError(
+                    f"Expected outcome {self.expected_outcome!r} does not have "
+                    f"{len(labels)} bits"
+                )
+            rates = bit_flip_rates(outcomes, values, int(self.expected_outcome, 2), len(labels))
+            bit_error_rates = {str(clbit): float(rate) for clbit, rate in zip(labels, rates)}
+        return dict(zip(decode_outcomes(outcomes, len(labels)), values.tolist())), bit_error_rates
+
+    def _set_intervals(self, job_records: List[SuccessRateJobRecord]) -> Optional[np.ndarray]:
+        """
+        Compute the confidence intervals of all jobs at once and store them in their records.
+
+        Args:
+            job_records: The per-job records
+
+        Returns:
+            Optional[np.ndarray]: The bootstrap success rates with shape (samples, jobs), or
+            None if bootstrapping is disabled
+        """
+        successes = np.array([record.successful_shots for record in job_records])
+        trials = np.array([record.total_shots for record in job_records])
+        wilson = wilson_interval(successes, trials, self.confidence_level)
+        clopper_pearson = clopper_pearson_interval(successes, trials, self.confidence_level)
+        bootstrap = None
+        if self.bootstrap_samples > 0:
+            bootstrap = bootstrap_success_rates(
+                successes, trials, self.bootstrap_samples, seed=self.seed
             )
+            bootstrap_interval = percentile_interval(bootstrap, self.confidence_level)
+
+        for i, record in enumerate(job_records):
+            record.wilson_low = float(wilson[0][i])
+            record.wilson_high = float(wilson[1][i])
+            record.clopper_pearson_low = float(clopper_pearson[0][i])
+            record.clopper_pearson_high = float(clopper_pearson[1][i])
+            if bootstrap is not None:
+                record.bootstrap_low = float(bootstrap_interval[0][i])
+                record.bootstrap_high = float(bootstrap_interval[1][i])
+        return bootstrap
+
+    def _get_aggregate_record(
+        self, job_records: List[SuccessRateJobRecord], bootstrap: Optional[np.ndarray] = None
+    ) -> SuccessRateAggregateRecord:
+        """
+        Aggregate job records into metrics across all jobs.
 
-        if not success_rates:
-            return {
-                "individual_jobs": [],
-                "aggregate": {
-                    "mean_success_rate": 0.0,
-                    "std_success_rate": 0.0,
-                    "min_success_rate": 0.0,
-                    "max_success_rate": 0.0,
-                    "total_trials": 0,
-                    "fidelity": 0.0,
-                    "error_rate": 1.0,
-                },
-            }
+        Args:
+            job_records: The per-job records
+            bootstrap: Bootstrap success rates with shape (samples, jobs), if available
+
+        Returns:
+            SuccessRateAggregateRecord: The aggregate record
+        """
+        if not job_records:
+            return SuccessRateAggregateRecord(
+                mean_success_rate=0.0,
+                std_success_rate=0.0,
+                min_success_rate=0.0,
+                max_success_rate=0.0,
+                total_trials=0,
+                fidelity=0.0,
+                error_rate=1.0,
+            )
 
         # Calculate aggregate metrics
-        success_rates_array = np.array(success_rates)
+        success_rates_array = np.array([record.success_rate for record in job_records])
         mean_success_rate = float(np.mean(success_rates_array))
         std_success_rate = (
             float(np.std(success_rates_array)) if len(success_rates_array) > 1 else 0.0
         )
-        min_success_rate = float(np.min(success_rates_array))
-        max_success_rate = float(np.max(success_rates_array))
-        total_trials = sum(total_shots_list)
-
-        # Calculate average fidelity
-        avg_fidelity = float(np.mean(fidelities))
-
-        # Calculate error rate as 1 - mean_success_rate
-        error_rate = 1.0 - mean_success_rate
-
-        # Return both individual job metrics and aggregate metrics
-        metrics = {
-            "individual_jobs": job_metrics,
-            "aggregate": {
-                "mean_success_rate": mean_success_rate,
-                "std_success_rate": std_success_rate,
-                "min_success_rate": min_success_rate,
-                "max_success_rate": max_success_rate,
-                "total_trials": total_trials,
-                "fidelity": avg_fidelity,
-                "error_rate": error_rate,
-            },
-        }
-
-        return metrics
-
-    def add_job(self, job: Union[AerJob, QiskitJob, List[Union[AerJob, QiskitJob]]]) -> None:
+
+        # Intervals of the pooled success rate (all shots of all jobs)
+        successful_shots = sum(record.successful_shots for record in job_records)
+        total_trials = sum(record.total_shots for record in job_records)
+        wilson = wilson_interval(successful_shots, total_trials, self.confidence_level)
+        clopper_pearson = clopper_pearson_interval(
+            successful_shots, total_trials, self.confidence_level
+        )
+        mitigated_success_rates = [
+            record.mitigated_success_rate
+            for record in job_records
+            if record.mitigated_success_rate is not None
+        ]
+        # Per-bit error rates pooled over all shots
+        bit_error_rates = None
+        if total_trials > 0 and all(record.bit_error_rates for record in job_records):
+            bit_error_rates = {
+                clbit: sum(
+                    record.bit_error_rates[clbit] * record.total_shots for record in job_records
+                )
+                / total_trials
+                for clbit in job_records[0].bit_error_rates
+            }
+        # Bootstrap interval of the mean success rate across jobs
+        bootstrap_interval = (None, None)
+        if bootstrap is not None:
+            low, high = percentile_interval(np.nanmean(bootstrap, axis=1), self.confidence_level)
+            bootstrap_interval = (float(low), float(high))
+
+        return SuccessRateAggregateRecord(
+            mean_success_rate=mean_success_rate,
+            std_success_rate=std_success_rate,
+            min_success_rate=float(np.min(success_rates_array)),
+            max_success_rate=float(np.max(success_rates_array)),
+            total_trials=total_trials,
+            # Average fidelity across jobs
+            fidelity=float(np.mean([record.fidelity for record in job_records])),
+            # Error rate as 1 - mean_success_rate
+            error_rate=1.0 - mean_success_rate,
+            pooled_success_rate=successful_shots / total_trials if total_trials > 0 else 0.0,
+            wilson_low=float(wilson[0]),
+            wilson_high=float(wilson[1]),
+            clopper_pearson_low=float(clopper_pearson[0]),
+            clopper_pearson_high=float(clopper_pearson[1]),
+            bootstrap_low=bootstrap_interval[0],
+            bootstrap_high=bootstrap_interval[1],
+            mean_mitigated_success_rate=(
+                float(np.mean(mitigated_success_rates)) if mitigated_success_rates else None
+            ),
+            bit_error_rates=bit_error_rates,
+        )
+
+    def _job_added(self, job: Union[AerJob, QiskitJob]) -> None:
         """
-        Add one or more jobs to the list of jobs for multiple job metrics.
+        Use the first added job as the single job.
 
         Args:
-            job: A single job or a list of jobs to add
+            job: The added job
         """
-        if isinstance(job, list):
-            for single_job in job:
-                if single_job not in self.runtime_jobs:
-                    self.runtime_jobs.append(single_job)
-                    # If this is the first job, also set it as the single job
-                    if not self.runtime_job:
-                        self.runtime_job = single_job
-        else:
-            if job not in self.runtime_jobs:
-                self.runtime_jobs.append(job)
-                # If this is the first job, also set it as the single job
-                if not self.runtime_job:
-                    self.runtime_job = job
+        if not self.runtime_job:
+            self.runtime_job = job
@@ -13,6 +13,11 @@ class MetricsId(Enum):
     QISKIT = "QISKIT"
     COMPLEXITY = "COMPLEXITY"
     SUCCESS_RATE = "SUCCESS_RATE"
+    DISTRIBUTION_DISTANCE = "DISTRIBUTION_DISTANCE"
+    PREDICTED_SUCCESS_RATE = "PREDICTED_SUCCESS_RATE"
+    SHOT_DRIFT = "SHOT_DRIFT"
+    CRITICAL_PATH = "CRITICAL_PATH"
+    LAYER_PROFILE = "LAYER_PROFILE"
 
 
 class MetricsType(Enum):
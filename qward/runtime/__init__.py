@@ -3,6 +3,6 @@ Runtime package for QWARD.
 """
 
 from qward.runtime.qiskit_runtime import QiskitRuntimeService
+from qward.runtime.local_runtime import LocalRuntimeJob, LocalRuntimeService, LocalSampler
 
-
-__all__ = ["QiskitRuntimeService"]
+__all__ = ["QiskitRuntimeService", "LocalRuntimeService", "LocalSampler", "LocalRuntimeJob"]
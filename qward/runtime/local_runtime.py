@@ -0,0 +1,309 @@
+"""
+Local, offline stand-in for the Qiskit Runtime service for QWARD.
+
+The classes in this module mimic the submission and polling behaviour of Qiskit Runtime
+(``SamplerV2`` jobs that are queued, run and then finish or fail) without credentials or
+network access. Jobs are executed on Aer, with configurable queue and execution latency and
+failure injection, so the runtime pipeline can be load-tested on CI machines.
+"""
+
+import time
+import uuid
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.primitives import PrimitiveResult
+from qiskit.providers import BackendV2
+from qiskit_aer.primitives import SamplerV2 as AerSampler
+from qiskit_ibm_runtime.exceptions import RuntimeInvalidStateError, RuntimeJobFailureError
+
+from qward.runtime.qiskit_runtime import QiskitRuntimeService
+
+# A latency in seconds, or a (low, high) range sampled uniformly per job
+Latency = Union[float, Tuple[float, float]]
+
+
+class LocalRuntimeJob:
+    """
+    Job returned by :class:`LocalSampler`, following the ``RuntimeJobV2`` interface.
+
+    The status is derived from the time elapsed since submission (``QUEUED`` during the
+    queue latency, ``RUNNING`` during the execution latency, then ``DONE`` or ``ERROR``), so
+    polling a job is cheap and never blocks. The simulation itself runs lazily, the first
+    time the result is requested.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[], PrimitiveResult],
+        *,
+        queue_latency: float = 0.0,
+        execution_latency: float = 0.0,
+        fail: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a LocalRuntimeJob object.
+
+        Args:
+            run: Function executing the job and returning its result
+            queue_latency: Seconds the job stays queued
+            execution_latency: Seconds the job stays running
+            fail: Whether the job ends in the ``ERROR`` state
+            clock: Monotonic clock used to derive the status
+        """
+        self._job_id = f"local-{uuid.uuid4().hex}"
+        self._run = run
+        self._clock = clock
+        self._submitted = clock()
+        self._queue_latency = queue_latency
+        self._execution_latency = execution_latency
+        self._fail = fail
+        self._cancelled = False
+        self._result: Optional[PrimitiveResult] = None
+
+    def job_id(self) -> str:
+        """
+        Get the job ID.
+
+        Returns:
+            str: The job ID
+        """
+        return self._job_id
+
+    def status(self) -> str:
+        """
+        Get the status of the job.
+
+        Returns:
+            str: One of ``QUEUED``, ``RUNNING``, ``DONE``, ``ERROR`` or ``CANCELLED``
+        """
+        if self._cancelled:
+            return "CANCELLED"
+        elapsed = self._clock() - self._submitted
+        if elapsed < self._queue_latency:
+            return "QUEUED"
+        if elapsed < self._queue_latency + self._execution_latency:
+            return "RUNNING"
+        return "ERROR" if self._fail else "DONE"
+
+    def done(self) -> bool:
+        """
+        Check if the job finished successfully.
+
+        Returns:
+            bool: True if the job is done, False otherwise
+        """
+        return self.status() == "DONE"
+
+    def running(self) -> bool:
+        """
+        Check if the job is running.
+
+        Returns:
+            bool: True if the job is running, False otherwise
+        """
+        return self.status() == "RUNNING"
+
+    def errored(self) -> bool:
+        """
+        Check if the job failed.
+
+        Returns:
+            bool: True if the job failed, False otherwise
+        """
+        return self.status() == "ERROR"
+
+    def cancelled(self) -> bool:
+        """
+        Check if the job was cancelled.
+
+        Returns:
+            bool: True if the job was cancelled, False otherwise
+        """
+        return self._cancelled
+
+    def in_final_state(self) -> bool:
+        """
+        Check if the job is in a final state.
+
+        Returns:
+            bool: True if the job is done, failed or cancelled, False otherwise
+        """
+        return self.status() in ("DONE", "ERROR", "CANCELLED")
+
+    def cancel(self) -> None:
+        """
+        Cancel the job.
+
+        Raises:
+            RuntimeInvalidStateError: If the job already finished
+        """
+        if self.in_final_state():
+            raise RuntimeInvalidStateError(f"Job {self._job_id} is already in a final state")
+        self._cancelled = True
+
+    def wait_for_final_state(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until the job is in a final state.
+
+        Args:
+            timeout: Seconds to wait before raising, or None to wait indefinitely
+
+        Raises:
+            TimeoutError: If the job does not finish within the timeout
+        """
+        if self._cancelled:
+            return
+        remaining = self._submitted + self._queue_latency + self._execution_latency - self._clock()
+        if timeout is not None and remaining > timeout:
+            time.sleep(max(timeout, 0.0))
+            raise TimeoutError(f"Job {self._job_id} did not finish within {timeout} seconds")
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def result(self, timeout: Optional[float] = None) -> PrimitiveResult:
+        """
+        Wait for the job and return its result.
+
+        Args:
+            timeout: Seconds to wait before raising, or None to wait indefinitely
+
+        Returns:
+            PrimitiveResult: The sampler result
+
+        Raises:
+            RuntimeJobFailureError: If the job failed
+            RuntimeInvalidStateError: If the job was cancelled
+        """
+        self.wait_for_final_state(timeout)
+        status = self.status()
+        if status == "CANCELLED":
+            raise RuntimeInvalidStateError(f"Job {self._job_id} was cancelled")
+        if status == "ERROR":
+            raise RuntimeJobFailureError(f"Job {self._job_id} failed (injected failure)")
+        if self._result is None:
+            self._result = self._run()
+        return self._result
+
+
+class LocalSampler:
+    """
+    Offline stand-in for the Qiskit Runtime ``SamplerV2``.
+
+    Pubs are executed on Aer's ``SamplerV2``; when a ``BackendV2`` (e.g. a fake backend) is
+    given, its noise model is used. Each submission returns a :class:`LocalRuntimeJob` with
+    sampled queue and execution latencies, failing with probability ``failure_rate``.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Union[BackendV2, str]] = None,
+        *,
+        queue_latency: Latency = 0.0,
+        execution_latency: Latency = 0.0,
+        failure_rate: float = 0.0,
+        default_shots: int = 1024,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize a LocalSampler object.
+
+        Args:
+            backend: Backend whose noise model is simulated (ignored if not a BackendV2)
+            queue_latency: Seconds each job stays queued, or a (low, high) range
+            execution_latency: Seconds each job stays running, or a (low, high) range
+            failure_rate: Probability that a job ends in the ``ERROR`` state
+            default_shots: Number of shots when a pub does not specify them
+            seed: Seed for the latency and failure sampling and for the simulator
+        """
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0 and 1")
+        options = {"default_shots": default_shots, "seed": seed}
+        if isinstance(backend, BackendV2):
+            self._sampler = AerSampler.from_backend(backend, **options)
+        else:
+            self._sampler = AerSampler(**options)
+        self._queue_latency = queue_latency
+        self._execution_latency = execution_latency
+        self._failure_rate = failure_rate
+        self._rng = np.random.default_rng(seed)
+
+    def run(
+        self, pubs: Union[QuantumCircuit, Iterable], *, shots: Optional[int] = None
+    ) -> LocalRuntimeJob:
+        """
+        Submit pubs for (deferred) execution.
+
+        Args:
+            pubs: A circuit or an iterable of sampler pubs
+            shots: Number of shots for pubs that do not specify them
+
+        Returns:
+            LocalRuntimeJob: The submitted job
+        """
+        if isinstance(pubs, QuantumCircuit):
+            pubs = [pubs]
+        pubs = list(pubs)
+        sampler = self._sampler
+        return LocalRuntimeJob(
+            lambda: sampler.run(pubs, shots=shots).result(),
+            queue_latency=self._sample(self._queue_latency),
+            execution_latency=self._sample(self._execution_latency),
+            fail=bool(self._rng.random() < self._failure_rate),
+        )
+
+    def _sample(self, latency: Latency) -> float:
+        """Sample a latency in seconds."""
+        if isinstance(latency, tuple):
+            return float(self._rng.uniform(*latency))
+        return float(latency)
+
+
+class LocalRuntimeService(QiskitRuntimeService):
+    """
+    Offline QiskitRuntimeService backed by a :class:`LocalSampler`.
+
+    The service exposes the same run / status / results pipeline as
+    :class:`~qward.runtime.QiskitRuntimeService` without connecting to IBM Quantum.
+    """
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        backend: Optional[Union[BackendV2, str]] = None,
+        *,
+        sampler: Optional[LocalSampler] = None,
+        **sampler_options,
+    ):
+        """
+        Initialize a LocalRuntimeService object.
+
+        Args:
+            circuit: The quantum circuit to execute
+            backend: The backend whose noise model is simulated, if any
+            sampler: Sampler shared between services (takes precedence over the options)
+            **sampler_options: Options for a new :class:`LocalSampler` (latencies,
+                failure_rate, default_shots, seed)
+        """
+        self._sampler = sampler or LocalSampler(backend, **sampler_options)
+        super().__init__(circuit, backend if backend is not None else "local_aer")
+
+    def _connect(self, **kwargs) -> None:
+        """
+        No service connection is needed offline.
+
+        Args:
+            **kwargs: Ignored
+        """
+        pass
+
+    def _create_sampler(self) -> LocalSampler:
+        """
+        Get the local sampler used to run the circuit.
+
+        Returns:
+            LocalSampler: The sampler
+        """
+        return self._sampler
@@ -6,6 +6,7 @@ import time
 from typing import Any, Dict, Optional, Union
 
 from qiskit import QuantumCircuit
+from qiskit.primitives import PrimitiveResult
 from qiskit.providers import Backend
 from qiskit_aer import AerJob
 from qiskit.providers.job import Job as QiskitJob
@@ -35,12 +36,30 @@ class QiskitRuntimeService(QiskitRuntimeServiceBase):
             backend: The backend to execute the circuit on
             **kwargs: Additional arguments to pass to the QiskitRuntimeService constructor
         """
-        super().__init__(**kwargs)
+        self._connect(**kwargs)
         self._circuit = circuit
         self._backend = backend
         self._job: Optional[Union[AerJob, QiskitJob]] = None
         self._result: Optional[Result] = None
 
+    def _connect(self, **kwargs) -> None:
+        """
+        Initialize the underlying Qiskit Runtime service connection.
+
+        Args:
+            **kwargs: Arguments for the QiskitRuntimeService constructor
+        """
+        super().__init__(**kwargs)
+
+    def _create_sampler(self) -> Sampler:
+        """
+        Create the sampler used to run the circuit.
+
+        Returns:
+            Sampler: The sampler
+        """
+        return Sampler(backend=self._backend)
+
     @property
     def circuit(self) -> QuantumCircuit:
         """
@@ -98,10 +117,10 @@ class QiskitRuntimeService(QiskitRuntimeServiceBase):
         Run the circuit on the backend.
         """
         # Create a sampler
-        sampler = Sampler(backend=self._backend)
+        sampler = self._create_sampler()
 
         # Run the circuit
-        self._job = sampler.run(self._circuit)
+        self._job = sampler.run([self._circuit])
 
     def check_status(self) -> str:
         """
@@ -113,7 +132,9 @@ class QiskitRuntimeService(QiskitRuntimeServiceBase):
         if self._job is None:
             return "No job"
 
-        return self._job.status().name
+        # Runtime V2 jobs report plain strings, other jobs a JobStatus enum
+        status = self._job.status()
+        return status if isinstance(status, str) else status.name
 
     def get_results(self) -> Result:
         """
@@ -131,7 +152,7 @@ class QiskitRuntimeService(QiskitRuntimeServiceBase):
         # Create a Result object
         self._result = Result(
             job=self._job,
-            counts=job_result.get_counts() if hasattr(job_result, "get_counts") else {},
+            counts=self._get_counts(job_result),
             metadata=job_result.metadata if hasattr(job_result, "metadata") else {},
         )
 
@@ -176,6 +197,24 @@ class QiskitRuntimeService(QiskitRuntimeServiceBase):
         # Get the results
         return self.get_results()
 
+    @staticmethod
+    def _get_counts(job_result: Any) -> Dict[str, int]:
+        """
+        Extract the measurement counts from a job result.
+
+        Args:
+            job_result: A backend result (with ``get_counts``) or a sampler PrimitiveResult
+
+        Returns:
+            Dict[str, int]: The counts of the first circuit, or an empty dict
+        """
+        if hasattr(job_result, "get_counts"):
+            return job_result.get_counts()
+        if isinstance(job_result, PrimitiveResult) and len(job_result) > 0:
+            # Sampler results hold one bit array per classical register
+            return job_result[0].join_data().get_counts()
+        return {}
+
     def _create_result(self, job: QiskitJob) -> Result:
         """
         Create a Result object from a Qiskit job.
@@ -2,15 +2,26 @@
 Scanner class for QWARD.
 """
 
-from typing import Any, Dict, List, Optional, Union, Tuple
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
 import pandas as pd
 
 from qiskit import QuantumCircuit
 from qiskit_aer import AerJob
+from qiskit.providers import BackendV2
 from qiskit.providers.job import Job as QiskitJob
+from qiskit.transpiler import Target
 
 from qward.metrics.base_metric import Metric
+from qward.metrics.runtime_jobs import RuntimeJobsMixin
+from qward.batch import DEFAULT_BATCH_METRICS, DEFAULT_CACHE_SIZE, iter_scan_circuits, scan_circuits
+from qward.dataset import DEFAULT_MEMORY_BUDGET, ScanDataset, scan_circuits_chunked
 from qward.result import Result
+from qward.store import MetricsStore
+from qward.sweep import DEFAULT_SWEEP_METRICS, TranspileCache, transpile_sweep
+from qward.utils.dtypes import compact_frame
+from qward.utils.flatten import flatten_dict
 
 
 class Scanner:
@@ -109,74 +120,269 @@ class Scanner:
         """
         self._metrics.append(metric)
 
-    def calculate_metrics(self) -> Dict[str, pd.DataFrame]:
+    def calculate_metrics(self, compact: bool = False) -> Dict[str, pd.DataFrame]:
         """
         Calculate metrics for all jobs.
 
+        Args:
+            compact: Convert the DataFrames to compact dtypes (downcast numbers, categorical
+                strings, sparse columns for counts mappings; see
+                :func:`qward.utils.dtypes.compact_frame`). The memory saved is reported in
+                the ``attrs`` of every DataFrame and summarized by
+                :func:`qward.utils.dtypes.memory_report`.
+
         Returns:
             Dict[str, pd.DataFrame]: Dictionary containing DataFrames for each metric type.
             For SuccessRate metrics, returns two DataFrames:
             - "SuccessRate.individual_jobs": DataFrame containing metrics for each job
             - "SuccessRate.aggregate": DataFrame containing aggregate metrics across all jobs
         """
-        # Initialize a dictionary to store DataFrames for each metric type
         metric_dataframes = {}
+        for metric in self.metrics:
+            metric_dataframes.update(self._metric_frames(metric, compact))
+        return metric_dataframes
 
-        # Calculate metrics for each metric class
-        for _, metric_class in enumerate(self.metrics):
-            # Get the metrics from the metric class
-            metric_results = metric_class.get_metrics()
-
-            # Create a DataFrame for this metric type
-            metric_name = metric_class.__class__.__name__
-
-            # Special handling for SuccessRate metrics
-            if metric_name == "SuccessRate":
-                if "individual_jobs" in metric_results:
-                    # Multiple jobs case - already formatted correctly
-                    individual_jobs_df = pd.DataFrame(metric_results["individual_jobs"])
-                    metric_dataframes[f"{metric_name}.individual_jobs"] = individual_jobs_df
-
-                    # Create DataFrame for aggregate metrics
-                    aggregate_metrics = metric_results["aggregate"]
-                    aggregate_df = pd.DataFrame([aggregate_metrics])
-                    metric_dataframes[f"{metric_name}.aggregate"] = aggregate_df
-                else:
-                    # Single job case - format it like multiple jobs case
-                    # Create individual jobs DataFrame
-                    individual_jobs_df = pd.DataFrame([metric_results])
-                    metric_dataframes[f"{metric_name}.individual_jobs"] = individual_jobs_df
-
-                    # Create aggregate metrics
-                    aggregate_metrics = {
-                        "mean_success_rate": metric_results["success_rate"],
-                        "std_success_rate": 0.0,  # No std dev for single job
-                        "min_success_rate": metric_results["success_rate"],
-                        "max_success_rate": metric_results["success_rate"],
-                        "total_trials": metric_results["total_shots"],
-                        "fidelity": metric_results["fidelity"],
-                        "error_rate": metric_results["error_rate"],
-                    }
-                    aggregate_df = pd.DataFrame([aggregate_metrics])
-                    metric_dataframes[f"{metric_name}.aggregate"] = aggregate_df
-            else:
-                # Handle other metrics normally
-                flattened_metrics = {}
-                for key, value in metric_results.items():
-                    if isinstance(value, dict):
-                        for subkey, subvalue in value.items():
-                            flattened_metrics[f"{key}.{subkey}"] = subvalue
-                    else:
-                        flattened_metrics[key] = value
-
-                # Create DataFrame for this metric type
-                df = pd.DataFrame([flattened_metrics])
-                metric_dataframes[metric_name] = df
+    async def calculate_metrics_async(
+        self, executor: Optional[Executor] = None, compact: bool = False
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Calculate metrics for all jobs without blocking the event loop.
 
+        PRE_RUNTIME metrics are computed right away in the executor. For metrics with runtime
+        jobs, the job results are fetched concurrently (each wait runs in the executor) and
+        kept by the metric, which is computed once its inputs are available without fetching
+        them again, so many scans can be served concurrently without being serialized on job
+        waits.
+
+        Args:
+            executor: Executor running the computations and job waits (None uses the
+                default executor of the event loop)
+            compact: Convert the DataFrames to compact dtypes
+
+        Returns:
+            Dict[str, pd.DataFrame]: The same DataFrames as ``calculate_metrics``, in the
+            order of the metrics
+        """
+        loop = asyncio.get_running_loop()
+
+        async def frames(metric: Metric) -> Dict[str, pd.DataFrame]:
+            if isinstance(metric, RuntimeJobsMixin):
+                # The results are kept by the metric, so computing it does not fetch them again
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, metric.job_result, job)
+                        for job in metric.runtime_jobs
+                    )
+                )
+            return await loop.run_in_executor(executor, self._metric_frames, metric, compact)
+
+        metric_dataframes = {}
+        for result in await asyncio.gather(*(frames(metric) for metric in self.metrics)):
+            metric_dataframes.update(result)
         return metric_dataframes
 
+    def iter_metrics(
+        self, max_workers: Optional[int] = None, compact: bool = False
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Calculate the metrics progressively, yielding every DataFrame as soon as it is ready.
+
+        Without workers, the metrics are computed lazily in order, one per iteration step.
+        With workers, they are computed in a thread pool and yielded in completion order,
+        so cheap PRE_RUNTIME metrics are not held back by metrics waiting for jobs.
+
+        Args:
+            max_workers: Number of worker threads (None computes the metrics in order in the
+                calling thread)
+            compact: Convert the DataFrames to compact dtypes
+
+        Yields:
+            Tuple[str, pd.DataFrame]: The DataFrame name (as in ``calculate_metrics``) and
+            the DataFrame
+        """
+        if max_workers is None:
+            for metric in self.metrics:
+                yield from self._metric_frames(metric, compact).items()
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._metric_frames, metric, compact) for metric in self.metrics
+            ]
+            for future in as_completed(futures):
+                yield from future.result().items()
+
+    @staticmethod
+    def _metric_frames(metric: Metric, compact: bool = False) -> Dict[str, pd.DataFrame]:
+        """
+        Calculate the DataFrames of a single metric.
+
+        Args:
+            metric: The metric
+            compact: Convert the DataFrames to compact dtypes
+
+        Returns:
+            Dict[str, pd.DataFrame]: The DataFrames keyed by metric name (and table suffix)
+        """
+        metric_name = metric.__class__.__name__
+
+        # Metrics with a typed record are assembled column-wise from the record
+        record = metric.get_record()
+        if record is not None:
+            frames = {
+                f"{metric_name}.{suffix}" if suffix else metric_name: df
+                for suffix, df in record.to_frames().items()
+            }
+        else:
+            # Otherwise fall back to the metrics dictionary
+            metric_results = metric.get_metrics()
+            if "individual_jobs" in metric_results and "aggregate" in metric_results:
+                frames = {
+                    f"{metric_name}.individual_jobs": pd.DataFrame(
+                        metric_results["individual_jobs"]
+                    ),
+                    f"{metric_name}.aggregate": pd.DataFrame([metric_results["aggregate"]]),
+                }
+            else:
+                frames = {metric_name: pd.DataFrame([flatten_dict(metric_results)])}
+
+        if compact:
+            frames = {name: compact_frame(frame) for name, frame in frames.items()}
+        return frames
+
+    @staticmethod
+    def scan_batch(
+        circuits: Iterable[QuantumCircuit],
+        metrics: Sequence[Type[Metric]] = DEFAULT_BATCH_METRICS,
+        names: Optional[Sequence[str]] = None,
+        dedup: bool = True,
+        store: Optional[MetricsStore] = None,
+        backend: str = "",
+    ) -> pd.DataFrame:
+        """
+        Calculate pre-runtime metrics for a batch of circuits, one row per circuit.
+
+        See :func:`qward.batch.scan_circuits`.
+
+        Args:
+            circuits: The circuits to analyze
+            metrics: Pre-runtime metric classes, instantiated with each circuit
+            names: Names of the circuits (defaults to the circuit names)
+            dedup: Compute metrics once per group of structurally identical circuits
+            store: Metrics store to read from and write into; only missing or stale
+                entries are computed
+            backend: Backend label of the entries in the store
+
+        Returns:
+            pd.DataFrame: One row per circuit; ``attrs`` reports the dedup ratio
+        """
+        return scan_circuits(
+            circuits, metrics, names=names, dedup=dedup, store=store, backend=backend
+        )
+
+    @staticmethod
+    def iter_batch(
+        circuits: Iterable[QuantumCircuit],
+        metrics: Sequence[Type[Metric]] = DEFAULT_BATCH_METRICS,
+        names: Optional[Iterable[str]] = None,
+        dedup: bool = True,
+        cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Calculate pre-runtime metrics for a stream of circuits, yielding one row per circuit.
+
+        See :func:`qward.batch.iter_scan_circuits`.
+
+        Args:
+            circuits: The circuits to analyze (any iterable, e.g. a generator)
+            metrics: Pre-runtime metric classes, instantiated with each circuit
+            names: Names of the circuits (defaults to the circuit names)
+            dedup: Reuse the row of a structurally identical circuit seen earlier
+            cache_size: Maximum number of rows kept for dedup (None keeps all distinct rows)
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: The circuit name and its row
+
+        Raises:
+            ValueError: If there are fewer names than circuits
+        """
+        return iter_scan_circuits(circuits, metrics, names, dedup, cache_size)
+
+    @staticmethod
+    def scan_batch_chunked(
+        circuits: Iterable[QuantumCircuit],
+        directory: str,
+        metrics: Sequence[Type[Metric]] = DEFAULT_BATCH_METRICS,
+        names: Optional[Iterable[str]] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        dedup: bool = True,
+        cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+    ) -> ScanDataset:
+        """
+        Calculate pre-runtime metrics for a corpus within a memory budget.
+
+        See :func:`qward.dataset.scan_circuits_chunked`.
+
+        Args:
+            circuits: The circuits to analyze (any iterable, e.g. a generator)
+            directory: Directory receiving the Parquet partitions
+            metrics: Pre-runtime metric classes, instantiated with each circuit
+            names: Names of the circuits (defaults to the circuit names)
+            memory_budget: Approximate memory of the buffered rows, in bytes
+            dedup: Reuse the row of a structurally identical circuit seen recently
+            cache_size: Maximum number of rows kept for dedup (None keeps all distinct rows)
+
+        Returns:
+            ScanDataset: Lazy handle of the written partitions
+        """
+        return scan_circuits_chunked(
+            circuits,
+            directory,
+            metrics,
+            names,
+            memory_budget=memory_budget,
+            dedup=dedup,
+            cache_size=cache_size,
+        )
+
+    def transpile_sweep(
+        self,
+        backend: Union[BackendV2, Target],
+        optimization_levels: Sequence[int] = (0, 1, 2, 3),
+        seeds: Sequence[Optional[int]] = (None,),
+        metrics: Sequence[Type[Metric]] = DEFAULT_SWEEP_METRICS,
+        max_workers: Optional[int] = None,
+        cache: Optional[TranspileCache] = None,
+    ) -> pd.DataFrame:
+        """
+        Compare metrics of the circuit transpiled for a grid of optimization levels and seeds.
+
+        See :func:`qward.sweep.transpile_sweep`.
+
+        Args:
+            backend: The backend or target to transpile against
+            optimization_levels: Optimization levels of the grid
+            seeds: Transpiler seeds of the grid
+            metrics: Pre-runtime metric classes computed for every variant
+            max_workers: Number of worker processes (None uses all CPUs, 1 runs in-process)
+            cache: Cache of transpiled circuits reused across sweeps
+
+        Returns:
+            pd.DataFrame: One row per variant
+        """
+        if self._circuit is None:
+            raise ValueError("A circuit is needed for a transpilation sweep")
+        return transpile_sweep(
+            self._circuit,
+            backend,
+            optimization_levels=optimization_levels,
+            seeds=seeds,
+            metrics=metrics,
+            max_workers=max_workers,
+            cache=cache,
+        )
+
     def _flatten_dict(
-        self, d: Dict[str, Any], parent_key: str = "", sep: str = "_"
+        self, d: Dict[str, Any], parent_key: str = "", sep: str = "."
     ) -> Dict[str, Any]:
         """
         Flatten a nested dictionary.
@@ -189,14 +395,7 @@ class Scanner:
         Returns:
             Dict[str, Any]: The flattened dictionary
         """
-        items: List[Tuple[str, Any]] = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
+        return flatten_dict(d, parent_key, sep)
 
     def set_circuit(self, circuit: QuantumCircuit) -> None:
         """
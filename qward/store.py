@@ -0,0 +1,278 @@
+"""
+On-disk metrics store for QWARD.
+
+Metric values are stored in SQLite, keyed by circuit fingerprint, metric id, backend label
+and qward version, with one row per metric column. Rescans only compute the entries that
+are missing or were produced by another qward version, and the indexed value column
+supports queries such as "all circuits with depth > 500 on backend X".
+"""
+
+import json
+import math
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+from qward.utils.portable import portable_value
+from qward.version import __version__
+
+_OPERATORS = frozenset({"<", "<=", "=", "==", ">=", ">", "!="})
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    fingerprint TEXT NOT NULL,
+    metric_id TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    version TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, metric_id, backend)
+);
+CREATE TABLE IF NOT EXISTS metric_values (
+    fingerprint TEXT NOT NULL,
+    metric_id TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    column_name TEXT NOT NULL,
+    value REAL,
+    int_value INTEGER,
+    json TEXT,
+    PRIMARY KEY (fingerprint, metric_id, backend, column_name)
+);
+CREATE INDEX IF NOT EXISTS metric_values_by_value
+    ON metric_values (column_name, backend, value);
+CREATE TABLE IF NOT EXISTS circuits (
+    name TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    PRIMARY KEY (name, backend)
+);
+CREATE INDEX IF NOT EXISTS circuits_by_fingerprint ON circuits (fingerprint, backend);
+"""
+
+
+class MetricsStore:
+    """
+    SQLite store of metric values keyed by circuit fingerprint, metric id and qward version.
+
+    Numeric values are stored in an indexed ``value`` column, integers also exactly in
+    ``int_value``; other values (strings, lists, mappings, NaN and integers beyond 64 bits)
+    are stored as JSON and returned as decoded objects. Values are converted to plain data
+    with :func:`~qward.utils.portable.portable_value` first (e.g. instruction lists become
+    operation names), so a stored row reads back equal to the converted computed row.
+    """
+
+    def __init__(self, path: str = ":memory:", version: str = __version__):
+        """
+        Initialize a MetricsStore object.
+
+        Args:
+            path: Path of the SQLite database (created if needed)
+            version: Version tag of the stored entries; entries with another tag are stale
+        """
+        self._path = path
+        self._version = version
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    @property
+    def version(self) -> str:
+        """
+        Get the version tag of fresh entries.
+
+        Returns:
+            str: The version tag
+        """
+        return self._version
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()
+
+    def __enter__(self) -> "MetricsStore":
+        """Use the store as a context manager closing the connection on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the database connection."""
+        self.close()
+
+    def missing(self, fingerprints: Iterable[str], metric_id: str, backend: str = "") -> Set[str]:
+        """
+        Get the fingerprints whose entry for a metric is missing or stale.
+
+        Args:
+            fingerprints: The circuit fingerprints
+            metric_id: The metric id
+            backend: The backend label
+
+        Returns:
+            Set[str]: The fingerprints to (re)compute
+        """
+        fingerprints = set(fingerprints)
+        fresh = {
+            fingerprint
+            for (fingerprint,) in self._connection.execute(
+                "SELECT fingerprint FROM entries WHERE metric_id = ? AND backend = ? "
+                "AND version = ?",
+                (metric_id, backend, self._version),
+            )
+        }
+        return fingerprints - fresh
+
+    def put(
+        self,
+        fingerprint: str,
+        metric_id: str,
+        values: Dict[str, Any],
+        backend: str = "",
+    ) -> None:
+        """
+        Store (or replace) the values of a metric for a circuit.
+
+        Args:
+            fingerprint: The circuit fingerprint
+            metric_id: The metric id
+            values: Flat mapping from column names to values
+            backend: The backend label
+
+        Raises:
+            TypeError: If a value has no plain-data representation
+        """
+        self.put_many([(fingerprint, metric_id, values)], backend)
+
+    def put_many(
+        self, entries: Sequence[Tuple[str, str, Dict[str, Any]]], backend: str = ""
+    ) -> None:
+        """
+        Store (or replace) many metric entries in one transaction.
+
+        Args:
+            entries: (fingerprint, metric id, flat values) triples
+            backend: The backend label
+
+        Raises:
+            TypeError: If a value has no plain-data representation
+        """
+        with self._connection:
+            for fingerprint, metric_id, values in entries:
+                key = (fingerprint, metric_id, backend)
+                self._connection.execute(
+                    "DELETE FROM metric_values WHERE fingerprint = ? AND metric_id = ? "
+                    "AND backend = ?",
+                    key,
+                )
+                self._connection.executemany(
+                    "INSERT INTO metric_values VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (*key, position, column, *_encode(value))
+                        for position, (column, value) in enumerate(values.items())
+                    ],
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (*key, self._version)
+                )
+
+    def get(self, fingerprint: str, metric_id: str, backend: str = "") -> Dict[str, Any]:
+        """
+        Get the stored values of a metric for a circuit.
+
+        Args:
+            fingerprint: The circuit fingerprint
+            metric_id: The metric id
+            backend: The backend label
+
+        Returns:
+            Dict[str, Any]: Flat mapping from column names to values (empty if missing)
+        """
+        cursor = self._connection.execute(
+            "SELECT column_name, value, int_value, json FROM metric_values WHERE fingerprint = ? "
+            "AND metric_id = ? AND backend = ? ORDER BY position",
+            (fingerprint, metric_id, backend),
+        )
+        return {column: _decode(*stored) for column, *stored in cursor}
+
+    def add_circuits(
+        self, names: Sequence[str], fingerprints: Sequence[str], backend: str = ""
+    ) -> None:
+        """
+        Record the fingerprints of named circuits.
+
+        Args:
+            names: The circuit names
+            fingerprints: Their fingerprints
+            backend: The backend label
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO circuits VALUES (?, ?, ?)",
+                [(name, fingerprint, backend) for name, fingerprint in zip(names, fingerprints)],
+            )
+
+    def query(
+        self, column: str, operator: str, value: float, backend: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Find the circuits whose metric column satisfies a numeric condition.
+
+        Example: ``store.query("QiskitMetrics.basic_metrics.depth", ">", 500, "ibm_x")``.
+
+        Args:
+            column: The metric column (``<metric name>.<column>``)
+            operator: One of ``<``, ``<=``, ``=``, ``>=``, ``>`` or ``!=``
+            value: The value to compare with
+            backend: Restrict to a backend label (None searches all backends)
+
+        Returns:
+            pd.DataFrame: Columns ``name`` (None for circuits stored without a name),
+            ``fingerprint``, ``backend`` and ``value``
+
+        Raises:
+            ValueError: If the operator is not supported
+        """
+        if operator not in _OPERATORS:
+            raise ValueError(f"Unsupported operator {operator!r}")
+        sql = (
+            "SELECT c.name, v.fingerprint, v.backend, v.value FROM metric_values v "
+            "JOIN entries e ON e.fingerprint = v.fingerprint AND e.metric_id = v.metric_id "
+            "AND e.backend = v.backend "
+            "LEFT JOIN circuits c ON c.fingerprint = v.fingerprint AND c.backend = v.backend "
+            f"WHERE v.column_name = ? AND v.value {operator} ? AND e.version = ?"
+        )
+        parameters: List[Any] = [column, value, self._version]
+        if backend is not None:
+            sql += " AND v.backend = ?"
+            parameters.append(backend)
+        return pd.DataFrame(
+            self._connection.execute(sql, parameters).fetchall(),
+            columns=["name", "fingerprint", "backend", "value"],
+        )
+
+
+def _encode(value: Any) -> Tuple[Optional[float], Optional[int], Optional[str]]:
+    """Split a value into its numeric, integer and JSON representations."""
+    value = portable_value(value)
+    if isinstance(value, bool) or value is None:
+        return None, None, json.dumps(value)
+    if isinstance(value, int):
+        # SQLite integers have 64 bits; larger integers are kept exactly as JSON
+        if _INT64_MIN <= value <= _INT64_MAX:
+            return float(value), value, None
+        return float(value), None, json.dumps(value)
+    if isinstance(value, float):
+        # SQLite stores NaN as NULL
+        return (None, None, json.dumps(value)) if math.isnan(value) else (value, None, None)
+    return None, None, json.dumps(value)
+
+
+def _decode(value: Optional[float], int_value: Optional[int], encoded: Optional[str]) -> Any:
+    """Rebuild a value from its stored representations."""
+    if encoded is not None:
+        return json.loads(encoded)
+    if int_value is not None:
+        return int_value
+    return value
@@ -0,0 +1,205 @@
+"""
+Transpilation sweeps for QWARD.
+
+A sweep transpiles a circuit against a target for a grid of optimization levels and seeds
+in worker processes, computes pre-runtime metrics for every variant and returns a single
+DataFrame comparing them. Transpiled circuits are cached by the fingerprints of the input
+circuit and of the target, so repeated sweeps only transpile the missing variants.
+"""
+
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union
+
+import pandas as pd
+from qiskit import QuantumCircuit, qpy, transpile
+from qiskit.providers import BackendV2
+from qiskit.transpiler import Target
+
+from qward.batch import metric_columns
+from qward.metrics.base_metric import Metric
+from qward.metrics.complexity_metrics import ComplexityMetrics
+from qward.metrics.qiskit_metrics import QiskitMetrics
+from qward.utils.fingerprint import circuit_fingerprint, target_fingerprint
+
+# (circuit fingerprint, target fingerprint, optimization level, seed)
+CacheKey = Tuple[str, str, int, Optional[int]]
+
+DEFAULT_SWEEP_METRICS: Tuple[Type[Metric], ...] = (QiskitMetrics, ComplexityMetrics)
+
+
+class TranspileCache:
+    """
+    Cache of transpiled circuits keyed by circuit and target fingerprints.
+
+    Entries are kept in memory and, when a directory is given, also stored as QPY files so
+    they survive across sessions. Sweeps without a seed are cached too: the first transpiled
+    output is reused for later sweeps.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize a TranspileCache object.
+
+        Args:
+            directory: Directory where transpiled circuits are persisted, if any
+        """
+        self._directory = directory
+        self._circuits: Dict[CacheKey, QuantumCircuit] = {}
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached circuits held in memory.
+
+        Returns:
+            int: The number of entries
+        """
+        return len(self._circuits)
+
+    def get(self, key: CacheKey) -> Optional[QuantumCircuit]:
+        """
+        Get a cached transpiled circuit.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Optional[QuantumCircuit]: The transpiled circuit, or None if not cached
+        """
+        circuit = self._circuits.get(key)
+        if circuit is None and self._directory is not None:
+            path = self._path(key)
+            if os.path.exists(path):
+                with open(path, "rb") as file:
+                    circuit = qpy.load(file)[0]
+                self._circuits[key] = circuit
+        return circuit
+
+    def put(self, key: CacheKey, circuit: QuantumCircuit) -> None:
+        """
+        Cache a transpiled circuit.
+
+        Args:
+            key: The cache key
+            circuit: The transpiled circuit
+        """
+        self._circuits[key] = circuit
+        if self._directory is not None:
+            with open(self._path(key), "wb") as file:
+                qpy.dump(circuit, file)
+
+    def _path(self, key: CacheKey) -> str:
+        """Get the file storing a cache entry."""
+        circuit, target, level, seed = key
+        return os.path.join(self._directory, f"{circuit}-{target}-o{level}-s{seed}.qpy")
+
+
+def transpile_sweep(
+    circuit: QuantumCircuit,
+    backend: Union[BackendV2, Target],
+    optimization_levels: Sequence[int] = (0, 1, 2, 3),
+    seeds: Sequence[Optional[int]] = (None,),
+    metrics: Sequence[Type[Metric]] = DEFAULT_SWEEP_METRICS,
+    max_workers: Optional[int] = None,
+    cache: Optional[TranspileCache] = None,
+) -> pd.DataFrame:
+    """
+    Transpile a circuit for a grid of optimization levels and seeds and compare the variants.
+
+    Args:
+        circuit: The circuit to transpile
+        backend: The backend or target to transpile against
+        optimization_levels: Optimization levels of the grid
+        seeds: Transpiler seeds of the grid
+        metrics: Metric classes computed for every transpiled variant (instantiated with the
+            circuit only, so they must be pre-runtime metrics)
+        max_workers: Number of worker processes (None uses all CPUs, 1 runs in-process)
+        cache: Cache of transpiled circuits reused across sweeps
+
+    Returns:
+        pd.DataFrame: One row per variant with the columns ``optimization_level``, ``seed``,
+        ``fingerprint`` (of the transpiled circuit), ``transpile_time`` and ``cached``,
+        followed by the metric columns prefixed with the metric name
+    """
+    target = backend.target if isinstance(backend, BackendV2) else backend
+    source_fingerprint = circuit_fingerprint(circuit)
+    device_fingerprint = target_fingerprint(target)
+    grid = list(itertools.product(optimization_levels, seeds))
+
+    tasks = []
+    for level, seed in grid:
+        key = (source_fingerprint, device_fingerprint, level, seed)
+        cached = cache.get(key) if cache is not None else None
+        tasks.append((key, cached))
+
+    arguments = [
+        (circuit, cached, level, seed, tuple(metrics)) for (_, _, level, seed), cached in tasks
+    ]
+    if max_workers == 1 or len(tasks) <= 1:
+        outputs = [_run_variant(*argument, target=target) for argument in arguments]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_initialize_worker, initargs=(target,)
+        ) as executor:
+            outputs = list(executor.map(_run_variant, *zip(*arguments)))
+
+    rows = []
+    for (key, cached), (transpiled, seconds, metric_row) in zip(tasks, outputs):
+        if cache is not None and cached is None:
+            cache.put(key, transpiled)
+        rows.append(
+            {
+                "optimization_level": key[2],
+                "seed": key[3],
+                "fingerprint": circuit_fingerprint(transpiled),
+                "transpile_time": seconds,
+                "cached": cached is not None,
+                **metric_row,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+# Target shared by the tasks of a worker process (only set in pool workers)
+_WORKER_TARGET: Optional[Target] = None
+
+
+def _initialize_worker(target: Target) -> None:
+    """Store the target once per pool worker process instead of once per task."""
+    global _WORKER_TARGET
+    _WORKER_TARGET = target
+
+
+def _run_variant(
+    circuit: QuantumCircuit,
+    transpiled: Optional[QuantumCircuit],
+    optimization_level: int,
+    seed: Optional[int],
+    metrics: Tuple[Type[Metric], ...],
+    target: Optional[Target] = None,
+) -> Tuple[QuantumCircuit, Optional[float], Dict[str, Any]]:
+    """
+    Transpile one variant (unless cached) and compute its metrics.
+
+    The target is passed explicitly when running in-process; pool workers leave it None and
+    use the target stored by :func:`_initialize_worker`.
+
+    Returns:
+        Tuple[QuantumCircuit, Optional[float], Dict[str, Any]]: The transpiled circuit, the
+        transpilation time (None if cached) and the flattened metric columns
+    """
+    seconds = None
+    if transpiled is None:
+        start = time.perf_counter()
+        transpiled = transpile(
+            circuit,
+            target=_WORKER_TARGET if target is None else target,
+            optimization_level=optimization_level,
+            seed_transpiler=seed,
+        )
+        seconds = time.perf_counter() - start
+    return transpiled, seconds, metric_columns(transpiled, metrics)
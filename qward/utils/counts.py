@@ -0,0 +1,234 @@
+"""
+Helpers for working with measurement counts as aligned NumPy / SciPy arrays.
+"""
+
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+def normalize_key(key: str) -> str:
+    """
+    Normalize a counts key by removing the spaces separating classical registers.
+
+    Args:
+        key: The counts key (e.g. ``"01 1"``)
+
+    Returns:
+        str: The bitstring without separators (e.g. ``"011"``)
+    """
+    return key.replace(" ", "")
+
+
+def counts_of(source: Any) -> Dict[str, float]:
+    """
+    Get the measurement counts of a job, a result or a counts mapping.
+
+    Args:
+        source: A counts mapping, a :class:`~qward.Result`, a job, or a job result (either
+            with ``get_counts()`` or a sampler ``PrimitiveResult``)
+
+    Returns:
+        Dict[str, float]: The counts
+    """
+    if isinstance(source, Mapping):
+        return dict(source)
+    counts = getattr(source, "counts", None)
+    if isinstance(counts, Mapping):
+        return dict(counts)
+    if hasattr(source, "result") and not hasattr(source, "get_counts"):
+        source = source.result()
+    if hasattr(source, "get_counts"):
+        return source.get_counts()
+    # Sampler primitive results hold one result per pub
+    return source[0].join_data().get_counts()
+
+
+def counts_to_arrays(counts: Mapping[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a counts (or probabilities) mapping to parallel key and value arrays.
+
+    Args:
+        counts: Mapping from bitstrings to counts or probabilities
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The normalized keys (as a string array) and the
+        values (as a float array)
+    """
+    keys = np.array([normalize_key(key) for key in counts], dtype=str)
+    values = np.fromiter(counts.values(), dtype=float, count=len(counts))
+    return keys, values
+
+
+def align_counts(
+    distributions: Sequence[Mapping[str, float]], normalize: bool = True
+) -> Tuple[np.ndarray, sparse.csr_matrix]:
+    """
+    Align several counts mappings on the union of their observed outcomes.
+
+    The result is a sparse matrix with one row per distribution and one column per distinct
+    outcome, so memory scales with the number of observed (distribution, outcome) pairs
+    rather than with the number of possible outcomes.
+
+    Args:
+        distributions: Counts or probability mappings
+        normalize: Scale every row to sum to one (rows summing to zero are left as is)
+
+    Returns:
+        Tuple[np.ndarray, sparse.csr_matrix]: The sorted union of outcomes and the
+        (distributions x outcomes) matrix
+    """
+    key_arrays = []
+    value_arrays = []
+    for counts in distributions:
+        keys, values = counts_to_arrays(counts)
+        key_arrays.append(keys)
+        value_arrays.append(values)
+    lengths = np.array([len(keys) for keys in key_arrays], dtype=np.int64)
+    if lengths.sum() == 0:
+        return np.array([], dtype=str), sparse.csr_matrix((len(distributions), 0))
+
+    outcomes, columns = np.unique(np.concatenate(key_arrays), return_inverse=True)
+    rows = np.repeat(np.arange(len(distributions)), lengths)
+    values = np.concatenate(value_arrays)
+    if normalize:
+        totals = np.bincount(rows, weights=values, minlength=len(distributions))
+        values = values / np.where(totals > 0, totals, 1.0)[rows]
+    matrix = sparse.csr_matrix(
+        (values, (rows, columns.ravel())), shape=(len(distributions), len(outcomes))
+    )
+    matrix.sum_duplicates()
+    return outcomes, matrix
+
+
+def row_sums(values: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+    """
+    Sum per-entry values of a CSR matrix row by row.
+
+    Args:
+        values: One value per stored entry of the matrix
+        indptr: The CSR row pointer array
+
+    Returns:
+        np.ndarray: The per-row sums (zero for empty rows)
+    """
+    num_rows = len(indptr) - 1
+    rows = np.repeat(np.arange(num_rows), np.diff(indptr))
+    return np.bincount(rows, weights=values, minlength=num_rows)
+
+
+def encode_counts(counts: Mapping[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode the outcomes of a counts mapping as integers.
+
+    Bit ``i`` of an encoded outcome is classical bit ``i`` (the ``i``-th character from the
+    right of the bitstring), so bit operations replace string slicing.
+
+    Args:
+        counts: Mapping from bitstrings to counts
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The encoded outcomes (uint64) and their counts
+
+    Raises:
+        ValueError: If the outcomes have more than 64 classical bits
+    """
+    keys, values = counts_to_arrays(counts)
+    if len(keys) and max(len(key) for key in keys) > 64:
+        raise ValueError("Integer-encoded outcomes support at most 64 classical bits")
+    outcomes = np.fromiter((int(key, 2) for key in keys), dtype=np.uint64, count=len(keys))
+    return outcomes, values
+
+
+def decode_outcomes(outcomes: np.ndarray, num_bits: int) -> List[str]:
+    """
+    Decode integer-encoded outcomes into bitstrings.
+
+    Args:
+        outcomes: The encoded outcomes
+        num_bits: Width of the bitstrings
+
+    Returns:
+        List[str]: The bitstrings
+    """
+    if num_bits == 0:
+        return ["" for _ in range(len(outcomes))]
+    shifts = np.arange(num_bits - 1, -1, -1, dtype=np.uint64)
+    bits = ((outcomes[:, None] >> shifts) & np.uint64(1)).astype(np.uint8) + ord("0")
+    return [row.decode() for row in np.ascontiguousarray(bits).view(f"S{num_bits}").ravel()]
+
+
+def marginalize_outcomes(outcomes: np.ndarray, clbits: Sequence[int]) -> np.ndarray:
+    """
+    Marginalize integer-encoded outcomes onto classical bits.
+
+    Bit ``i`` of a marginal outcome is classical bit ``clbits[i]`` of the full outcome,
+    matching the ordering of :func:`qiskit.result.marginal_counts`.
+
+    Args:
+        outcomes: The encoded outcomes
+        clbits: Indices of the classical bits to keep
+
+    Returns:
+        np.ndarray: The encoded marginal outcomes (not merged)
+    """
+    marginal = np.zeros(len(outcomes), dtype=np.uint64)
+    for position, clbit in enumerate(clbits):
+        marginal |= ((outcomes >> np.uint64(clbit)) & np.uint64(1)) << np.uint64(position)
+    return marginal
+
+
+def merge_outcomes(outcomes: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge the counts of repeated encoded outcomes.
+
+    Args:
+        outcomes: The encoded outcomes
+        values: Their counts
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The distinct outcomes (sorted) and their total counts
+    """
+    unique, inverse = np.unique(outcomes, return_inverse=True)
+    return unique, np.bincount(inverse.ravel(), weights=values, minlength=len(unique))
+
+
+def marginal_distribution(counts: Mapping[str, float], clbits: Sequence[int]) -> Dict[str, float]:
+    """
+    Marginalize counts or (quasi-)probabilities onto classical bits.
+
+    Args:
+        counts: Mapping from bitstrings to counts or (quasi-)probabilities
+        clbits: Indices of the classical bits to keep (bit ``i`` of the result is
+            ``clbits[i]``)
+
+    Returns:
+        Dict[str, float]: The marginal distribution
+    """
+    outcomes, values = encode_counts(counts)
+    outcomes, values = merge_outcomes(marginalize_outcomes(outcomes, clbits), values)
+    return dict(zip(decode_outcomes(outcomes, len(clbits)), values.tolist()))
+
+
+def bit_flip_rates(
+    outcomes: np.ndarray, values: np.ndarray, expected: int, num_bits: int
+) -> np.ndarray:
+    """
+    Compute the frequency with which each bit differs from an expected outcome.
+
+    Args:
+        outcomes: The encoded outcomes
+        values: Their counts
+        expected: The encoded expected outcome
+        num_bits: Number of bits to report
+
+    Returns:
+        np.ndarray: The flip frequency of every bit position (bit 0 first)
+    """
+    total = values.sum()
+    if total <= 0:
+        return np.zeros(num_bits)
+    flips = outcomes ^ np.uint64(expected)
+    bits = (flips[:, None] >> np.arange(num_bits, dtype=np.uint64)) & np.uint64(1)
+    return values @ bits.astype(float) / total
@@ -0,0 +1,141 @@
+"""
+Compact dtypes for QWARD DataFrames.
+
+Metric DataFrames default to int64/float64 columns, object strings and mapping-valued cells
+(e.g. ``average_counts``). :func:`compact_frame` rewrites a DataFrame with the smallest
+lossless dtypes: downcast integers and floats, categoricals for repeated strings, and
+mapping columns expanded into sparse numeric columns.
+"""
+
+from collections.abc import Mapping
+from numbers import Number
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+
+def compact_frame(
+    frame: pd.DataFrame, categorical_ratio: float = 0.5, expand_mappings: bool = True
+) -> pd.DataFrame:
+    """
+    Convert a DataFrame to compact dtypes.
+
+    * Integer columns are downcast to the smallest (unsigned if possible) integer type.
+    * Float columns are downcast to float32 when every value is exactly representable.
+    * String columns with at most ``categorical_ratio`` distinct values per row become
+      categoricals.
+    * Columns of numeric mappings become one sparse column per key, named
+      ``<column>.<key>``, with 0 for missing keys.
+
+    Other columns (booleans, lists, objects) are kept as they are. The memory usage before
+    and after the conversion is reported in ``attrs["original_bytes"]`` and
+    ``attrs["compact_bytes"]``.
+
+    Args:
+        frame: The DataFrame to convert
+        categorical_ratio: Maximum ratio of distinct values to rows for categoricals
+        expand_mappings: Expand columns of numeric mappings into sparse columns
+
+    Returns:
+        pd.DataFrame: A new DataFrame with the same rows
+    """
+    columns: Dict[str, pd.Series] = {}
+    for name, column in frame.items():
+        if pd.api.types.is_bool_dtype(column.dtype):
+            columns[name] = column
+        elif pd.api.types.is_integer_dtype(column.dtype):
+            downcast = "unsigned" if len(column) and column.min() >= 0 else "integer"
+            columns[name] = pd.to_numeric(column, downcast=downcast)
+        elif pd.api.types.is_float_dtype(column.dtype):
+            columns[name] = _downcast_float(column)
+        elif expand_mappings and _is_numeric_mapping_column(column):
+            for key, expanded in _expand_mappings(column).items():
+                columns[f"{name}.{key}"] = expanded
+        elif _is_string_column(column):
+            if column.nunique(dropna=True) <= categorical_ratio * len(column):
+                columns[name] = column.astype("category")
+            else:
+                columns[name] = column
+        else:
+            columns[name] = column
+
+    compact = pd.DataFrame(columns, index=frame.index)
+    compact.attrs.update(frame.attrs)
+    compact.attrs["original_bytes"] = int(frame.memory_usage(deep=True).sum())
+    compact.attrs["compact_bytes"] = int(compact.memory_usage(deep=True).sum())
+    return compact
+
+
+def memory_report(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Summarize the memory saved by :func:`compact_frame`.
+
+    Args:
+        frames: Compact DataFrames keyed by name (e.g. from
+            ``Scanner.calculate_metrics(compact=True)``)
+
+    Returns:
+        pd.DataFrame: One row per DataFrame with ``original_bytes``, ``compact_bytes``,
+        ``saved_bytes`` and ``ratio`` (compact over original), plus a ``total`` row
+    """
+    report = pd.DataFrame(
+        {
+            name: {
+                "original_bytes": frame.attrs.get("original_bytes", 0),
+                "compact_bytes": frame.attrs.get("compact_bytes", 0),
+            }
+            for name, frame in frames.items()
+        },
+        dtype=np.int64,
+    ).T
+    report.loc["total"] = report.sum()
+    report["saved_bytes"] = report["original_bytes"] - report["compact_bytes"]
+    report["ratio"] = report["compact_bytes"] / report["original_bytes"].where(
+        report["original_bytes"] > 0
+    )
+    return report
+
+
+def _downcast_float(column: pd.Series) -> pd.Series:
+    """Downcast a float column to float32 if no value changes."""
+    values = column.to_numpy()
+    narrow = values.astype(np.float32)
+    if np.array_equal(narrow.astype(values.dtype), values, equal_nan=True):
+        return pd.Series(narrow, index=column.index, name=column.name)
+    return column
+
+
+def _is_string_column(column: pd.Series) -> bool:
+    """Check whether every non-missing value of a column is a string."""
+    if pd.api.types.is_string_dtype(column.dtype) and column.dtype != object:
+        return True
+    values = column.dropna()
+    return len(values) > 0 and all(isinstance(value, str) for value in values)
+
+
+def _is_numeric_mapping_column(column: pd.Series) -> bool:
+    """Check whether every non-missing value of a column is a mapping of numbers."""
+    if column.dtype != object:
+        return False
+    values = column.dropna()
+    return len(values) > 0 and all(
+        isinstance(value, Mapping)
+        and all(isinstance(item, Number) and not isinstance(item, bool) for item in value.values())
+        for value in values
+    )
+
+
+def _expand_mappings(column: pd.Series) -> Dict[str, pd.Series]:
+    """Expand a column of numeric mappings into sparse columns keyed by mapping key."""
+    rows = [dict(value) if isinstance(value, Mapping) else {} for value in column]
+    expanded = pd.DataFrame.from_records(rows, index=column.index).fillna(0)
+    result = {}
+    for key in sorted(expanded.columns, key=str):
+        values = expanded[key]
+        if (values == np.round(values)).all():
+            values = pd.to_numeric(values.astype(np.int64), downcast="unsigned")
+        else:
+            values = _downcast_float(values)
+        result[str(key)] = values.astype(pd.SparseDtype(values.dtype, 0))
+    return result
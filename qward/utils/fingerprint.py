@@ -0,0 +1,167 @@
+"""
+Content fingerprints of circuits and targets for caching QWARD results.
+"""
+
+import hashlib
+from typing import Any, Dict
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.library import get_standard_gate_name_mapping
+from qiskit.transpiler import Target
+
+from qward.metrics.streaming import condition_clbits
+
+# Classes of the standard library operations, fully described by their name and parameters
+_STANDARD_TYPES: Dict[str, type] = {
+    name: type(operation) for name, operation in get_standard_gate_name_mapping().items()
+}
+
+
+def circuit_fingerprint(circuit: QuantumCircuit) -> str:
+    """
+    Compute a fingerprint of the structure of a circuit.
+
+    The fingerprint covers the registers (size, kind and bits), the global phase, every
+    instruction (operation name, parameters, bit indices, classical conditions, durations and
+    control-flow bodies), the definition of every operation that is not a standard library
+    gate (or its matrix for opaque gates), and the layout, calibrations and schedule of
+    transpiled circuits. It does not cover the names of the circuit and of its registers,
+    nor its metadata. Structurally identical circuits therefore share a fingerprint.
+
+    Args:
+        circuit: The quantum circuit
+
+    Returns:
+        str: Hex digest of the circuit structure
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _update_circuit(digest, circuit, {})
+    _update_transpilation(digest, circuit)
+    return digest.hexdigest()
+
+
+def target_fingerprint(target: Target) -> str:
+    """
+    Compute a fingerprint of a transpilation target.
+
+    Args:
+        target: The target (instructions, qubit properties, durations and errors)
+
+    Returns:
+        str: Hex digest of the target
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{target.num_qubits}|{target.dt}|{target.concurrent_measurements}".encode())
+    for name in sorted(target.operation_names):
+        properties = target[name]
+        entries = sorted(
+            (
+                repr(qargs),
+                repr(None if props is None else (props.duration, props.error)),
+            )
+            for qargs, props in properties.items()
+        )
+        digest.update(f"{name}:{entries}".encode())
+    return digest.hexdigest()
+
+
+def _update_circuit(digest: Any, circuit: QuantumCircuit, definitions: Dict[int, str]) -> None:
+    """Feed the structure of a circuit into a hash."""
+    qubit_index: Dict[Any, int] = {bit: i for i, bit in enumerate(circuit.qubits)}
+    clbit_index: Dict[Any, int] = {bit: i for i, bit in enumerate(circuit.clbits)}
+    update = digest.update
+    # Ancilla registers are told apart from regular ones by their type
+    qregs = [
+        (type(register).__name__, [qubit_index[bit] for bit in register])
+        for register in circuit.qregs
+    ]
+    update(
+        f"{circuit.num_qubits}|{circuit.num_clbits}|{circuit.global_phase}|{qregs}|"
+        f"{[[clbit_index[bit] for bit in register] for register in circuit.cregs]}".encode()
+    )
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qubits = [qubit_index[bit] for bit in instruction.qubits]
+        clbits = [clbit_index[bit] for bit in instruction.clbits]
+        blocks = getattr(operation, "blocks", ())
+        # The parameters of control-flow operations are their bodies, hashed below
+        params = "" if blocks else [_param_key(param) for param in operation.params]
+        update(f"{operation.name}|{params}|{qubits}|{clbits}".encode())
+        duration = getattr(operation, "_duration", None)
+        if duration is not None:
+            update(f"@{duration}{getattr(operation, '_unit', '')}".encode())
+        if not blocks and not getattr(operation, "_directive", False):
+            update(_operation_key(operation, definitions).encode())
+        condition = getattr(operation, "_condition", None)
+        condition_bits = condition_clbits(operation)
+        if condition_bits:
+            update(f"?{[clbit_index[bit] for bit in condition_bits]}=={condition[1]}".encode())
+        elif condition is not None:
+            update(f"?{condition}".encode())
+        for block in blocks:
+            update(b"{")
+            _update_circuit(digest, block, definitions)
+            update(b"}")
+
+
+def _operation_key(operation: Any, definitions: Dict[int, str]) -> str:
+    """
+    Represent what an operation does beyond its name and parameters.
+
+    Standard library operations are fully described by their name and parameters. Other
+    operations (custom gates, ``PauliEvolutionGate``, ...) may share a name while doing
+    different things, so their definition is fingerprinted recursively, or their matrix
+    for opaque gates. Keys are memoized per operation object within a fingerprint.
+    """
+    if type(operation) is _STANDARD_TYPES.get(operation.name):
+        return ""
+    key = definitions.get(id(operation))
+    if key is not None:
+        return key
+    definition = operation.definition if hasattr(operation, "definition") else None
+    digest = hashlib.blake2b(digest_size=16)
+    if definition is not None:
+        digest.update(b"definition")
+        _update_circuit(digest, definition, definitions)
+    else:
+        try:
+            matrix = operation.to_matrix()
+        except (AttributeError, CircuitError, TypeError):
+            digest.update(f"opaque:{type(operation).__qualname__}".encode())
+        else:
+            digest.update(f"matrix:{_param_key(np.asarray(matrix, dtype=complex))}".encode())
+    key = definitions[id(operation)] = f"#{digest.hexdigest()}"
+    return key
+
+
+def _update_transpilation(digest: Any, circuit: QuantumCircuit) -> None:
+    """Feed the layout, calibrations and schedule of a transpiled circuit into a hash."""
+    update = digest.update
+    layout = getattr(circuit, "_layout", None)
+    if layout is not None:
+        update(
+            f"layout|{layout.initial_index_layout(filter_ancillas=False)}|"
+            f"{layout.routing_permutation()}|{layout._input_qubit_count}".encode()
+        )
+    # Read the private attribute: ``QuantumCircuit.calibrations`` is deprecated
+    calibrations = getattr(circuit, "_calibrations", None)
+    if calibrations:
+        for name in sorted(calibrations):
+            entries = sorted(
+                (repr(key), repr(schedule)) for key, schedule in calibrations[name].items()
+            )
+            update(f"calibration|{name}|{entries}".encode())
+    start_times = getattr(circuit, "op_start_times", None)
+    if start_times is not None:
+        unit = getattr(circuit, "_unit", "dt")
+        update(f"schedule|{unit}|{getattr(circuit, '_duration', None)}|".encode())
+        update(np.asarray(start_times, dtype=np.float64).tobytes())
+
+
+def _param_key(param: Any) -> str:
+    """Represent an instruction parameter without truncation."""
+    if isinstance(param, np.ndarray):
+        return hashlib.blake2b(np.ascontiguousarray(param).tobytes(), digest_size=16).hexdigest()
+    return repr(param)
@@ -1,16 +1,63 @@
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Tuple
+
+# Markers delimiting nested dictionaries in a schema signature
+_OPEN = object()
+_CLOSE = object()
 
 
 def flatten_dict(d: Dict[str, Any], parent_key: str = "", sep: str = ".") -> Dict[str, Any]:
     """
-    Recursively flattens a nested dictionary using dot notation for keys.
+    Flattens a nested dictionary using dot notation for keys.
     Example: {'a': {'b': 1}} -> {'a.b': 1}
+
+    The dictionary is walked iteratively, collecting its leaf values and a signature of its
+    shape. Column names are computed once per distinct shape and cached, so flattening many
+    dictionaries with the same schema (e.g. metric results in a batch scan) only pays for
+    the walk.
     """
-    items = {}
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.update(flatten_dict(v, new_key, sep=sep))
+    signature, values = _walk(d)
+    return dict(zip(_column_names(signature, parent_key, sep), values))
+
+
+def _walk(d: Dict[str, Any]) -> Tuple[Tuple[Any, ...], List[Any]]:
+    """Collect the shape signature and the leaf values of a nested dictionary."""
+    signature: List[Any] = []
+    values: List[Any] = []
+    add_key = signature.append
+    add_value = values.append
+    stack = [iter(d.items())]
+    while stack:
+        for key, value in stack[-1]:
+            # Equal keys of different types (1, True, 1.0) give different column names
+            add_key((type(key), key))
+            if isinstance(value, dict):
+                add_key(_OPEN)
+                stack.append(iter(value.items()))
+                break
+            add_value(value)
         else:
-            items[new_key] = v
-    return items
+            stack.pop()
+            add_key(_CLOSE)
+    return tuple(signature), values
+
+
+@lru_cache(maxsize=1024)
+def _column_names(signature: Tuple[Hashable, ...], parent_key: str, sep: str) -> Tuple[Any, ...]:
+    """Compute the flattened column names of a shape signature."""
+    names: List[Any] = []
+    prefixes = [parent_key]
+    last = len(signature) - 1
+    for position, item in enumerate(signature):
+        if item is _CLOSE:
+            prefixes.pop()
+        elif item is not _OPEN:
+            prefix = prefixes[-1]
+            key = item[1]
+            name = f"{prefix}{sep}{key}" if prefix else key
+            if position < last and signature[position + 1] is _OPEN:
+                # Keys opening a nested dictionary are prefixes, not columns
+                prefixes.append(name)
+            else:
+                names.append(name)
+    return tuple(names)
@@ -0,0 +1,315 @@
+"""
+Tensored readout error mitigation for QWARD.
+
+Readout errors are modeled independently per classical bit by 2x2 assignment matrices
+``A[measured, prepared]``. Instead of inverting the dense ``2^n x 2^n`` tensor product, the
+calibration is applied on the subspace of observed outcomes only: the tensored matrix is
+evaluated between observed bitstrings with bit operations, its columns are renormalized
+within the subspace, and the resulting system is solved for quasi-probabilities (as in the
+matrix-free measurement mitigation method, M3).
+"""
+
+from functools import reduce
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+from scipy import sparse
+from scipy.sparse.linalg import LinearOperator, gmres
+
+from qward.utils.counts import decode_outcomes, encode_counts, merge_outcomes, normalize_key
+
+# Number of bits whose assignment matrices are combined into one lookup table
+_GROUP_BITS = 8
+
+# Number of matrix entries evaluated at a time when all pairs of outcomes are compared
+_BLOCK_ENTRIES = 2**20
+
+
+class TensoredReadoutMitigator:
+    """
+    Readout error mitigator built from per-bit assignment matrices.
+
+    Bit ``i`` of an outcome (the ``i``-th character from the right) is corrected with the
+    ``i``-th assignment matrix.
+    """
+
+    def __init__(
+        self,
+        assignment_matrices: Sequence[np.ndarray],
+        max_distance: Optional[int] = None,
+        dense_limit: int = 2048,
+    ):
+        """
+        Initialize a TensoredReadoutMitigator object.
+
+        Args:
+            assignment_matrices: One 2x2 matrix per classical bit, with entry ``[m, p]`` the
+                probability of measuring ``m`` when ``p`` was prepared
+            max_distance: Only couple observed outcomes within this Hamming distance (None
+                couples all of them)
+            dense_limit: Largest number of observed outcomes solved with a dense solver;
+                larger systems are solved iteratively, on a sparse matrix of the neighbouring
+                outcomes with ``max_distance`` and matrix-free (re-evaluating the entries in
+                row blocks at every product) without it, so memory stays linear in the number
+                of outcomes
+        """
+        matrices = [np.asarray(matrix, dtype=float) for matrix in assignment_matrices]
+        if any(matrix.shape != (2, 2) for matrix in matrices):
+            raise ValueError("Assignment matrices must be 2x2")
+        self._matrices = np.stack(matrices) if matrices else np.zeros((0, 2, 2))
+        self.max_distance = max_distance
+        self.dense_limit = dense_limit
+
+    @property
+    def num_bits(self) -> int:
+        """
+        Get the number of calibrated classical bits.
+
+        Returns:
+            int: The number of bits
+        """
+        return len(self._matrices)
+
+    @property
+    def assignment_matrices(self) -> List[np.ndarray]:
+        """
+        Get the per-bit assignment matrices.
+
+        Returns:
+            List[np.ndarray]: The 2x2 matrices, bit 0 first
+        """
+        return list(self._matrices)
+
+    @classmethod
+    def from_error_rates(
+        cls, prob_meas1_prep0: Sequence[float], prob_meas0_prep1: Sequence[float], **kwargs
+    ) -> "TensoredReadoutMitigator":
+        """
+        Build a mitigator from per-bit readout error probabilities.
+
+        Args:
+            prob_meas1_prep0: Probability of reading 1 after preparing 0, per bit
+            prob_meas0_prep1: Probability of reading 0 after preparing 1, per bit
+            **kwargs: Options of the mitigator
+
+        Returns:
+            TensoredReadoutMitigator: The mitigator
+        """
+        return cls(
+            [
+                np.array([[1 - p10, p01], [p10, 1 - p01]])
+                for p10, p01 in zip(prob_meas1_prep0, prob_meas0_prep1)
+            ],
+            **kwargs,
+        )
+
+    @staticmethod
+    def calibration_circuits(num_qubits: int) -> Tuple[QuantumCircuit, QuantumCircuit]:
+        """
+        Build the two circuits calibrating a tensored readout model.
+
+        Args:
+            num_qubits: Number of measured qubits
+
+        Returns:
+            Tuple[QuantumCircuit, QuantumCircuit]: Circuits preparing all zeros and all ones
+        """
+        zeros = QuantumCircuit(num_qubits, num_qubits, name="cal_zeros")
+        zeros.measure(range(num_qubits), range(num_qubits))
+        ones = QuantumCircuit(num_qubits, num_qubits, name="cal_ones")
+        ones.x(range(num_qubits))
+        ones.measure(range(num_qubits), range(num_qubits))
+        return zeros, ones
+
+    @classmethod
+    def from_calibration_counts(
+        cls, zeros_counts: Mapping[str, int], ones_counts: Mapping[str, int], **kwargs
+    ) -> "TensoredReadoutMitigator":
+        """
+        Build a mitigator from the counts of the calibration circuits.
+
+        Args:
+            zeros_counts: Counts of the circuit preparing all zeros
+            ones_counts: Counts of the circuit preparing all ones
+            **kwargs: Options of the mitigator
+
+        Returns:
+            TensoredReadoutMitigator: The mitigator
+        """
+        num_bits = max(len(normalize_key(key)) for key in zeros_counts)
+        return cls.from_error_rates(
+            _bit_frequencies(zeros_counts, num_bits, 1),
+            _bit_frequencies(ones_counts, num_bits, 0),
+            **kwargs,
+        )
+
+    def quasi_probabilities(self, counts: Mapping[str, float]) -> Dict[str, float]:
+        """
+        Mitigate counts into quasi-probabilities over the observed outcomes.
+
+        Args:
+            counts: The raw counts
+
+        Returns:
+            Dict[str, float]: Mitigated quasi-probabilities (summing to one, possibly with
+            small negative entries)
+
+        Raises:
+            ValueError: If the outcomes have more bits than the mitigator
+        """
+        outcomes, values = encode_counts(counts)
+        num_bits = max((len(normalize_key(key)) for key in counts), default=0)
+        if num_bits > self.num_bits:
+            raise ValueError(
+                f"Outcomes have {num_bits} bits but the mitigator calibrates {self.num_bits}"
+            )
+        outcomes, values = merge_outcomes(outcomes, values)
+        total = values.sum()
+        if total <= 0:
+            return {}
+        probabilities = values / total
+        quasi = self._solve(self._subspace_matrix(outcomes, num_bits), probabilities)
+        return dict(zip(decode_outcomes(outcomes, num_bits), quasi.tolist()))
+
+    def _subspace_matrix(
+        self, outcomes: np.ndarray, num_bits: int
+    ) -> Union[np.ndarray, sparse.csr_matrix, LinearOperator]:
+        """
+        Evaluate the tensored assignment matrix between the observed outcomes.
+
+        Columns are renormalized within the subspace so probability is conserved.
+
+        Args:
+            outcomes: The distinct encoded outcomes
+            num_bits: Number of bits of the outcomes
+
+        Returns:
+            Union[np.ndarray, sparse.csr_matrix, LinearOperator]: The (outcomes x outcomes)
+            matrix, dense up to ``dense_limit`` outcomes; beyond, CSR when only neighbouring
+            outcomes are coupled and a matrix-free operator otherwise
+        """
+        # Kronecker products of the matrices of up to 8 consecutive bits are tabulated, so
+        # each group of bits costs a single table lookup per matrix entry
+        groups = []
+        for start in range(0, num_bits, _GROUP_BITS):
+            stop = min(start + _GROUP_BITS, num_bits)
+            table = reduce(np.kron, self._matrices[start:stop][::-1])
+            mask = np.uint64((1 << (stop - start)) - 1)
+            groups.append((table, (outcomes >> np.uint64(start)) & mask))
+        size = len(outcomes)
+        dense = size <= self.dense_limit
+        max_distance = self.max_distance
+        if max_distance is not None and _num_flips(num_bits, max_distance) < size:
+            # Only the entries between neighbours are evaluated, found by flipping up to
+            # max_distance bits of every outcome
+            rows, columns = _neighbour_pairs(outcomes, num_bits, max_distance)
+            entries = np.ones(len(rows))
+            for table, values in groups:
+                entries *= table[values[rows], values[columns]]
+            matrix = sparse.csr_matrix((entries, (rows, columns)), shape=(size, size))
+            if dense:
+                matrix = matrix.toarray()
+        else:
+            # All pairs of outcomes are compared, by blocks of rows
+            block = max(1, min(size, _BLOCK_ENTRIES // max(size, 1)))
+            starts = range(0, size, block)
+
+            def row_block(start: int) -> np.ndarray:
+                rows = slice(start, start + block)
+                matrix = np.ones((min(block, size - start), size))
+                for table, values in groups:
+                    matrix *= table[values[rows, None], values[None, :]]
+                if max_distance is not None:
+                    distance = _popcount(outcomes[rows, None] ^ outcomes[None, :])
+                    matrix[distance > max_distance] = 0.0
+                return matrix
+
+            if dense:
+                matrix = np.vstack([row_block(start) for start in starts])
+            else:
+                # Storing all pairs would take quadratic memory (every entry is non-zero), so
+                # the blocks are re-evaluated at every product instead
+                column_sums = np.zeros(size)
+                for start in starts:
+                    column_sums += row_block(start).sum(axis=0)
+                scale = 1.0 / np.where(column_sums > 0, column_sums, 1.0)
+
+                def matvec(vector: np.ndarray) -> np.ndarray:
+                    scaled = np.ravel(vector) * scale
+                    product = np.empty(size)
+                    for start in starts:
+                        product[start : start + block] = row_block(start) @ scaled
+                    return product
+
+                return LinearOperator((size, size), matvec=matvec, dtype=float)
+        column_sums = np.asarray(matrix.sum(axis=0)).ravel()
+        scale = 1.0 / np.where(column_sums > 0, column_sums, 1.0)
+        return matrix * scale if dense else matrix @ sparse.diags(scale)
+
+    @staticmethod
+    def _solve(
+        matrix: Union[np.ndarray, sparse.csr_matrix, LinearOperator], probabilities: np.ndarray
+    ) -> np.ndarray:
+        """Solve the subspace system for the quasi-probabilities."""
+        if isinstance(matrix, np.ndarray):
+            quasi = np.linalg.solve(matrix, probabilities)
+        else:
+            # The matrix is close to the identity, so the raw probabilities are a good start
+            quasi, info = gmres(matrix, probabilities, x0=probabilities, atol=1e-10)
+            if info != 0:
+                raise ValueError("Readout mitigation did not converge")
+        return quasi / quasi.sum()
+
+
+def _bit_frequencies(counts: Mapping[str, int], num_bits: int, value: int) -> np.ndarray:
+    """Frequency with which each bit reads ``value`` in the given counts."""
+    outcomes, values = encode_counts(counts)
+    bits = (outcomes[:, None] >> np.arange(num_bits, dtype=np.uint64)) & np.uint64(1)
+    return values @ (bits == value).astype(float) / values.sum()
+
+
+def _num_flips(num_bits: int, max_distance: int) -> int:
+    """Number of bit flip patterns of up to ``max_distance`` of ``num_bits`` bits."""
+    return sum(comb(num_bits, weight) for weight in range(min(max_distance, num_bits) + 1))
+
+
+def _neighbour_pairs(
+    outcomes: np.ndarray, num_bits: int, max_distance: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the pairs of sorted outcomes within a Hamming distance.
+
+    Every outcome is XORed with every pattern of up to ``max_distance`` flipped bits and the
+    results are looked up among the outcomes with a binary search.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The positions of the outcomes of every pair
+    """
+    flips = np.array(
+        [
+            sum(1 << bit for bit in bits)
+            for weight in range(min(max_distance, num_bits) + 1)
+            for bits in combinations(range(num_bits), weight)
+        ],
+        dtype=np.uint64,
+    )
+    size = len(outcomes)
+    block = max(1, 2**22 // max(size, 1))
+    rows = []
+    columns = []
+    for start in range(0, len(flips), block):
+        neighbours = outcomes[:, None] ^ flips[None, start : start + block]
+        positions = np.minimum(np.searchsorted(outcomes, neighbours), size - 1)
+        found = outcomes[positions] == neighbours
+        rows.append(np.nonzero(found)[0])
+        columns.append(positions[found])
+    return np.concatenate(rows), np.concatenate(columns)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """Number of set bits of uint64 values."""
+    as_bytes = np.ascontiguousarray(values, dtype=np.uint64).view(np.uint8)
+    return np.unpackbits(as_bytes.reshape(values.shape + (8,)), axis=-1).sum(axis=-1)
@@ -0,0 +1,68 @@
+"""
+Conversion of metric values to plain data for storage.
+
+Metric values computed in memory may hold Qiskit objects (the ``CircuitInstruction`` lists of
+``QiskitMetrics`` instruction metrics, the ``TranspileLayout`` of scheduled circuits). The
+metrics store and the Parquet partitions of chunked scans only hold plain data, so values are
+converted explicitly with :func:`portable_value`:
+
+* NumPy scalars and arrays become Python numbers and lists, tuples become lists and mapping
+  keys become strings.
+* A ``CircuitInstruction`` becomes the name of its operation.
+* A ``TranspileLayout`` becomes a mapping with its ``initial_layout`` (physical qubit of every
+  virtual qubit, ancillas included), ``routing_permutation`` and ``input_qubit_count``.
+
+Any other object is refused with a TypeError instead of being stored as its ``repr``.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict
+
+import numpy as np
+from qiskit.circuit import CircuitInstruction
+from qiskit.transpiler import TranspileLayout
+
+
+def portable_value(value: Any) -> Any:
+    """
+    Convert a metric value to plain data.
+
+    Args:
+        value: The metric value
+
+    Returns:
+        Any: None, a bool, int, float or str, or lists and string-keyed dicts of them
+
+    Raises:
+        TypeError: If the value holds an object without a plain representation
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Mapping):
+        return {str(key): portable_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [portable_value(item) for item in value]
+    if isinstance(value, CircuitInstruction):
+        return value.operation.name
+    if isinstance(value, TranspileLayout):
+        return {
+            "initial_layout": value.initial_index_layout(filter_ancillas=False),
+            "routing_permutation": value.routing_permutation(),
+            "input_qubit_count": value._input_qubit_count,
+        }
+    raise TypeError(f"Cannot convert a {type(value).__name__} metric value to plain data")
+
+
+def portable_values(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert every value of a flat row to plain data.
+
+    Args:
+        values: Mapping from column names to metric values
+
+    Returns:
+        Dict[str, Any]: The converted row
+    """
+    return {column: portable_value(value) for column, value in values.items()}
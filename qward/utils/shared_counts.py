@@ -0,0 +1,337 @@
+"""
+Counts of many jobs in shared memory for parallel QWARD computations.
+
+The counts of all jobs are integer-encoded (see :func:`~qward.utils.counts.encode_counts`)
+and packed once into a single :mod:`multiprocessing.shared_memory` block as CSR-style
+arrays. Worker processes receive a small :class:`SharedCountsDescriptor` and map the block
+as NumPy arrays, so large-shot counts are never pickled.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from qward.metrics.distribution_distance import distribution_distances
+from qward.utils.counts import (
+    encode_counts,
+    marginalize_outcomes,
+    merge_outcomes,
+    normalize_key,
+    row_sums,
+)
+from qward.utils.statistics import bootstrap_success_rates
+
+
+class SharedCountsDescriptor(NamedTuple):
+    """Picklable handle of a shared counts block."""
+
+    name: str
+    num_rows: int
+    num_entries: int
+
+
+class SharedCounts:
+    """
+    Counts of many jobs packed into one shared memory block.
+
+    The block holds the row pointers (int64, one row per job), the encoded outcomes
+    (uint64) and their counts (float64). The process that packs the counts owns the block
+    and unlinks it on :meth:`close`; processes that attach to it only unmap it.
+    """
+
+    def __init__(self, distributions: Sequence[Mapping[str, float]]):
+        """
+        Pack counts mappings into a new shared memory block.
+
+        Args:
+            distributions: One counts mapping per job (at most 64 classical bits)
+        """
+        encoded = [encode_counts(counts) for counts in distributions]
+        lengths = np.array([len(outcomes) for outcomes, _ in encoded], dtype=np.int64)
+        num_entries = int(lengths.sum())
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=max(_block_size(len(encoded), num_entries), 1)
+        )
+        self._owner = True
+        self._descriptor = SharedCountsDescriptor(self._memory.name, len(encoded), num_entries)
+        self._map_arrays()
+        self.indptr[0] = 0
+        np.cumsum(lengths, out=self.indptr[1:])
+        if num_entries:
+            self.outcomes[:] = np.concatenate([outcomes for outcomes, _ in encoded])
+            self.values[:] = np.concatenate([values for _, values in encoded])
+
+    @classmethod
+    def attach(cls, descriptor: SharedCountsDescriptor) -> "SharedCounts":
+        """
+        Map an existing shared counts block without copying it.
+
+        Args:
+            descriptor: The descriptor of the block
+
+        Returns:
+            SharedCounts: A view of the block (closing it does not unlink the block)
+        """
+        counts = cls.__new__(cls)
+        counts._memory = shared_memory.SharedMemory(name=descriptor.name)
+        counts._owner = False
+        counts._descriptor = descriptor
+        counts._map_arrays()
+        return counts
+
+    def _map_arrays(self) -> None:
+        """Create the NumPy views of the block."""
+        num_rows, num_entries = self._descriptor.num_rows, self._descriptor.num_entries
+        buffer = self._memory.buf
+        offset = 0
+        self.indptr = np.ndarray((num_rows + 1,), dtype=np.int64, buffer=buffer, offset=offset)
+        offset += self.indptr.nbytes
+        self.outcomes = np.ndarray((num_entries,), dtype=np.uint64, buffer=buffer, offset=offset)
+        offset += self.outcomes.nbytes
+        self.values = np.ndarray((num_entries,), dtype=np.float64, buffer=buffer, offset=offset)
+
+    @property
+    def descriptor(self) -> SharedCountsDescriptor:
+        """
+        Get the picklable descriptor passed to worker processes.
+
+        Returns:
+            SharedCountsDescriptor: The descriptor
+        """
+        return self._descriptor
+
+    @property
+    def num_rows(self) -> int:
+        """
+        Get the number of jobs.
+
+        Returns:
+            int: The number of rows
+        """
+        return self._descriptor.num_rows
+
+    def row(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the counts of a job as views of the block.
+
+        Args:
+            index: The row of the job
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The encoded outcomes and their counts
+        """
+        start, stop = self.indptr[index], self.indptr[index + 1]
+        return self.outcomes[start:stop], self.values[start:stop]
+
+    def close(self) -> None:
+        """
+        Unmap the block, and unlink it if this object created it.
+        """
+        # The views must be released before the memory can be unmapped
+        self.indptr = self.outcomes = self.values = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+            self._owner = False
+
+    def __enter__(self) -> "SharedCounts":
+        """Use the counts as a context manager releasing the block on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Release the block."""
+        self.close()
+
+
+def _block_size(num_rows: int, num_entries: int) -> int:
+    """Get the size in bytes of a counts block."""
+    return 8 * (num_rows + 1) + 16 * num_entries
+
+
+def success_counts(
+    counts: SharedCounts,
+    expected: Sequence[str],
+    clbits: Optional[Sequence[int]] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count the successful shots of every job in parallel.
+
+    Args:
+        counts: The shared counts of the jobs
+        expected: The successful (marginal) outcomes as bitstrings
+        clbits: Classical bits onto which the outcomes are marginalized first
+        max_workers: Number of worker processes (None uses all CPUs, 1 runs in-process)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The successful shots and the total shots of every job
+    """
+    successful = np.array(sorted({int(normalize_key(key), 2) for key in expected}), np.uint64)
+    task = (_successes, successful, None if clbits is None else tuple(clbits))
+    results = _map_rows(counts, task, max_workers)
+    return (
+        np.concatenate([successes for successes, _ in results]),
+        np.concatenate([trials for _, trials in results]),
+    )
+
+
+def bootstrap_success_counts(
+    counts: SharedCounts,
+    expected: Sequence[str],
+    num_samples: int,
+    clbits: Optional[Sequence[int]] = None,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Bootstrap the success rates of every job in parallel.
+
+    Every worker counts the successes of a range of jobs. The resamples of every job are
+    drawn with its own child of a common :class:`numpy.random.SeedSequence`, so results only
+    depend on the seed, not on the number of workers or how the jobs are split among them.
+
+    Args:
+        counts: The shared counts of the jobs
+        expected: The successful (marginal) outcomes as bitstrings
+        num_samples: Number of bootstrap resamples
+        clbits: Classical bits onto which the outcomes are marginalized first
+        seed: Seed for the random number generator
+        max_workers: Number of worker processes (None uses all CPUs, 1 runs in-process)
+
+    Returns:
+        np.ndarray: Array of shape (num_samples, num_jobs) with resampled success rates
+    """
+    successful = np.array(sorted({int(normalize_key(key), 2) for key in expected}), np.uint64)
+    ranges = _row_ranges(counts.num_rows, max_workers)
+    seeds = np.random.SeedSequence(seed).spawn(counts.num_rows)
+    clbits = None if clbits is None else tuple(clbits)
+    tasks = [
+        (_bootstrap_task, successful, clbits, num_samples, seeds[start:stop])
+        for start, stop in ranges
+    ]
+    results = _map_rows(counts, tasks, max_workers, ranges)
+    return np.concatenate(results, axis=1) if results else np.empty((num_samples, 0))
+
+
+def shared_distribution_distances(
+    counts: SharedCounts,
+    reference: Mapping[str, float],
+    epsilon: float = 0.0,
+    max_workers: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the distances between every job and a reference distribution in parallel.
+
+    Args:
+        counts: The shared counts of the jobs
+        reference: The reference counts or probabilities
+        epsilon: Probability assigned to outcomes missing from a job in the KL divergence
+        max_workers: Number of worker processes (None uses all CPUs, 1 runs in-process)
+
+    Returns:
+        Dict[str, np.ndarray]: The arrays of
+        :func:`~qward.metrics.distribution_distance.distribution_distances`
+    """
+    outcomes, values = merge_outcomes(*encode_counts(reference))
+    total = values.sum()
+    probabilities = values / total if total > 0 else values
+    results = _map_rows(counts, (_distance_task, outcomes, probabilities, epsilon), max_workers)
+    return {name: np.concatenate([result[name] for result in results]) for name in results[0]}
+
+
+# Counts attached once per worker process
+_WORKER_COUNTS: Optional[SharedCounts] = None
+
+
+def _initialize_worker(descriptor: SharedCountsDescriptor) -> None:
+    """Attach the shared counts once per worker process instead of once per task."""
+    global _WORKER_COUNTS
+    _WORKER_COUNTS = SharedCounts.attach(descriptor)
+
+
+def _row_ranges(num_rows: int, max_workers: Optional[int]) -> List[Tuple[int, int]]:
+    """Split the rows into one contiguous range per task."""
+    num_tasks = 1 if max_workers == 1 else 4 * (max_workers or os.cpu_count() or 1)
+    bounds = np.linspace(0, num_rows, min(num_tasks, max(num_rows, 1)) + 1).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _map_rows(
+    counts: SharedCounts,
+    tasks: Any,
+    max_workers: Optional[int],
+    ranges: Optional[List[Tuple[int, int]]] = None,
+) -> List[Any]:
+    """Run a task (or one task per range) over row ranges, in-process or in workers."""
+    ranges = ranges if ranges is not None else _row_ranges(counts.num_rows, max_workers)
+    if isinstance(tasks, tuple):
+        tasks = [tasks] * len(ranges)
+    arguments = [(start, stop, task) for (start, stop), task in zip(ranges, tasks)]
+    if max_workers == 1 or len(arguments) <= 1:
+        return [_run_task(start, stop, task, counts) for start, stop, task in arguments]
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_initialize_worker, initargs=(counts.descriptor,)
+    ) as executor:
+        return list(executor.map(_run_task, *zip(*arguments)))
+
+
+def _run_task(
+    start: int,
+    stop: int,
+    task: Tuple[Callable[..., Any], ...],
+    counts: Optional[SharedCounts] = None,
+) -> Any:
+    """Run a task on the shared counts of rows ``start`` to ``stop``."""
+    counts = counts if counts is not None else _WORKER_COUNTS
+    function, *arguments = task
+    low, high = counts.indptr[start], counts.indptr[stop]
+    indptr = counts.indptr[start : stop + 1] - low
+    return function(counts.outcomes[low:high], counts.values[low:high], indptr, *arguments)
+
+
+def _successes(
+    outcomes: np.ndarray,
+    values: np.ndarray,
+    indptr: np.ndarray,
+    successful: np.ndarray,
+    clbits: Optional[Tuple[int, ...]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Count the successful and total shots of every row."""
+    if clbits is not None:
+        outcomes = marginalize_outcomes(outcomes, clbits)
+    hits = np.where(np.isin(outcomes, successful), values, 0.0)
+    return row_sums(hits, indptr), row_sums(values, indptr)
+
+
+def _bootstrap_task(outcomes, values, indptr, successful, clbits, num_samples, seed_sequences):
+    """Worker task of :func:`bootstrap_success_counts`, with one seed sequence per row."""
+    successes, trials = _successes(outcomes, values, indptr, successful, clbits)
+    trials = np.rint(trials)
+    samples = np.empty((num_samples, len(trials)))
+    for row, seed_sequence in enumerate(seed_sequences):
+        seed = int(seed_sequence.generate_state(1)[0])
+        samples[:, row] = bootstrap_success_rates(
+            successes[row : row + 1], trials[row : row + 1], num_samples, seed=seed
+        )[:, 0]
+    return samples
+
+
+def _distance_task(outcomes, values, indptr, reference, probabilities, epsilon):
+    """Worker task of :func:`shared_distribution_distances`."""
+    totals = row_sums(values, indptr)
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    normalized = values / np.where(totals > 0, totals, 1.0)[rows]
+    # Outcomes absent from the reference share an extra column of probability zero
+    positions = np.searchsorted(reference, outcomes)
+    found = positions < len(reference)
+    found[found] = reference[positions[found]] == outcomes[found]
+    columns = np.where(found, positions, len(reference))
+    matrix = sparse.csr_matrix(
+        (normalized, columns, indptr), shape=(len(indptr) - 1, len(reference) + 1)
+    )
+    reference_row = sparse.csr_matrix(np.append(probabilities, 0.0)[None, :])
+    return distribution_distances(reference_row, matrix, epsilon)
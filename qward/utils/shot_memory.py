@@ -0,0 +1,128 @@
+"""
+Packed-bit storage of per-shot measurement outcomes.
+
+Per-shot memory is stored as a 2-D ``uint8`` array with one row of ``ceil(num_bits / 8)``
+bytes per shot, where classical bit ``i`` is bit ``i % 8`` of byte ``i // 8``. Ten million
+shots of a 5-bit register take 10 MB instead of the ~600 MB of Python strings, and the
+array can live in a file mapped with :class:`numpy.memmap`.
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+from qward.utils.counts import normalize_key
+
+# Number of shots converted from strings at a time
+DEFAULT_PACK_CHUNK = 1 << 16
+
+
+def packed_width(num_bits: int) -> int:
+    """
+    Get the number of bytes per shot of a packed memory array.
+
+    Args:
+        num_bits: Number of classical bits per shot
+
+    Returns:
+        int: The row width in bytes
+    """
+    return max((num_bits + 7) // 8, 1)
+
+
+def pack_bitstrings(bitstrings: Sequence[str], num_bits: int) -> np.ndarray:
+    """
+    Pack bitstrings of equal width into rows of bits.
+
+    Args:
+        bitstrings: The per-shot outcomes (register separators are ignored)
+        num_bits: Number of classical bits per shot
+
+    Returns:
+        np.ndarray: Array of shape (shots, packed_width(num_bits)) with dtype uint8
+
+    Raises:
+        ValueError: If a bitstring does not have ``num_bits`` bits
+    """
+    if num_bits == 0:
+        return np.zeros((len(bitstrings), 1), dtype=np.uint8)
+    joined = "".join(normalize_key(bitstring) for bitstring in bitstrings).encode("ascii")
+    if len(joined) != len(bitstrings) * num_bits:
+        raise ValueError(f"Every shot must have {num_bits} bits")
+    bits = np.frombuffer(joined, dtype=np.uint8).reshape(len(bitstrings), num_bits) - ord("0")
+    # Bitstrings list the last classical bit first
+    return np.packbits(bits[:, ::-1], axis=1, bitorder="little")
+
+
+def pack_memory(
+    memory: Iterable[str],
+    num_bits: int,
+    path: Optional[str] = None,
+    chunk_size: int = DEFAULT_PACK_CHUNK,
+) -> np.ndarray:
+    """
+    Pack per-shot memory, chunk by chunk, into an array or a file.
+
+    Args:
+        memory: The per-shot outcomes, e.g. ``result.get_memory()`` or a generator
+        num_bits: Number of classical bits per shot
+        path: File receiving the packed rows (the array is kept in memory if None)
+        chunk_size: Number of shots converted at a time
+
+    Returns:
+        np.ndarray: The packed memory, memory-mapped read-only if a path was given
+    """
+    chunks = _chunks(iter(memory), chunk_size)
+    if path is None:
+        packed = [pack_bitstrings(chunk, num_bits) for chunk in chunks]
+        if not packed:
+            return np.zeros((0, packed_width(num_bits)), dtype=np.uint8)
+        return np.concatenate(packed)
+    with open(path, "wb") as file:
+        for chunk in chunks:
+            file.write(pack_bitstrings(chunk, num_bits).tobytes())
+    return open_packed_memory(path, num_bits)
+
+
+def open_packed_memory(path: str, num_bits: int) -> np.ndarray:
+    """
+    Map a packed memory file without reading it.
+
+    Args:
+        path: The file written by :func:`pack_memory`
+        num_bits: Number of classical bits per shot
+
+    Returns:
+        np.ndarray: Read-only memory map of shape (shots, packed_width(num_bits))
+    """
+    width = packed_width(num_bits)
+    with open(path, "rb") as file:
+        size = file.seek(0, 2)
+    if size == 0:
+        return np.zeros((0, width), dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r", shape=(size // width, width))
+
+
+def packed_bits(rows: np.ndarray, clbits: Sequence[int]) -> np.ndarray:
+    """
+    Extract classical bits from packed rows.
+
+    Args:
+        rows: Packed memory rows
+        clbits: The classical bits to extract
+
+    Returns:
+        np.ndarray: Array of shape (shots, len(clbits)) with 0/1 values
+    """
+    clbits = np.asarray(clbits, dtype=np.int64)
+    return (rows[:, clbits // 8] >> (clbits % 8).astype(np.uint8)) & 1
+
+
+def _chunks(iterator: Iterator[str], size: int) -> Iterator[list]:
+    """Split an iterator into lists of at most ``size`` items."""
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
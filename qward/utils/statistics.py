@@ -0,0 +1,113 @@
+"""
+Vectorized statistics helpers for QWARD metrics.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import stats
+
+
+def wilson_interval(
+    successes: np.ndarray, trials: np.ndarray, confidence_level: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Wilson score interval for binomial proportions.
+
+    Args:
+        successes: Number of successes per experiment
+        trials: Number of trials per experiment
+        confidence_level: Confidence level of the interval
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Lower and upper bounds (0 and 1 for zero trials)
+    """
+    successes = np.asarray(successes, dtype=float)
+    trials = np.asarray(trials, dtype=float)
+    z = stats.norm.ppf(0.5 + confidence_level / 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = successes / trials
+        denominator = 1 + z**2 / trials
+        center = (p + z**2 / (2 * trials)) / denominator
+        half_width = z / denominator * np.sqrt(p * (1 - p) / trials + z**2 / (4 * trials**2))
+    # The bounds are exact at the edges (and vacuous without trials)
+    low = np.where(successes <= 0, 0.0, np.clip(center - half_width, 0.0, 1.0))
+    high = np.where(successes >= trials, 1.0, np.clip(center + half_width, 0.0, 1.0))
+    return low, high
+
+
+def clopper_pearson_interval(
+    successes: np.ndarray, trials: np.ndarray, confidence_level: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Clopper-Pearson (exact) interval for binomial proportions.
+
+    Args:
+        successes: Number of successes per experiment
+        trials: Number of trials per experiment
+        confidence_level: Confidence level of the interval
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Lower and upper bounds (0 and 1 for zero trials)
+    """
+    successes = np.asarray(successes, dtype=float)
+    trials = np.asarray(trials, dtype=float)
+    alpha = 1 - confidence_level
+    with np.errstate(divide="ignore", invalid="ignore"):
+        low = stats.beta.ppf(alpha / 2, successes, trials - successes + 1)
+        high = stats.beta.ppf(1 - alpha / 2, successes + 1, trials - successes)
+    low = np.where(successes <= 0, 0.0, low)
+    high = np.where(successes >= trials, 1.0, high)
+    return np.nan_to_num(low, nan=0.0), np.nan_to_num(high, nan=1.0)
+
+
+def bootstrap_success_rates(
+    successes: np.ndarray,
+    trials: np.ndarray,
+    num_samples: int,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Bootstrap resamples of per-experiment success rates.
+
+    Resampling the shots of an experiment from its multinomial counts distribution and then
+    counting the successful outcomes is equivalent to drawing the number of successes from a
+    binomial distribution, so all experiments are resampled in one vectorized binomial draw
+    regardless of how many distinct outcomes they have.
+
+    Args:
+        successes: Number of successful shots per experiment
+        trials: Number of shots per experiment
+        num_samples: Number of bootstrap resamples
+        seed: Seed for the random number generator
+
+    Returns:
+        np.ndarray: Array of shape (num_samples, num_experiments) with resampled success
+        rates (NaN for experiments without shots)
+    """
+    successes = np.asarray(successes, dtype=float)
+    trials = np.asarray(trials, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = np.where(trials > 0, successes / np.maximum(trials, 1), 0.0)
+        draws = rng.binomial(trials, p, size=(num_samples, len(trials)))
+        return np.where(trials > 0, draws / trials, np.nan)
+
+
+def percentile_interval(
+    samples: np.ndarray, confidence_level: float = 0.95, axis: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Percentile interval of bootstrap samples.
+
+    Args:
+        samples: Bootstrap samples
+        confidence_level: Confidence level of the interval
+        axis: Axis along which the samples are stored
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Lower and upper bounds
+    """
+    alpha = 1 - confidence_level
+    low, high = np.nanquantile(samples, [alpha / 2, 1 - alpha / 2], axis=axis)
+    return low, high
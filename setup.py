@@ -90,6 +90,7 @@ setuptools.setup(
     install_requires=REQUIREMENTS,
     include_package_data=True,
     python_requires=">=3.9",
+    entry_points={"console_scripts": ["qward=qward.cli:main"]},
     project_urls={
         "Bug Tracker": "https://github.com/xthecapx/qiskit-qward/issues",
         "Documentation": "https://xthecapx.github.io/qiskit-qward/",
@@ -1,9 +1,121 @@
 """Tests for qward validators."""
 
-from unittest import TestCase
+import asyncio
+import importlib.util
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from functools import reduce
+from unittest import TestCase, mock, skipUnless
 
-from qiskit import QuantumCircuit
+import numpy as np
+import pandas as pd
+from qiskit import AncillaRegister, QuantumCircuit, QuantumRegister, qasm2, qpy, transpile
+from qiskit.circuit.library import PauliEvolutionGate
+from qiskit.circuit.random import random_circuit
+from qiskit.quantum_info import SparsePauliOp, average_gate_fidelity, hellinger_fidelity
+from qiskit_aer import AerSimulator
+from qiskit_aer.noise import NoiseModel, ReadoutError, depolarizing_error
+from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+from qward.cli import CsvRowWriter, ParquetRowWriter, main, scan_corpus
+from qward.metrics import (
+    CircuitStats,
+    ComplexityMetrics,
+    ComplexityMetricsRecord,
+    CriticalPath,
+    DistributionDistance,
+    DurationTable,
+    LayerProfile,
+    pairwise_distances,
+    PredictedSuccessRate,
+    QiskitMetrics,
+    ShotDrift,
+    SuccessRate,
+)
+from qward.runtime import LocalRuntimeService
+from qward.result import Result
 from qward.scanner import Scanner
+from qward import sweep
+from qward.store import MetricsStore
+from qward.sweep import TranspileCache
+from qward.utils.counts import marginal_distribution
+from qward.utils.dtypes import memory_report
+from qward.utils.flatten import flatten_dict
+from qward.utils.mitigation import TensoredReadoutMitigator
+from qward.utils.shot_memory import pack_memory
+from qward.utils.portable import portable_values
+from qward.utils.shared_counts import (
+    SharedCounts,
+    bootstrap_success_counts,
+    shared_distribution_distances,
+    success_counts,
+)
+from qward.utils.statistics import (
+    bootstrap_success_rates,
+    clopper_pearson_interval,
+    percentile_interval,
+    wilson_interval,
+)
+
+
+def _flatten_reference(d, parent_key="", sep="."):
+    """Flatten a nested dictionary recursively, as flatten_dict originally did."""
+    items = {}
+    for k, v in d.items():
+        new_key = f"{parent_key}{sep}{k}" if parent_key else k
+        if isinstance(v, dict):
+            items.update(_flatten_reference(v, new_key, sep=sep))
+        else:
+            items[new_key] = v
+    return items
+
+
+class _CountsJob:
+    """Minimal job returning fixed counts."""
+
+    def __init__(self, counts):
+        self._counts = counts
+
+    def result(self):
+        return self
+
+    def get_counts(self):
+        return self._counts
+
+
+class _IdentifiedJob(_CountsJob):
+    """Job with a job id, as returned by a runtime service."""
+
+    def __init__(self, job_id, counts):
+        super().__init__(counts)
+        self._job_id = job_id
+
+    def job_id(self):
+        return self._job_id
+
+
+class _SlowJob(_CountsJob):
+    """Job whose result takes a while, to observe concurrent scans."""
+
+    def result(self):
+        time.sleep(0.3)
+        return self
+
+
+class _BarrierJob(_CountsJob):
+    """Job whose result waits for the results of other jobs, to observe overlapping waits."""
+
+    def __init__(self, counts, barrier):
+        super().__init__(counts)
+        self._barrier = barrier
+        self.calls = 0
+
+    def result(self):
+        self.calls += 1
+        self._barrier.wait()
+        return self
 
 
 class TestScanner(TestCase):
@@ -18,3 +130,719 @@ class TestScanner(TestCase):
         self.assertIsNone(scanner.job)
         self.assertIsNone(scanner.result)
         self.assertEqual(scanner.metrics, [])
+
+    def test_calculate_metrics_async(self):
+        """Tests concurrent async scans overlap their job waits and match the sync results."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        # The barrier only opens if the three job waits run at the same time
+        barrier = threading.Barrier(3, timeout=10)
+        jobs = [_BarrierJob({"0": 9, "1": 1}, barrier) for _ in range(3)]
+        scanners = [
+            Scanner(
+                circuit=circuit,
+                metrics=[QiskitMetrics(circuit), SuccessRate(circuit, job=job)],
+            )
+            for job in jobs
+        ]
+
+        async def scan_all():
+            return await asyncio.gather(
+                *(scanner.calculate_metrics_async() for scanner in scanners)
+            )
+
+        results = asyncio.run(scan_all())
+        self.assertEqual([job.calls for job in jobs], [1, 1, 1])
+        expected = scanners[0].calculate_metrics()
+        self.assertEqual(list(results[0]), list(expected))
+        for name, frame in expected.items():
+            pd.testing.assert_frame_equal(results[2][name], frame)
+
+    def test_iter_metrics(self):
+        """Tests metrics are yielded as they finish and batch rows match the batch scan."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        scanner = Scanner(
+            circuit=circuit,
+            metrics=[
+                SuccessRate(circuit, job=_SlowJob({"0": 9, "1": 1})),
+                QiskitMetrics(circuit),
+            ],
+        )
+        frames = list(scanner.iter_metrics(max_workers=2))
+        expected = scanner.calculate_metrics()
+        self.assertEqual(frames[0][0], "QiskitMetrics")
+        self.assertEqual(sorted(name for name, _ in frames), sorted(expected))
+        for name, frame in frames:
+            pd.testing.assert_frame_equal(frame, expected[name])
+
+        circuits = [random_circuit(3, 3, seed=seed % 2) for seed in range(4)]
+        rows = Scanner.iter_batch(iter(circuits), names=(f"c{i}" for i in range(4)), cache_size=1)
+        streamed = pd.DataFrame([row for _, row in rows])
+        pd.testing.assert_frame_equal(
+            streamed, Scanner.scan_batch(circuits, names=[f"c{i}" for i in range(4)])
+        )
+        with self.assertRaisesRegex(ValueError, "circuit 3"):
+            list(Scanner.iter_batch(circuits, names=["a", "b", "c"]))
+
+    def test_calculate_metrics_compact(self):
+        """Tests compact DataFrames keep the values with smaller dtypes."""
+        circuit = QuantumCircuit(2, 2)
+        circuit.measure([0, 1], [0, 1])
+        jobs = [_CountsJob({"00": 90 + i % 5, "11": 10 - i % 5}) for i in range(50)]
+        scanner = Scanner(circuit=circuit, metrics=[SuccessRate(circuit, jobs=jobs)])
+        default = scanner.calculate_metrics()["SuccessRate.individual_jobs"]
+        frames = scanner.calculate_metrics(compact=True)
+        compact = frames["SuccessRate.individual_jobs"]
+
+        self.assertEqual(compact["total_shots"].dtype, np.uint8)
+        self.assertIsInstance(compact["average_counts.11"].dtype, pd.SparseDtype)
+        self.assertEqual(
+            compact["average_counts.11"].sparse.to_dense().tolist(),
+            [counts["11"] for counts in default["average_counts"]],
+        )
+        for column in ("success_rate", "successful_shots", "wilson_low"):
+            np.testing.assert_array_equal(compact[column], default[column])
+        report = memory_report(frames)
+        self.assertLess(report.loc["total", "ratio"], 1.0)
+
+
+class TestCircuitStats(TestCase):
+    """Tests streaming circuit statistics."""
+
+    def test_stats_match_circuit(self):
+        """Tests streamed statistics agree with the QuantumCircuit methods."""
+        circuit = random_circuit(5, 6, max_operands=3, measure=True, seed=7)
+        circuit.barrier()
+        circuit.cx(0, 4)
+        stats = CircuitStats.from_circuit(circuit)
+
+        self.assertEqual(stats.depth(), circuit.depth())
+        self.assertEqual(stats.size(), circuit.size())
+        self.assertEqual(stats.width(), circuit.width())
+        self.assertEqual(dict(stats.count_ops()), dict(circuit.count_ops()))
+        self.assertEqual(stats.num_nonlocal_gates(), circuit.num_nonlocal_gates())
+        self.assertEqual(stats.num_connected_components(), circuit.num_connected_components())
+        self.assertEqual(stats.num_unitary_factors(), circuit.num_unitary_factors())
+        self.assertEqual(
+            ComplexityMetrics(stats=stats).get_metrics(), ComplexityMetrics(circuit).get_metrics()
+        )
+
+    def test_stats_from_qasm(self):
+        """Tests statistics streamed from an OpenQASM file."""
+        circuit = QuantumCircuit(3, 3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.rz(0.5, 2)
+        circuit.measure(range(3), range(3))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "circuit.qasm")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(qasm2.dumps(circuit))
+            stats = CircuitStats.from_file(path)
+
+        self.assertEqual(stats.depth(), circuit.depth())
+        self.assertEqual(stats.width(), circuit.width())
+        self.assertEqual(dict(stats.count_ops()), dict(circuit.count_ops()))
+        self.assertEqual(stats.num_connected_components(), circuit.num_connected_components())
+
+    def test_incremental_metrics(self):
+        """Tests incremental metrics follow a circuit as it is extended."""
+        circuit = QuantumCircuit(3, 3)
+        complexity = ComplexityMetrics(circuit, incremental=True)
+        qiskit_metrics = QiskitMetrics(circuit, incremental=True)
+        for seed in range(3):
+            circuit.compose(random_circuit(3, 2, max_operands=2, seed=seed), inplace=True)
+            self.assertEqual(complexity.get_metrics(), ComplexityMetrics(circuit).get_metrics())
+            self.assertEqual(
+                qiskit_metrics.get_basic_metrics(), QiskitMetrics(circuit).get_basic_metrics()
+            )
+
+
+class TestQiskitMetrics(TestCase):
+    """Tests QiskitMetrics."""
+
+    def test_schedule_arrays(self):
+        """Tests the schedule summaries match the scheduled circuit."""
+        circuit = random_circuit(3, 5, measure=True, seed=4)
+        scheduled = transpile(circuit, FakeManilaV2(), scheduling_method="alap", seed_transpiler=1)
+        metrics = QiskitMetrics(scheduled)
+        schedule = metrics.get_schedule()
+        values = metrics.get_metrics()
+
+        self.assertIsNone(QiskitMetrics(circuit).get_schedule())
+        self.assertEqual(len(schedule.start_times), len(scheduled.data))
+        for qubit in range(scheduled.num_qubits):
+            self.assertAlmostEqual(schedule.qubit_duration[qubit], scheduled.qubit_duration(qubit))
+        self.assertEqual(values["scheduling_metrics.schedule_length"], schedule.length)
+        for qubit in schedule.active_qubits:
+            busy = values[f"scheduling_metrics.qubit_busy_fraction.{qubit}"]
+            idle = values[f"scheduling_metrics.qubit_idle_time.{qubit}"]
+            self.assertAlmostEqual(busy * schedule.length + idle, schedule.length)
+
+
+class TestMetricRecords(TestCase):
+    """Tests typed metric records."""
+
+    def test_record_views(self):
+        """Tests the dictionary and tabular views of a record agree."""
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+        metric = ComplexityMetrics(circuit)
+        record = metric.get_record()
+
+        self.assertEqual(len(record.to_tuple()), len(ComplexityMetricsRecord.columns()))
+        self.assertEqual(record.to_dict(), metric.get_metrics())
+        frame = Scanner(circuit=circuit, metrics=[metric]).calculate_metrics()["ComplexityMetrics"]
+        self.assertEqual(frame.loc[0, "quantum_volume.factors.square_ratio"], 0.75)
+        self.assertEqual(frame.loc[0, "quantum_volume.circuit_metrics.operation_counts.cx"], 1)
+
+
+class TestFlatten(TestCase):
+    """Tests flattening nested dictionaries."""
+
+    def test_flatten_dict(self):
+        """Tests the cached column names match the recursive flattening."""
+        nested = {"a": {"b": 1, "c": {"d": [2], "e": None}}, "f": 3.5, "g": {}}
+        for d, parent_key, sep in (
+            (nested, "", "."),
+            (nested, "", "/"),
+            (nested, "root", "__"),
+            ({}, "", "."),
+            ({"a": {}}, "", "."),
+            ({"a": {"b": {}}, "c": 1}, "", "."),
+            # Equal keys of different types must not share cached column names
+            ({1: {"x": 1}, 2: 2}, "", "."),
+            ({True: {"x": 1}, 2: 2}, "", "."),
+            ({1.0: {"x": 1}, 2: 2}, "", "."),
+            ({"m": {1: 1}}, "", "."),
+            ({"m": {True: 1}}, "", "."),
+            ({0: {"x": 1}, (1, 2): 3}, "", "-"),
+        ):
+            expected = _flatten_reference(d, parent_key, sep)
+            flat = flatten_dict(d, parent_key, sep)
+            self.assertEqual(
+                [(type(k), k, v) for k, v in flat.items()],
+                [(type(k), k, v) for k, v in expected.items()],
+            )
+
+
+class TestLocalRuntime(TestCase):
+    """Tests the offline runtime stand-in."""
+
+    def test_local_runtime_pipeline(self):
+        """Tests a local job goes through the run and watch pipeline."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.x(0)
+        circuit.measure(0, 0)
+        service = LocalRuntimeService(circuit, execution_latency=0.01, default_shots=100)
+        result = service.run_and_watch(polling_interval=0.005)
+
+        self.assertEqual(service.check_status(), "DONE")
+        self.assertEqual(result.counts, {"1": 100})
+
+    def test_local_runtime_failure_injection(self):
+        """Tests injected failures surface as failed jobs."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        service = LocalRuntimeService(circuit, failure_rate=1.0)
+
+        with self.assertRaises(RuntimeError):
+            service.run_and_watch(polling_interval=0.005)
+
+
+class TestStatistics(TestCase):
+    """Tests vectorized interval helpers."""
+
+    def test_intervals_contain_estimate(self):
+        """Tests the intervals bracket the observed success rate."""
+        successes = np.array([0, 37, 100])
+        trials = np.array([100, 100, 100])
+        for low, high in (
+            wilson_interval(successes, trials),
+            clopper_pearson_interval(successes, trials),
+            percentile_interval(bootstrap_success_rates(successes, trials, 2000, seed=3)),
+        ):
+            self.assertTrue(np.all(low <= successes / trials))
+            self.assertTrue(np.all(successes / trials <= high))
+        self.assertEqual(wilson_interval(successes, trials)[0][0], 0.0)
+        self.assertEqual(clopper_pearson_interval(successes, trials)[1][2], 1.0)
+
+
+class TestSuccessRate(TestCase):
+    """Tests success rate options."""
+
+    def test_runtime_jobs(self):
+        """Tests jobs are kept once per job id (or object), in insertion order."""
+        first = _IdentifiedJob("a", {"0": 1})
+        unnamed = _CountsJob({"1": 1})
+        metric = SuccessRate(None, jobs=[first, unnamed])
+        metric.add_job([_IdentifiedJob("b", {"0": 2}), _IdentifiedJob("a", {"1": 3}), unnamed])
+        metric.add_jobs(job for job in [_CountsJob({"0": 4}), first])
+
+        self.assertIs(metric.runtime_job, first)
+        self.assertEqual(
+            [job.get_counts() for job in metric.runtime_jobs],
+            [{"0": 1}, {"1": 1}, {"0": 2}, {"0": 4}],
+        )
+        metric.runtime_jobs = iter([unnamed, unnamed, first])
+        self.assertEqual(metric.runtime_jobs, [unnamed, first])
+        distances = DistributionDistance(None, jobs=[first, first], reference={"0": 1})
+        self.assertEqual(distances.runtime_jobs, [first])
+
+    def test_marginal_bit_error_rates(self):
+        """Tests marginalization and per-bit error rates against string slicing."""
+        counts = {"0101": 50, "0111": 30, "1101": 15, "0000": 5}
+        job = _CountsJob(counts)
+        metric = SuccessRate(None, job=job, clbits=[0, 3], expected_outcome="01")
+
+        record = metric.get_record().individual_jobs[0]
+        self.assertEqual(record.average_counts, {"01": 80, "11": 15, "00": 5})
+        self.assertEqual(record.successful_shots, 80)
+        self.assertAlmostEqual(record.bit_error_rates["0"], 0.05)
+        self.assertAlmostEqual(record.bit_error_rates["3"], 0.15)
+
+    def test_readout_mitigation(self):
+        """Tests mitigated success rates invert a known tensored readout model."""
+        mitigator = TensoredReadoutMitigator.from_error_rates([0.1, 0.02], [0.2, 0.05])
+        assignment = np.kron(*mitigator.assignment_matrices[::-1])
+        ideal = np.array([0.1, 0.6, 0.0, 0.3])
+        noisy = assignment @ ideal
+        counts = {format(i, "02b"): noisy[i] * 1e6 for i in range(4)}
+
+        quasi = mitigator.quasi_probabilities(counts)
+        self.assertTrue(np.allclose([quasi[format(i, "02b")] for i in range(4)], ideal))
+        metric = SuccessRate(None, job=_CountsJob(counts), mitigator=mitigator)
+        metric.success_criteria = lambda result: result == "01"
+        self.assertAlmostEqual(metric.get_record().individual_jobs[0].mitigated_success_rate, 0.6)
+
+        # With max_distance, only neighbouring outcomes are coupled
+        rng = np.random.default_rng(5)
+        mitigator = TensoredReadoutMitigator.from_error_rates(
+            rng.uniform(0, 0.1, 10), rng.uniform(0, 0.1, 10)
+        )
+        outcomes = np.sort(rng.choice(1024, 300, replace=False))
+        counts = {format(outcome, "010b"): rng.integers(1, 100) for outcome in outcomes}
+        assignment = reduce(np.kron, mitigator.assignment_matrices[::-1])[
+            np.ix_(outcomes, outcomes)
+        ]
+        distances = np.array([[bin(a ^ b).count("1") for b in outcomes] for a in outcomes])
+        assignment[distances > 1] = 0.0
+        assignment /= assignment.sum(axis=0)
+        probabilities = np.array(list(counts.values()), dtype=float)
+        expected = np.linalg.solve(assignment, probabilities / probabilities.sum())
+        for dense_limit in (2048, 0):
+            mitigator = TensoredReadoutMitigator(
+                mitigator.assignment_matrices, max_distance=1, dense_limit=dense_limit
+            )
+            quasi = mitigator.quasi_probabilities(counts)
+            self.assertTrue(np.allclose(list(quasi.values()), expected / expected.sum(), atol=1e-6))
+
+        # Beyond the dense limit, all pairs are coupled without storing the quadratic matrix
+        mitigator = TensoredReadoutMitigator.from_error_rates(
+            rng.uniform(0, 0.05, 12), rng.uniform(0, 0.05, 12)
+        )
+        outcomes = rng.choice(4096, 3000, replace=False)
+        counts = {format(outcome, "012b"): int(rng.integers(1, 50)) for outcome in outcomes}
+        tracemalloc.start()
+        quasi = mitigator.quasi_probabilities(counts)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        size = len(counts)
+        self.assertGreater(size, mitigator.dense_limit)
+        self.assertLess(peak, size * size * 8 / 2)
+        mitigator.dense_limit = size
+        expected = mitigator.quasi_probabilities(counts)
+        self.assertTrue(np.allclose(list(quasi.values()), list(expected.values()), atol=1e-6))
+
+
+class TestSharedCounts(TestCase):
+    """Tests parallel computations over shared memory counts."""
+
+    def test_workers_match_in_process(self):
+        """Tests worker processes read the shared counts and match the in-process results."""
+        rng = np.random.default_rng(3)
+        distributions = [
+            {
+                format(int(key), "05b"): int(count)
+                for key, count in zip(keys, rng.integers(1, 9, 12))
+            }
+            for keys in rng.integers(0, 32, (6, 12))
+        ]
+        reference = {"00000": 0.5, "11111": 0.5}
+        with SharedCounts(distributions) as counts:
+            successes, trials = success_counts(counts, ["01"], clbits=[0, 4], max_workers=2)
+            parallel = shared_distribution_distances(counts, reference, max_workers=2)
+            serial = shared_distribution_distances(counts, reference, max_workers=1)
+            samples = [
+                bootstrap_success_counts(counts, ["01"], 50, [0, 4], seed=1, max_workers=workers)
+                for workers in (1, 2, 3)
+            ]
+
+        # Bootstrap resamples depend on the seed only, not on the number of workers
+        for other in samples[1:]:
+            self.assertTrue(np.array_equal(other, samples[0]))
+        expected = [marginal_distribution(d, [0, 4]).get("01", 0) for d in distributions]
+        self.assertTrue(np.allclose(successes, expected))
+        self.assertTrue(np.allclose(trials, [sum(d.values()) for d in distributions]))
+        for name, values in serial.items():
+            self.assertTrue(np.allclose(parallel[name], values))
+
+
+class TestShotDrift(TestCase):
+    """Tests windowed success rates over packed per-shot memory."""
+
+    def test_drift_in_memory_mapped_shots(self):
+        """Tests a drop of the success rate is detected and a stationary job is not flagged."""
+        rng = np.random.default_rng(5)
+        circuit = QuantumCircuit(2, 2)
+        stationary = rng.random(40000) < 0.9
+        drifting = np.concatenate([stationary[:20000], rng.random(20000) < 0.8])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "memory.bin")
+            pack_memory(("01" if hit else "11" for hit in drifting), 2, path=path)
+            metric = ShotDrift(circuit, memory=path, expected_outcome="0", clbits=[1])
+            metric.chunk_size = 3000
+            drift = metric.get_record()
+            del metric
+
+        self.assertEqual((drift.num_shots, drift.num_windows), (40000, 40))
+        self.assertAlmostEqual(drift.success_rate, drifting.mean())
+        self.assertTrue(drift.drift_detected)
+        self.assertLess(drift.slope, 0)
+        memory = pack_memory(["00" if hit else "10" for hit in stationary], 2)
+        self.assertFalse(ShotDrift(circuit, memory=memory).get_record().drift_detected)
+        metric = ShotDrift(circuit, memory=pack_memory(["10"] * 5 + ["00"] * 5, 2), window=4)
+        self.assertTrue(np.array_equal(metric.get_window_counts()[0], [0, 3, 2]))
+
+
+class TestPredictedSuccessRate(TestCase):
+    """Tests success rates predicted from calibration data."""
+
+    def test_product_of_error_factors(self):
+        """Tests the prediction multiplies the gate and readout error factors."""
+        noise_model = NoiseModel(basis_gates=["h", "cx"])
+        noise_model.add_quantum_error(depolarizing_error(0.02, 2), "cx", [0, 1])
+        noise_model.add_readout_error(ReadoutError([[0.9, 0.1], [0.1, 0.9]]), [1])
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+
+        record = PredictedSuccessRate(circuit, noise_model=noise_model).get_record()
+        cx_error = 1 - average_gate_fidelity(depolarizing_error(0.02, 2))
+        self.assertAlmostEqual(record.gate_fidelity, (1 - cx_error) ** 2)
+        self.assertAlmostEqual(record.predicted_success_rate, (1 - cx_error) ** 2 * 0.9)
+        self.assertEqual(record.num_uncalibrated, 1)
+
+    def test_identity_uses_calibrated_error(self):
+        """Tests identity gates are charged the calibrated error of the device."""
+        backend = FakeManilaV2()
+        id_error = backend.target["id"][(0,)].error
+        circuit = QuantumCircuit(5)
+        circuit.id(0)
+        circuit.barrier()
+
+        record = PredictedSuccessRate(circuit, target=backend).get_record()
+        self.assertAlmostEqual(record.gate_fidelity, 1 - id_error)
+        self.assertEqual(record.num_instructions, 1)
+        noise_model = NoiseModel.from_backend(backend, thermal_relaxation=False)
+        record = PredictedSuccessRate(circuit, noise_model=noise_model).get_record()
+        self.assertAlmostEqual(record.gate_fidelity, 1 - id_error, places=6)
+
+
+class TestCriticalPath(TestCase):
+    """Tests the duration-weighted critical path."""
+
+    def test_matches_asap_schedule(self):
+        """Tests the critical path equals the length of the ASAP schedule of the circuit."""
+        backend = FakeManilaV2()
+        circuit = transpile(random_circuit(4, 8, measure=True, seed=2), backend, seed_transpiler=1)
+        scheduled = transpile(circuit, backend, scheduling_method="asap", optimization_level=0)
+
+        record = CriticalPath(circuit, target=backend).get_record()
+        schedule_length = QiskitMetrics(scheduled).get_schedule().length
+        self.assertAlmostEqual(record.critical_path_length_dt, schedule_length)
+        self.assertEqual(record.num_uncalibrated, 0)
+        self.assertIs(DurationTable.for_target(backend), DurationTable.for_target(backend.target))
+        with mock.patch("qward.metrics.critical_path.target_fingerprint") as fingerprint:
+            DurationTable.for_target(backend.target)
+        fingerprint.assert_not_called()
+
+        chain = QuantumCircuit(2)
+        chain.h(0)
+        chain.cx(0, 1)
+        chain.x(0)
+        durations = {"h": 1.0, "cx": 3.0, ("x", (0,)): 5.0}
+        record = CriticalPath(chain, durations=durations).get_record()
+        self.assertEqual(record.critical_path_length, 9.0)
+        self.assertEqual(record.num_critical_instructions, 3)
+        self.assertEqual(record.qubit_slack, {"0": 0.0, "1": 5.0})
+
+
+class TestLayerProfile(TestCase):
+    """Tests the per-layer circuit profile."""
+
+    def test_layers_match_depth(self):
+        """Tests the frontier sweep finds the layers of circuit.depth()."""
+        circuit = QuantumCircuit(3, 1)
+        circuit.h(0)
+        circuit.h(1)
+        circuit.cx(0, 1)
+        circuit.barrier(1, 2)
+        circuit.x(2)
+        circuit.measure(2, 0)
+        metric = LayerProfile(circuit)
+        # The barrier holds qubit 2 until the cx is done
+        np.testing.assert_array_equal(metric.get_layers(), [0, 0, 1, -1, 2, 3])
+        profile = metric.get_profile()
+        np.testing.assert_array_equal(profile["gate_counts"], [2, 1, 1, 1])
+        np.testing.assert_array_equal(profile["two_qubit_counts"], [0, 1, 0, 0])
+        np.testing.assert_array_equal(profile["active_qubits"], [2, 2, 1, 1])
+        self.assertEqual(metric.get_record().peak_two_qubit_layer, 1)
+
+        for seed in range(5):
+            circuit = random_circuit(5, 8, max_operands=3, measure=True, seed=seed)
+            circuit.barrier([0, 1])
+            circuit.cx(1, 4)
+            self.assertEqual(LayerProfile(circuit).get_record().num_layers, circuit.depth())
+
+
+class TestBatchScan(TestCase):
+    """Tests batch scanning."""
+
+    def test_scan_batch_dedup(self):
+        """Tests identical circuits are analyzed once and expanded to every row."""
+        circuits = [random_circuit(3, 4, measure=True, seed=seed % 2) for seed in range(5)]
+        for i, circuit in enumerate(circuits):
+            circuit.name = f"circuit_{i}"
+
+        deduplicated = Scanner.scan_batch(circuits)
+        full = Scanner.scan_batch(circuits, dedup=False)
+        self.assertEqual(deduplicated.attrs["num_unique"], 2)
+        self.assertAlmostEqual(deduplicated.attrs["dedup_ratio"], 0.6)
+        self.assertEqual(list(deduplicated["circuit"]), [c.name for c in circuits])
+        pd.testing.assert_frame_equal(deduplicated, full, check_like=True)
+
+    def test_scan_batch_dedup_registers_and_layout(self):
+        """Tests circuits differing only in register kind or layout are not deduplicated."""
+        regular = QuantumCircuit(QuantumRegister(1), QuantumRegister(1))
+        ancilla = QuantumCircuit(QuantumRegister(1), AncillaRegister(1))
+        for circuit in (regular, ancilla):
+            circuit.h(0)
+            circuit.cx(0, 1)
+        logical = QuantumCircuit(2)
+        logical.h([0, 1])
+        backend = FakeManilaV2()
+        placed = [
+            transpile(logical, backend, initial_layout=layout, optimization_level=0)
+            for layout in ([0, 1], [1, 0])
+        ]
+
+        frame = Scanner.scan_batch([regular, ancilla, *placed])
+        self.assertEqual(frame.attrs["num_unique"], 4)
+        self.assertEqual(list(frame["QiskitMetrics.basic_metrics.num_ancillas"][:2]), [0, 1])
+
+    def test_scan_batch_store_rescan(self):
+        """Tests rescans only compute changed circuits and stored values can be queried."""
+        circuits = [random_circuit(3, 4 + seed, measure=True, seed=seed) for seed in range(4)]
+        with MetricsStore() as store:
+            first = Scanner.scan_batch(circuits, store=store, backend="fake")
+            circuits[0] = random_circuit(3, 4, measure=True, seed=99)
+            second = Scanner.scan_batch(circuits, store=store, backend="fake")
+            deep = store.query("QiskitMetrics.basic_metrics.depth", ">=", 6, backend="fake")
+
+        self.assertEqual(first.attrs["num_computed"], 4)
+        self.assertEqual(second.attrs["num_computed"], 1)
+        depths = second.set_index("fingerprint")["QiskitMetrics.basic_metrics.depth"]
+        self.assertEqual(set(deep["fingerprint"]), set(depths[depths >= 6].index))
+
+    def test_store_round_trip(self):
+        """Tests rows read from the store equal the rows computed and stored."""
+        circuit = random_circuit(3, 3, measure=True, seed=5)
+        scheduled = transpile(circuit, FakeManilaV2(), scheduling_method="asap", seed_transpiler=1)
+        values = {"nan": float("nan"), "big": 2**70, "count": 7, "flag": True, "ops": {"h": 2}}
+        with MetricsStore() as store:
+            computed = Scanner.scan_batch([circuit, scheduled], store=store)
+            served = Scanner.scan_batch([circuit, scheduled], store=store)
+            store.put("fingerprint", "custom", values)
+            stored = store.get("fingerprint", "custom")
+            with self.assertRaises(TypeError):
+                store.put("fingerprint", "custom", {"object": object()})
+
+        self.assertEqual(served.attrs["num_computed"], 0)
+        pd.testing.assert_frame_equal(served, computed)
+        self.assertEqual(
+            computed["QiskitMetrics.scheduling_metrics.layout"][1]["input_qubit_count"], 3
+        )
+        self.assertTrue(np.isnan(stored.pop("nan")))
+        self.assertEqual(stored, {key: value for key, value in values.items() if key != "nan"})
+        self.assertIsInstance(stored["big"], int)
+
+    @skipUnless(importlib.util.find_spec("pyarrow"), "requires pyarrow")
+    def test_scan_batch_chunked(self):
+        """Tests a chunked scan spills partitions that read back as the in-memory scan."""
+        circuits = [random_circuit(3, 4, seed=seed) for seed in range(100)]
+        names = [f"c{i}" for i in range(100)]
+        with tempfile.TemporaryDirectory() as directory:
+            dataset = Scanner.scan_batch_chunked(
+                iter(circuits), directory, names=iter(names), memory_budget=20_000
+            )
+            self.assertGreater(len(dataset.partitions), 1)
+            self.assertEqual(len(dataset), 100)
+            expected = Scanner.scan_batch(circuits, names=names)
+            frame = dataset.to_pandas()
+            numeric = expected.columns[expected.dtypes != object]
+            pd.testing.assert_frame_equal(
+                frame[numeric], expected[numeric], check_dtype=False, check_index_type=False
+            )
+            # Object columns read back as plain data, e.g. instruction lists as operation names
+            rows = frame.to_dict("records")
+            for row, values in zip(rows, expected.to_dict("records")):
+                for column, value in portable_values(values).items():
+                    if isinstance(value, (list, dict)):
+                        self.assertEqual(row[column], value)
+            with self.assertRaises(ValueError):
+                Scanner.scan_batch_chunked(circuits, directory)
+
+
+class TestScanCommand(TestCase):
+    """Tests the qward scan command."""
+
+    def test_scan_corpus(self):
+        """Tests a corpus of QPY and OpenQASM files is streamed to CSV and NDJSON."""
+        circuits = [random_circuit(3, 4, measure=True, seed=seed) for seed in range(3)]
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "pair.qpy"), "wb") as file:
+                qpy.dump(circuits[:2], file)
+            os.mkdir(os.path.join(tmp, "qasm"))
+            with open(os.path.join(tmp, "qasm", "single.qasm"), "w") as file:
+                file.write(qasm2.dumps(circuits[2]))
+            with open(os.path.join(tmp, "qasm", "broken.qasm"), "w") as file:
+                file.write("not qasm")
+
+            csv_path = os.path.join(tmp, "metrics.csv")
+            status = main(["scan", tmp, "-o", csv_path, "--workers", "1", "--quiet"])
+            summary = scan_corpus([os.path.join(tmp, "**", "*.qasm")], csv_path + ".ndjson")
+            frame = pd.read_csv(csv_path)
+            rows = pd.read_json(csv_path + ".ndjson", lines=True)
+
+        self.assertEqual(status, 1)
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(list(frame["index"]), [0, 1, 0])
+        self.assertEqual(
+            list(frame["QiskitMetrics.basic_metrics.depth"]), [c.depth() for c in circuits]
+        )
+        self.assertEqual((summary["num_files"], summary["num_circuits"]), (2, 1))
+        self.assertEqual(summary["num_failed"], 1)
+        self.assertEqual(summary["num_columns"], len(rows.columns))
+        self.assertEqual(rows["fingerprint"][0], frame["fingerprint"][2])
+
+    def test_writers_keep_late_columns_and_widen_types(self):
+        """Tests columns added by later batches are kept and conflicting types are widened."""
+        batches = [
+            [{"name": "a", "depth": 1, "gate.x": None}],
+            [{"name": "b", "depth": 2.5, "gate.x": 3, "gate.cx": 1}],
+        ]
+        expected = pd.DataFrame(
+            {"name": ["a", "b"], "depth": [1.0, 2.5], "gate.x": [None, 3], "gate.cx": [None, 1]}
+        )
+        formats = [("csv", CsvRowWriter, pd.read_csv)]
+        if importlib.util.find_spec("pyarrow"):
+            formats.append(("parquet", ParquetRowWriter, pd.read_parquet))
+        with tempfile.TemporaryDirectory() as tmp:
+            for extension, writer_class, read in formats:
+                path = os.path.join(tmp, f"rows.{extension}")
+                writer = writer_class(path)
+                for rows in batches:
+                    writer.write(rows)
+                writer.close()
+                pd.testing.assert_frame_equal(
+                    read(path), expected, check_dtype=False, check_column_type=False
+                )
+                self.assertFalse([name for name in os.listdir(tmp) if name.endswith(".tmp")])
+
+
+class TestTranspileSweep(TestCase):
+    """Tests transpilation sweeps."""
+
+    def test_sweep_uses_cache(self):
+        """Tests one row per variant and cached transpilations on a repeated sweep."""
+        circuit = random_circuit(3, 4, measure=True, seed=8)
+        backend = FakeManilaV2()
+        cache = TranspileCache()
+        scanner = Scanner(circuit=circuit)
+
+        first = scanner.transpile_sweep(backend, [0, 2], seeds=[1, 2], max_workers=1, cache=cache)
+        second = scanner.transpile_sweep(backend, [0, 2], seeds=[1, 2], max_workers=1, cache=cache)
+        self.assertEqual(len(first), 4)
+        self.assertFalse(first["cached"].any())
+        self.assertTrue(second["cached"].all())
+        self.assertEqual(list(first["fingerprint"]), list(second["fingerprint"]))
+        self.assertIn("QiskitMetrics.basic_metrics.depth", first.columns)
+        # In-process sweeps pass the target explicitly instead of leaking it into the module
+        self.assertIsNone(sweep._WORKER_TARGET)
+
+    def test_cache_distinguishes_gate_definitions(self):
+        """Tests same-name gates with different definitions are not served from the cache."""
+        circuits = []
+        for pauli in ("XX", "ZZ"):
+            circuit = QuantumCircuit(2)
+            circuit.append(PauliEvolutionGate(SparsePauliOp(pauli), time=0.5), [0, 1])
+            circuits.append(circuit)
+        backend = FakeManilaV2()
+        cache = TranspileCache()
+
+        first = Scanner(circuit=circuits[0]).transpile_sweep(
+            backend, [1], seeds=[1], max_workers=1, cache=cache
+        )
+        second = Scanner(circuit=circuits[1]).transpile_sweep(
+            backend, [1], seeds=[1], max_workers=1, cache=cache
+        )
+        self.assertFalse(second["cached"].any())
+        self.assertNotEqual(first["fingerprint"][0], second["fingerprint"][0])
+
+
+class TestDistributionDistance(TestCase):
+    """Tests distances between job counts and a reference distribution."""
+
+    def test_distances_match_dense(self):
+        """Tests the sparse distances against dense definitions."""
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [1, 0])
+        job = AerSimulator().run(circuit, shots=1000, seed_simulator=11)
+        counts = job.result().get_counts()
+        reference = {"00": 0.5, "11": 0.5}
+        metric = DistributionDistance(circuit, job=job, reference=reference)
+
+        record = metric.get_record().individual_jobs[0]
+        total = sum(counts.values())
+        tvd = 0.5 * sum(
+            abs(reference.get(key, 0) - counts.get(key, 0) / total)
+            for key in set(reference) | set(counts)
+        )
+        self.assertAlmostEqual(record.tvd, tvd)
+        self.assertAlmostEqual(record.hellinger_fidelity, hellinger_fidelity(reference, counts))
+        self.assertEqual(metric.get_reference_distribution(), reference)
+
+    def test_pairwise_distances(self):
+        """Tests the pairwise matrix against direct comparisons."""
+        rng = np.random.default_rng(5)
+        counts = [
+            {format(key, "04b"): int(rng.integers(1, 20)) for key in rng.choice(16, 6)}
+            for _ in range(5)
+        ]
+        tvd = pairwise_distances(counts, "tvd", block_size=2, column_block=3)
+        fidelity = pairwise_distances(counts, "hellinger_fidelity")
+        for i in range(5):
+            for j in range(5):
+                metric = DistributionDistance(None, reference=counts[i])
+                metric.add_job(Result(counts=counts[j]))
+                record = metric.get_record().individual_jobs[0]
+                self.assertAlmostEqual(tvd[i, j], record.tvd)
+                self.assertAlmostEqual(fidelity[i, j], record.hellinger_fidelity)